@@ -145,4 +145,25 @@ const evocore_config_entry_t* evocore_config_get_entry(const evocore_config_t *c
                                                     const char *section,
                                                     size_t index);
 
+/**
+ * Get all entries in a section at once
+ *
+ * Fills parallel arrays with up to capacity entries, in the same order
+ * as evocore_config_get_entry(). Returned strings are owned by config.
+ *
+ * @param config      Configuration object
+ * @param section     Section name (NULL for global)
+ * @param out_keys    Output: entry keys
+ * @param out_values  Output: entry values
+ * @param out_types   Output: entry types (evocore_config_type_t), or NULL
+ * @param capacity    Size of the output arrays
+ * @return Number of entries written
+ */
+size_t evocore_config_get_section_bulk(const evocore_config_t *config,
+                                       const char *section,
+                                       const char **out_keys,
+                                       const char **out_values,
+                                       int *out_types,
+                                       size_t capacity);
+
 #endif /* EVOCORE_CONFIG_H */
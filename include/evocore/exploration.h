@@ -19,6 +19,7 @@
 #define EVOCORE_EXPLORATION_H
 
 #include <stddef.h>
+#include <stdint.h>
 #include <stdbool.h>
 #include <time.h>
 
@@ -68,6 +69,8 @@ typedef struct {
  * Bandit arm for UCB1
  *
  * Tracks statistics for a single option (e.g., parameter setting).
+ * The bandit no longer stores arms in this form; use
+ * evocore_bandit_get_arm() to obtain a snapshot of one arm.
  */
 typedef struct {
     size_t count;               /* Number of times selected */
@@ -78,13 +81,24 @@ typedef struct {
 /**
  * Multi-armed bandit
  *
- * Tracks multiple options with UCB1 selection.
+ * Tracks multiple options with UCB1 selection. Per-arm statistics are
+ * stored as parallel arrays (structure of arrays) so selection scans
+ * only the fields it needs.
+ *
+ * @note The layout of this struct changed: the former `arms` array of
+ * evocore_bandit_arm_t was replaced by the parallel arrays below. Code
+ * that read `bandit->arms[i]` should call evocore_bandit_get_arm() or
+ * evocore_bandit_get_stats() instead.
  */
 typedef struct {
-    evocore_bandit_arm_t *arms; /* Array of bandit arms */
+    size_t *counts;             /* Times each arm was selected */
+    double *total_rewards;      /* Cumulative reward per arm */
+    double *mean_rewards;       /* Average reward per arm */
+    double *arm_radius;         /* Cached 1/sqrt(count) per arm (0 if unpulled) */
     size_t count;               /* Number of arms */
     size_t total_pulls;         /* Total selections across all arms */
     double ucb_c;               /* Exploration constant */
+    double ucb_scale;           /* Cached ucb_c * sqrt(ln(total_pulls)) */
 } evocore_bandit_t;
 
 /*========================================================================
@@ -209,6 +223,49 @@ bool evocore_exploration_should_explore(
     unsigned int *seed
 );
 
+/**
+ * Make several explore decisions at once
+ *
+ * Equivalent to calling evocore_exploration_should_explore() n times
+ * with the same seed pointer. As there, a rate of 0 or 1 decides every
+ * flag without drawing, leaving *seed unchanged.
+ *
+ * @param exp Exploration controller
+ * @param out_flags Output: n flags (1 = explore, 0 = exploit)
+ * @param n Number of decisions
+ * @param seed Random seed pointer (advanced n times, or left unchanged
+ *             when the rate is 0 or 1)
+ * @return Number of explore decisions
+ */
+size_t evocore_exploration_should_explore_batch(
+    const evocore_exploration_t *exp,
+    uint8_t *out_flags,
+    size_t n,
+    unsigned int *seed
+);
+
+/**
+ * Make several explore decisions packed as bits
+ *
+ * Decision i is bit (i % 64) of out_words[i / 64]; bits past n are
+ * cleared. Uses a 64-bit SplitMix stream seeded from *seed and compares
+ * draws against rate * 2^64 without branching, so the decisions differ
+ * from evocore_exploration_should_explore_batch() for the same seed.
+ *
+ * @param exp Exploration controller
+ * @param out_words Output: (n + 63) / 64 words
+ * @param n Number of decisions
+ * @param seed Random seed pointer (updated for the next call; left
+ *             unchanged when the rate is 0 or 1)
+ * @return Number of explore decisions
+ */
+size_t evocore_exploration_should_explore_packed(
+    const evocore_exploration_t *exp,
+    uint64_t *out_words,
+    size_t n,
+    unsigned int *seed
+);
+
 /*========================================================================
  * Bandit Selection (UCB1)
  *========================================================================*/
@@ -239,6 +296,18 @@ void evocore_bandit_free(evocore_bandit_t *bandit);
  */
 size_t evocore_bandit_select_ucb(const evocore_bandit_t *bandit);
 
+/**
+ * Select arm using cached UCB1 terms
+ *
+ * Same policy as evocore_bandit_select_ucb(), but uses the per-arm
+ * 1/sqrt(count) and the shared c*sqrt(ln N) factor maintained by
+ * evocore_bandit_update(), so the scan needs no log() or sqrt() calls.
+ *
+ * @param bandit Bandit
+ * @return Index of selected arm
+ */
+size_t evocore_bandit_select_ucb_cached(const evocore_bandit_t *bandit);
+
 /**
  * Update arm with reward
  *
@@ -250,6 +319,42 @@ size_t evocore_bandit_select_ucb(const evocore_bandit_t *bandit);
  */
 void evocore_bandit_update(evocore_bandit_t *bandit, size_t arm, double reward);
 
+/**
+ * Select a batch of arms using UCB1
+ *
+ * Each selection is counted as a pending pull (mean unchanged) for the
+ * rest of the batch, so arms are spread as in batched UCB. The bandit
+ * itself is not modified.
+ *
+ * @param bandit Bandit
+ * @param out_arms Output: n selected arm indices
+ * @param n Number of arms to select
+ * @return Number of arms written (0 on error)
+ */
+size_t evocore_bandit_select_ucb_batch(
+    const evocore_bandit_t *bandit,
+    size_t *out_arms,
+    size_t n
+);
+
+/**
+ * Update several arms with rewards
+ *
+ * Equivalent to calling evocore_bandit_update() for each pair in order.
+ * Out-of-range arm indices are ignored.
+ *
+ * @param bandit Bandit
+ * @param arms Arm indices
+ * @param rewards Observed rewards
+ * @param n Number of (arm, reward) pairs
+ */
+void evocore_bandit_update_batch(
+    evocore_bandit_t *bandit,
+    const size_t *arms,
+    const double *rewards,
+    size_t n
+);
+
 /**
  * Get arm count
  *
@@ -274,6 +379,22 @@ bool evocore_bandit_get_stats(
     double *out_mean
 );
 
+/**
+ * Get a snapshot of one arm
+ *
+ * Gathers the arm's statistics from the bandit's parallel arrays.
+ *
+ * @param bandit Bandit
+ * @param arm Index of arm
+ * @param out Output: arm statistics
+ * @return true on success
+ */
+bool evocore_bandit_get_arm(
+    const evocore_bandit_t *bandit,
+    size_t arm,
+    evocore_bandit_arm_t *out
+);
+
 /**
  * Reset bandit
  *
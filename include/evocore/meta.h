@@ -221,6 +221,25 @@ void evocore_meta_params_mutate(evocore_meta_params_t *params,
 void evocore_meta_params_clone(const evocore_meta_params_t *src,
                               evocore_meta_params_t *dst);
 
+/**
+ * Allocate a block for one evocore_meta_params_t
+ *
+ * Blocks are recycled through a small thread-safe freelist, which makes
+ * repeated single-struct allocations from language bindings cheap.
+ * Memory is not cleared.
+ *
+ * @param size      Requested size in bytes
+ * @return Block of at least size bytes, or NULL on failure
+ */
+void* evocore_meta_params_alloc(size_t size);
+
+/**
+ * Release a block from evocore_meta_params_alloc()
+ *
+ * @param ptr       Block to release (may be NULL)
+ */
+void evocore_meta_params_free(void *ptr);
+
 /*========================================================================
  * Meta-Individual Management
  *========================================================================*/
@@ -318,6 +337,23 @@ evocore_meta_individual_t* evocore_meta_population_best(evocore_meta_population_
 evocore_error_t evocore_meta_population_evolve(evocore_meta_population_t *meta_pop,
                                             unsigned int *seed);
 
+/**
+ * Evolve meta-population using multiple threads
+ *
+ * Same selection as evocore_meta_population_evolve(), but children are
+ * bred in parallel when built with OpenMP. Each child uses its own RNG
+ * stream derived from the seed, so results are identical for any thread
+ * count (but differ from the serial function for the same seed).
+ *
+ * @param meta_pop      Meta-population to evolve
+ * @param seed          Random seed pointer (NULL to use current time)
+ * @param num_threads   Number of threads (0 = OpenMP default)
+ * @return EVOCORE_OK on success, error code otherwise
+ */
+evocore_error_t evocore_meta_population_evolve_parallel(evocore_meta_population_t *meta_pop,
+                                                     unsigned int *seed,
+                                                     int num_threads);
+
 /**
  * Sort meta-population by fitness (best first)
  *
@@ -340,6 +376,21 @@ bool evocore_meta_population_converged(const evocore_meta_population_t *meta_pop
                                       double threshold,
                                       int generations);
 
+/**
+ * Snapshot per-individual fitness summaries
+ *
+ * Writes one (meta_fitness, generation, average_fitness) triple per
+ * individual into a flat array, in population order.
+ *
+ * @param meta_pop          Meta-population to read
+ * @param out               Output array of at least 3 * max_individuals doubles
+ * @param max_individuals   Maximum number of individuals to write
+ * @return Number of individuals written
+ */
+size_t evocore_meta_population_snapshot(const evocore_meta_population_t *meta_pop,
+                                        double *out,
+                                        size_t max_individuals);
+
 /*========================================================================
  * Adaptive Parameter Adjustment
  *========================================================================*/
@@ -409,6 +460,27 @@ double evocore_meta_evaluate(const evocore_meta_params_t *params,
                             double diversity,
                             int generations);
 
+/**
+ * Evaluate meta-fitness for many parameter sets in one call
+ *
+ * Equivalent to calling evocore_meta_evaluate() for each index.
+ *
+ * @param params            Array of count parameter set pointers
+ * @param count             Number of parameter sets
+ * @param best_fitness      Best fitness per parameter set
+ * @param avg_fitness       Average fitness per parameter set
+ * @param diversity         Population diversity per parameter set
+ * @param generations       Generations run per parameter set
+ * @param out_meta_fitness  Output: meta-fitness per parameter set
+ */
+void evocore_meta_evaluate_many(const evocore_meta_params_t *const *params,
+                               size_t count,
+                               const double *best_fitness,
+                               const double *avg_fitness,
+                               const double *diversity,
+                               const int *generations,
+                               double *out_meta_fitness);
+
 /*========================================================================
  * Utility Functions
  *========================================================================*/
@@ -292,6 +292,22 @@ evocore_error_t evocore_checkpoint_save(const evocore_checkpoint_t *checkpoint,
 evocore_error_t evocore_checkpoint_load(const char *filepath,
                                     evocore_checkpoint_t *checkpoint);
 
+/**
+ * Load only checkpoint metadata from file
+ *
+ * Reads just the leading header (version, timestamp, domain, generation,
+ * best fitness) without reading population or meta-population data.
+ * If the header does not end within the first 1 KiB, the whole file is
+ * read as by evocore_checkpoint_load(). Pointer fields of the
+ * checkpoint are left NULL.
+ *
+ * @param filepath      Input file path
+ * @param checkpoint    Checkpoint to fill
+ * @return EVOCORE_OK on success, error code otherwise
+ */
+evocore_error_t evocore_checkpoint_peek(const char *filepath,
+                                    evocore_checkpoint_t *checkpoint);
+
 /**
  * Restore state from checkpoint
  *
@@ -393,6 +409,27 @@ char** evocore_checkpoint_list(const char *directory, int *count);
  */
 void evocore_checkpoint_list_free(char **list, int count);
 
+/**
+ * List available checkpoints as one packed buffer
+ *
+ * Entries are full paths, each terminated by '\0', stored back to back.
+ *
+ * @param directory     Checkpoint directory
+ * @param out_len       Output: total buffer length in bytes
+ * @param out_count     Output: number of checkpoints found
+ * @return Packed path buffer (free with evocore_checkpoint_list_packed_free),
+ *         or NULL if none were found
+ */
+char* evocore_checkpoint_list_packed(const char *directory, size_t *out_len,
+                                     int *out_count);
+
+/**
+ * Free packed checkpoint list
+ *
+ * @param packed        Buffer from checkpoint_list_packed
+ */
+void evocore_checkpoint_list_packed_free(char *packed);
+
 /**
  * Get checkpoint info from file
  *
@@ -410,6 +447,9 @@ evocore_error_t evocore_checkpoint_info(const char *filepath,
 /**
  * Calculate checksum of data
  *
+ * CRC-32 (IEEE 802.3, same as zlib's crc32). Uses PCLMULQDQ folding on
+ * x86-64 CPUs that support it, slicing-by-8 tables otherwise.
+ *
  * @param data          Data buffer
  * @param size          Data size
  * @return 32-bit checksum
@@ -76,6 +76,16 @@ typedef struct {
     bool track_timing;
 } evocore_stats_config_t;
 
+/**
+ * Population fitness distribution
+ */
+typedef struct {
+    double min;
+    double max;
+    double mean;
+    double stddev;
+} evocore_fitness_dist_t;
+
 /**
  * Default statistics configuration
  */
@@ -116,6 +126,21 @@ void evocore_stats_free(evocore_stats_t *stats);
 evocore_error_t evocore_stats_update(evocore_stats_t *stats,
                                 const evocore_population_t *pop);
 
+/**
+ * Update statistics from several populations in one call
+ *
+ * Equivalent to calling evocore_stats_update() for each population in
+ * order (e.g. once per island). Stops at the first failure.
+ *
+ * @param stats    Statistics to update
+ * @param pops     Array of populations
+ * @param count    Number of populations
+ * @return EVOCORE_OK on success, error code otherwise
+ */
+evocore_error_t evocore_stats_update_batch(evocore_stats_t *stats,
+                                      const evocore_population_t *const *pops,
+                                      size_t count);
+
 /**
  * Update statistics after operations
  *
@@ -170,6 +195,16 @@ evocore_error_t evocore_stats_fitness_distribution(const evocore_population_t *p
                                              double *out_mean,
                                              double *out_stddev);
 
+/**
+ * Get fitness statistics for population into a single struct
+ *
+ * @param pop            Population to analyze
+ * @param out            Output: fitness distribution
+ * @return EVOCORE_OK on success, error code otherwise
+ */
+evocore_error_t evocore_stats_fitness_dist(const evocore_population_t *pop,
+                                           evocore_fitness_dist_t *out);
+
 /*========================================================================
  * Progress Reporting
  *========================================================================*/
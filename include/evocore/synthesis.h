@@ -278,6 +278,18 @@ evocore_similarity_matrix_t* evocore_similarity_matrix_create(
  */
 void evocore_similarity_matrix_free(evocore_similarity_matrix_t *matrix);
 
+/**
+ * Get contiguous similarity data
+ *
+ * Rows of the matrix are stored back to back, so the returned pointer
+ * addresses context_count * context_count doubles in row-major order.
+ * Valid until the matrix is freed.
+ *
+ * @param matrix Similarity matrix
+ * @return Pointer to the first row, or NULL
+ */
+double* evocore_similarity_matrix_data(evocore_similarity_matrix_t *matrix);
+
 /**
  * Update similarity between contexts
  *
@@ -320,10 +332,56 @@ const char* evocore_similarity_find_nearest(
     const char *target_context
 );
 
+/**
+ * Update similarity between contexts by index
+ *
+ * Index-based variant of evocore_similarity_update() for callers that
+ * resolve context IDs once. The matrix is kept symmetric.
+ *
+ * @param matrix Similarity matrix
+ * @param index_a Index of first context
+ * @param index_b Index of second context
+ * @param similarity Similarity score (0-1)
+ * @return true on success, false if an index is out of range
+ */
+bool evocore_similarity_update_idx(
+    evocore_similarity_matrix_t *matrix,
+    size_t index_a,
+    size_t index_b,
+    double similarity
+);
+
+/**
+ * Get similarity between contexts by index
+ *
+ * @param matrix Similarity matrix
+ * @param index_a Index of first context
+ * @param index_b Index of second context
+ * @return Similarity score (0-1), or 0 if an index is out of range
+ */
+double evocore_similarity_get_idx(
+    const evocore_similarity_matrix_t *matrix,
+    size_t index_a,
+    size_t index_b
+);
+
+/**
+ * Find most similar context by index
+ *
+ * @param matrix Similarity matrix
+ * @param target_index Index of context to match
+ * @return Index of most similar other context, or SIZE_MAX if none
+ */
+size_t evocore_similarity_find_nearest_idx(
+    const evocore_similarity_matrix_t *matrix,
+    size_t target_index
+);
+
 /**
  * Calculate parameter distance
  *
  * Computes Euclidean distance between two parameter vectors.
+ * Uses AVX2/AVX-512 kernels when the CPU supports them.
  *
  * @param params1 First parameter vector
  * @param params2 Second parameter vector
@@ -336,6 +394,20 @@ double evocore_param_distance(
     size_t count
 );
 
+/**
+ * Calculate parameter distance for fixed vector lengths
+ *
+ * Fully unrolled variants of evocore_param_distance() for 4, 8 and 16
+ * parameters. Use AVX2/FMA when the CPU supports it.
+ *
+ * @param params1 First parameter vector
+ * @param params2 Second parameter vector
+ * @return Euclidean distance
+ */
+double evocore_param_distance_4(const double *params1, const double *params2);
+double evocore_param_distance_8(const double *params1, const double *params2);
+double evocore_param_distance_16(const double *params1, const double *params2);
+
 /**
  * Calculate parameter similarity
  *
@@ -362,7 +434,9 @@ double evocore_param_similarity(
  * Transfer parameters across contexts
  *
  * Transfers learned parameters from source to target context,
- * adjusted for context differences.
+ * adjusted for context differences: each parameter is scaled by
+ * 1 - adjustment_factor * (1 - similarity). Unknown contexts are
+ * treated as similarity 0.
  *
  * @param source_params Source parameters
  * @param source_context Source context ID
@@ -383,6 +457,32 @@ bool evocore_transfer_params(
     double adjustment_factor
 );
 
+/**
+ * Transfer parameters across contexts by index
+ *
+ * Same as evocore_transfer_params() with context IDs already resolved
+ * to matrix indices. Reads the similarity once and writes the output
+ * in a single pass.
+ *
+ * @param source_params Source parameters
+ * @param source_index Index of source context
+ * @param target_index Index of target context
+ * @param similarity_matrix Context similarity matrix
+ * @param param_count Number of parameters
+ * @param out_params Output adjusted parameters
+ * @param adjustment_factor How much to adjust (0-1)
+ * @return true on success
+ */
+bool evocore_transfer_params_idx(
+    const double *source_params,
+    size_t source_index,
+    size_t target_index,
+    const evocore_similarity_matrix_t *similarity_matrix,
+    size_t param_count,
+    double *out_params,
+    double adjustment_factor
+);
+
 /**
  * Find transferable contexts
  *
@@ -23,7 +23,6 @@ ffi.cdef("""
 typedef long time_t;
 typedef unsigned int uint32_t;
 typedef long long int64_t;
-typedef unsigned long long uint64_t;
 
 // ==========================================================================
 // Error Handling (error.h)
@@ -665,6 +664,8 @@ void evocore_meta_params_init(evocore_meta_params_t *params);
 evocore_error_t evocore_meta_params_validate(const evocore_meta_params_t *params);
 void evocore_meta_params_mutate(evocore_meta_params_t *params, unsigned int *seed);
 void evocore_meta_params_clone(const evocore_meta_params_t *src, evocore_meta_params_t *dst);
+void* evocore_meta_params_alloc(size_t size);
+void evocore_meta_params_free(void *ptr);
 double evocore_meta_params_get(const evocore_meta_params_t *params, const char *name);
 evocore_error_t evocore_meta_params_set(evocore_meta_params_t *params, const char *name, double value);
 void evocore_meta_params_print(const evocore_meta_params_t *params);
@@ -682,8 +683,11 @@ evocore_error_t evocore_meta_population_init(evocore_meta_population_t *meta_pop
 void evocore_meta_population_cleanup(evocore_meta_population_t *meta_pop);
 evocore_meta_individual_t* evocore_meta_population_best(evocore_meta_population_t *meta_pop);
 evocore_error_t evocore_meta_population_evolve(evocore_meta_population_t *meta_pop, unsigned int *seed);
+evocore_error_t evocore_meta_population_evolve_parallel(evocore_meta_population_t *meta_pop, unsigned int *seed,
+                                                        int num_threads);
 void evocore_meta_population_sort(evocore_meta_population_t *meta_pop);
 bool evocore_meta_population_converged(const evocore_meta_population_t *meta_pop, double threshold, int generations);
+size_t evocore_meta_population_snapshot(const evocore_meta_population_t *meta_pop, double *out, size_t max_individuals);
 
 // Adaptation
 void evocore_meta_adapt(evocore_meta_params_t *params, const double *recent_fitness, size_t count, bool improvement);
@@ -693,6 +697,10 @@ void evocore_meta_suggest_selection_pressure(double fitness_stddev, evocore_meta
 // Evaluation and learning
 double evocore_meta_evaluate(const evocore_meta_params_t *params, double best_fitness,
                               double avg_fitness, double diversity, int generations);
+void evocore_meta_evaluate_many(const evocore_meta_params_t *const *params, size_t count,
+                                const double *best_fitness, const double *avg_fitness,
+                                const double *diversity, const int *generations,
+                                double *out_meta_fitness);
 void evocore_meta_learn_outcome(double mutation_rate, double exploration_factor, double fitness, double learning_rate);
 bool evocore_meta_get_learned_params(double *mutation_rate_out, double *exploration_out, int min_samples);
 void evocore_meta_reset_learning(void);
@@ -734,10 +742,14 @@ typedef struct {
 } evocore_bandit_arm_t;
 
 typedef struct {
-    evocore_bandit_arm_t *arms;
+    size_t *counts;
+    double *total_rewards;
+    double *mean_rewards;
+    double *arm_radius;
     size_t count;
     size_t total_pulls;
     double ucb_c;
+    double ucb_scale;
 } evocore_bandit_t;
 
 // Exploration management
@@ -753,14 +765,22 @@ void evocore_exploration_set_ucb_c(evocore_exploration_t *exp, double ucb_c);
 double evocore_exploration_update(evocore_exploration_t *exp, size_t generation, double best_fitness);
 double evocore_exploration_get_rate(const evocore_exploration_t *exp);
 bool evocore_exploration_should_explore(const evocore_exploration_t *exp, unsigned int *seed);
+size_t evocore_exploration_should_explore_batch(const evocore_exploration_t *exp, uint8_t *out_flags, size_t n,
+                                                unsigned int *seed);
+size_t evocore_exploration_should_explore_packed(const evocore_exploration_t *exp, uint64_t *out_words, size_t n,
+                                                 unsigned int *seed);
 
 // Bandit (UCB1)
 evocore_bandit_t* evocore_bandit_create(size_t arm_count, double ucb_c);
 void evocore_bandit_free(evocore_bandit_t *bandit);
 size_t evocore_bandit_select_ucb(const evocore_bandit_t *bandit);
+size_t evocore_bandit_select_ucb_cached(const evocore_bandit_t *bandit);
 void evocore_bandit_update(evocore_bandit_t *bandit, size_t arm, double reward);
+size_t evocore_bandit_select_ucb_batch(const evocore_bandit_t *bandit, size_t *out_arms, size_t n);
+void evocore_bandit_update_batch(evocore_bandit_t *bandit, const size_t *arms, const double *rewards, size_t n);
 size_t evocore_bandit_arm_count(const evocore_bandit_t *bandit);
 bool evocore_bandit_get_stats(const evocore_bandit_t *bandit, size_t arm, size_t *out_count, double *out_mean);
+bool evocore_bandit_get_arm(const evocore_bandit_t *bandit, size_t arm, evocore_bandit_arm_t *out);
 void evocore_bandit_reset(evocore_bandit_t *bandit);
 
 // Boltzmann selection
@@ -833,17 +853,28 @@ bool evocore_synthesis_nearest(const evocore_synthesis_request_t *request, doubl
 // Similarity
 evocore_similarity_matrix_t* evocore_similarity_matrix_create(size_t context_count, char **context_ids);
 void evocore_similarity_matrix_free(evocore_similarity_matrix_t *matrix);
+double* evocore_similarity_matrix_data(evocore_similarity_matrix_t *matrix);
 bool evocore_similarity_update(evocore_similarity_matrix_t *matrix, const char *context_a,
                                 const char *context_b, double similarity);
 double evocore_similarity_get(const evocore_similarity_matrix_t *matrix, const char *context_a, const char *context_b);
 const char* evocore_similarity_find_nearest(const evocore_similarity_matrix_t *matrix, const char *target_context);
+bool evocore_similarity_update_idx(evocore_similarity_matrix_t *matrix, size_t index_a, size_t index_b,
+                                   double similarity);
+double evocore_similarity_get_idx(const evocore_similarity_matrix_t *matrix, size_t index_a, size_t index_b);
+size_t evocore_similarity_find_nearest_idx(const evocore_similarity_matrix_t *matrix, size_t target_index);
 double evocore_param_distance(const double *params1, const double *params2, size_t count);
+double evocore_param_distance_4(const double *params1, const double *params2);
+double evocore_param_distance_8(const double *params1, const double *params2);
+double evocore_param_distance_16(const double *params1, const double *params2);
 double evocore_param_similarity(const double *params1, const double *params2, size_t count, double max_distance);
 
 // Transfer learning
 bool evocore_transfer_params(const double *source_params, const char *source_context, const char *target_context,
                               const evocore_similarity_matrix_t *similarity_matrix, size_t param_count,
                               double *out_params, double adjustment_factor);
+bool evocore_transfer_params_idx(const double *source_params, size_t source_index, size_t target_index,
+                                  const evocore_similarity_matrix_t *similarity_matrix, size_t param_count,
+                                  double *out_params, double adjustment_factor);
 size_t evocore_find_transferable_contexts(const char *target_context, const evocore_similarity_matrix_t *similarity_matrix,
                                            double min_similarity, const char **out_contexts, size_t max_contexts);
 
@@ -991,6 +1022,13 @@ typedef struct {
     bool track_timing;
 } evocore_stats_config_t;
 
+typedef struct {
+    double min;
+    double max;
+    double mean;
+    double stddev;
+} evocore_fitness_dist_t;
+
 typedef void (*evocore_progress_callback_t)(const evocore_stats_t *stats, void *user_data);
 
 typedef struct {
@@ -1004,6 +1042,7 @@ typedef struct {
 evocore_stats_t* evocore_stats_create(const evocore_stats_config_t *config);
 void evocore_stats_free(evocore_stats_t *stats);
 evocore_error_t evocore_stats_update(evocore_stats_t *stats, const evocore_population_t *pop);
+evocore_error_t evocore_stats_update_batch(evocore_stats_t *stats, const evocore_population_t **pops, size_t count);
 evocore_error_t evocore_stats_record_operations(evocore_stats_t *stats, int64_t eval_count,
                                                  int64_t mutations, int64_t crossovers);
 bool evocore_stats_is_converged(const evocore_stats_t *stats);
@@ -1011,6 +1050,7 @@ bool evocore_stats_is_stagnant(const evocore_stats_t *stats);
 double evocore_stats_diversity(const evocore_population_t *pop);
 evocore_error_t evocore_stats_fitness_distribution(const evocore_population_t *pop, double *out_min,
                                                     double *out_max, double *out_mean, double *out_stddev);
+evocore_error_t evocore_stats_fitness_dist(const evocore_population_t *pop, evocore_fitness_dist_t *out);
 
 // Progress reporting
 evocore_error_t evocore_progress_reporter_init(evocore_progress_reporter_t *reporter,
@@ -1049,6 +1089,9 @@ bool evocore_config_has_key(const evocore_config_t *config, const char *section,
 size_t evocore_config_section_size(const evocore_config_t *config, const char *section);
 const evocore_config_entry_t* evocore_config_get_entry(const evocore_config_t *config,
                                                         const char *section, size_t index);
+size_t evocore_config_get_section_bulk(const evocore_config_t *config, const char *section,
+                                       const char **out_keys, const char **out_values,
+                                       int *out_types, size_t capacity);
 
 // ==========================================================================
 // Persistence (persist.h)
@@ -1128,6 +1171,7 @@ evocore_error_t evocore_checkpoint_create(evocore_checkpoint_t *checkpoint, cons
 evocore_error_t evocore_checkpoint_save(const evocore_checkpoint_t *checkpoint, const char *filepath,
                                          const evocore_serial_options_t *options);
 evocore_error_t evocore_checkpoint_load(const char *filepath, evocore_checkpoint_t *checkpoint);
+evocore_error_t evocore_checkpoint_peek(const char *filepath, evocore_checkpoint_t *checkpoint);
 evocore_error_t evocore_checkpoint_restore(const evocore_checkpoint_t *checkpoint, evocore_population_t *pop,
                                             const evocore_domain_t *domain, evocore_meta_population_t *meta_pop);
 void evocore_checkpoint_free(evocore_checkpoint_t *checkpoint);
@@ -1139,6 +1183,8 @@ evocore_error_t evocore_checkpoint_manager_update(evocore_checkpoint_manager_t *
                                                    const evocore_domain_t *domain, const evocore_meta_population_t *meta_pop);
 char** evocore_checkpoint_list(const char *directory, int *count);
 void evocore_checkpoint_list_free(char **list, int count);
+char* evocore_checkpoint_list_packed(const char *directory, size_t *out_len, int *out_count);
+void evocore_checkpoint_list_packed_free(char *packed);
 evocore_error_t evocore_checkpoint_info(const char *filepath, evocore_checkpoint_t *checkpoint);
 
 // Utility
@@ -1284,6 +1330,12 @@ bool evocore_gpu_get_enabled(const evocore_gpu_context_t *ctx);
 # C Source Configuration (set_source)
 # =============================================================================
 
+# Out-of-line API mode: set_source() compiles a typed C wrapper for every
+# cdef'd function into evocore._evocore, so calls go straight to the library
+# instead of through libffi argument marshalling (ABI mode / ffi.dlopen).
+# setup.py builds this through cffi_modules, and wheels ship the compiled
+# extension.
+
 # Find library paths - use relative path from this file if EVOCORE_ROOT not set
 _THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 _DEFAULT_ROOT = os.path.abspath(os.path.join(_THIS_DIR, '..', '..', '..'))
@@ -9,12 +9,14 @@ Provides meta-level parameter adaptation:
 
 from .params import MetaParams
 from .population import (
+    MetaIndividualSnapshot,
     MetaIndividual,
     MetaPopulation,
     meta_adapt,
     meta_suggest_mutation_rate,
     meta_suggest_selection_pressure,
     meta_evaluate,
+    meta_evaluate_many,
     meta_learn_outcome,
     meta_get_learned_params,
     meta_reset_learning,
@@ -22,12 +24,14 @@ from .population import (
 
 __all__ = [
     'MetaParams',
+    'MetaIndividualSnapshot',
     'MetaIndividual',
     'MetaPopulation',
     'meta_adapt',
     'meta_suggest_mutation_rate',
     'meta_suggest_selection_pressure',
     'meta_evaluate',
+    'meta_evaluate_many',
     'meta_learn_outcome',
     'meta_get_learned_params',
     'meta_reset_learning',
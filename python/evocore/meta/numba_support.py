@@ -0,0 +1,78 @@
+"""
+Numba support for meta-evolution parameters.
+
+Registers the compiled evocore cffi module with Numba so that jitted
+adaptation code can read and write meta-parameters without crossing
+back into Python for every field access.
+
+cffi pointers cannot be passed to jitted functions directly, so
+params_record() exposes the evocore_meta_params_t struct as a zero-copy
+one-element NumPy record array. Inside @njit code, fields are read and
+written as rec[0].<field>, and ffi.from_buffer(rec) yields the struct
+pointer expected by evocore functions.
+
+Example:
+    >>> import numba
+    >>> from evocore import _evocore
+    >>> from evocore.meta import MetaParams
+    >>> from evocore.meta.numba_support import register, params_record
+    >>>
+    >>> register()
+    >>> ffi, lib = _evocore.ffi, _evocore.lib
+    >>> meta_evaluate = lib.evocore_meta_evaluate
+    >>>
+    >>> @numba.njit
+    ... def anneal(rec, factor):
+    ...     rec[0].optimization_mutation_rate *= factor
+    ...     return meta_evaluate(ffi.from_buffer(rec), 0.9, 0.5, 0.2, 10)
+    >>>
+    >>> params = MetaParams()
+    >>> anneal(params_record(params), 0.95)
+"""
+
+import numpy as np
+from numba.core.typing import cffi_utils
+from numba.np.numpy_support import as_dtype
+
+from .. import _evocore
+from .params import MetaParams
+
+_PARAMS_C_T = _evocore.ffi.typeof("evocore_meta_params_t")
+_PARAMS_RECORD = cffi_utils.map_type(_PARAMS_C_T, use_record_dtype=True)
+_PARAMS_DTYPE = as_dtype(_PARAMS_RECORD)
+
+_registered = False
+
+
+def register() -> None:
+    """
+    Register evocore's cffi types and functions with Numba.
+
+    Safe to call more than once; registration happens on the first call.
+    """
+    global _registered
+    if _registered:
+        return
+    # The struct type must be known before the module's signatures are mapped
+    cffi_utils.register_type(_PARAMS_C_T, _PARAMS_RECORD)
+    cffi_utils.register_module(_evocore)
+    _registered = True
+
+
+def params_record(params: MetaParams) -> np.ndarray:
+    """
+    View parameters as a Numba-compatible record array.
+
+    The array aliases the C struct, so writes from jitted code are
+    visible through the MetaParams object and vice versa.
+
+    Args:
+        params: Parameters to view
+
+    Returns:
+        One-element structured array over evocore_meta_params_t
+    """
+    return np.frombuffer(_evocore.ffi.buffer(params._params), dtype=_PARAMS_DTYPE)
+
+
+__all__ = ['register', 'params_record']
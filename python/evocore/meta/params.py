@@ -4,8 +4,51 @@ Meta-evolution parameters for evocore Python bindings.
 Provides meta-parameter management and adaptation.
 """
 
-from typing import Optional, Dict
-from ..utils.error import check_error, EvocoreError
+from typing import Optional, Dict, List
+from ..utils.error import check_error, EvocoreError, EvocoreInvalidArgumentError
+
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+    _META_PARAMS_T = _FFI.typeof("evocore_meta_params_t *")
+    # Single-struct allocations recycle blocks through a C-side freelist;
+    # every caller fully initializes the struct, so skip the memset.
+    _META_PARAMS_ALLOC = _FFI.new_allocator(
+        alloc=_LIB.evocore_meta_params_alloc,
+        free=_LIB.evocore_meta_params_free,
+        should_clear_after_alloc=False,
+    )
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = _META_PARAMS_T = _META_PARAMS_ALLOC = None
+
+# evocore_meta_params_t fields exposed as attributes, in declaration order
+_FIELDS = (
+    'optimization_mutation_rate',
+    'variance_mutation_rate',
+    'experimentation_rate',
+    'elite_protection_ratio',
+    'culling_ratio',
+    'fitness_threshold_for_breeding',
+    'target_population_size',
+    'min_population_size',
+    'max_population_size',
+    'learning_rate',
+    'exploration_factor',
+    'confidence_threshold',
+    'profitable_optimization_ratio',
+    'profitable_random_ratio',
+    'losing_optimization_ratio',
+    'losing_random_ratio',
+    'meta_mutation_rate',
+    'meta_learning_rate',
+    'meta_convergence_threshold',
+    'negative_learning_enabled',
+    'negative_penalty_weight',
+    'negative_decay_rate',
+    'negative_capacity',
+    'negative_similarity_threshold',
+    'negative_forbidden_threshold',
+)
+_FIELD_SET = frozenset(_FIELDS)
 
 
 class MetaParams:
@@ -13,7 +56,8 @@ class MetaParams:
     Meta-evolution parameters.
 
     Controls mutation rates, selection pressure, population dynamics,
-    and learning parameters for meta-evolution.
+    and learning parameters for meta-evolution. Every field of
+    evocore_meta_params_t is readable and writable as an attribute.
 
     Example:
         >>> params = MetaParams()
@@ -22,35 +66,14 @@ class MetaParams:
         >>> print(params.exploration_factor)
     """
 
-    __slots__ = ('_params', '_ffi', '_lib')
-
-    # Parameter names for get/set
-    PARAM_NAMES = [
-        'optimization_mutation_rate',
-        'variance_mutation_rate',
-        'experimentation_rate',
-        'elite_protection_ratio',
-        'culling_ratio',
-        'fitness_threshold_for_breeding',
-        'target_population_size',
-        'min_population_size',
-        'max_population_size',
-        'learning_rate',
-        'exploration_factor',
-        'confidence_threshold',
-        'profitable_optimization_ratio',
-        'profitable_random_ratio',
-        'losing_optimization_ratio',
-        'losing_random_ratio',
-        'meta_mutation_rate',
-        'meta_learning_rate',
-        'meta_convergence_threshold',
-        'negative_penalty_weight',
-        'negative_decay_rate',
-        'negative_capacity',
-        'negative_similarity_threshold',
-        'negative_forbidden_threshold',
-    ]
+    __slots__ = ('_params', '_owner')
+
+    _ffi = _FFI
+    _lib = _LIB
+
+    # Parameter names for get/set (negative_learning_enabled is a flag)
+    PARAM_NAMES = tuple(n for n in _FIELDS if n != 'negative_learning_enabled')
+    _PARAM_NAMES_SET = frozenset(PARAM_NAMES)
 
     def __init__(self, *, _raw: bool = False):
         """
@@ -61,16 +84,31 @@ class MetaParams:
         """
         if _raw:
             self._params = None
-            self._ffi = None
-            self._lib = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
+        self._params = _META_PARAMS_ALLOC(_META_PARAMS_T)
+        _LIB.evocore_meta_params_init(self._params)
+
+    @classmethod
+    def batch_new(cls, n: int) -> List["MetaParams"]:
+        """
+        Create n default parameter sets backed by a single allocation.
+
+        Args:
+            n: Number of parameter sets
 
-        self._params = ffi.new("evocore_meta_params_t *")
-        lib.evocore_meta_params_init(self._params)
+        Returns:
+            List of n MetaParams sharing one C array
+        """
+        slab = _FFI.new("evocore_meta_params_t[]", n)
+        batch = []
+        for i in range(n):
+            params = cls(_raw=True)
+            params._params = slab + i
+            params._owner = slab  # keeps the shared array alive
+            _LIB.evocore_meta_params_init(params._params)
+            batch.append(params)
+        return batch
 
     def validate(self) -> None:
         """
@@ -100,9 +138,7 @@ class MetaParams:
             New MetaParams with copied values
         """
         new = MetaParams(_raw=True)
-        new._ffi = self._ffi
-        new._lib = self._lib
-        new._params = self._ffi.new("evocore_meta_params_t *")
+        new._params = _META_PARAMS_ALLOC(_META_PARAMS_T)
         self._lib.evocore_meta_params_clone(self._params, new._params)
         return new
 
@@ -115,7 +151,14 @@ class MetaParams:
 
         Returns:
             Parameter value
+
+        Raises:
+            EvocoreInvalidArgumentError: If name is not a known parameter
         """
+        if name not in self._PARAM_NAMES_SET:
+            raise EvocoreInvalidArgumentError(
+                f"Unknown parameter: {name!r}", self._lib.EVOCORE_ERR_INVALID_ARG
+            )
         return self._lib.evocore_meta_params_get(self._params, name.encode())
 
     def set(self, name: str, value: float) -> None:
@@ -125,7 +168,14 @@ class MetaParams:
         Args:
             name: Parameter name
             value: New value
+
+        Raises:
+            EvocoreInvalidArgumentError: If name is not a known parameter
         """
+        if name not in self._PARAM_NAMES_SET:
+            raise EvocoreInvalidArgumentError(
+                f"Unknown parameter: {name!r}", self._lib.EVOCORE_ERR_INVALID_ARG
+            )
         err = self._lib.evocore_meta_params_set(self._params, name.encode(), value)
         check_error(err, self._lib)
 
@@ -140,33 +190,7 @@ class MetaParams:
         Returns:
             Dictionary of parameter names to values
         """
-        return {
-            'optimization_mutation_rate': self.optimization_mutation_rate,
-            'variance_mutation_rate': self.variance_mutation_rate,
-            'experimentation_rate': self.experimentation_rate,
-            'elite_protection_ratio': self.elite_protection_ratio,
-            'culling_ratio': self.culling_ratio,
-            'fitness_threshold_for_breeding': self.fitness_threshold_for_breeding,
-            'target_population_size': self.target_population_size,
-            'min_population_size': self.min_population_size,
-            'max_population_size': self.max_population_size,
-            'learning_rate': self.learning_rate,
-            'exploration_factor': self.exploration_factor,
-            'confidence_threshold': self.confidence_threshold,
-            'profitable_optimization_ratio': self.profitable_optimization_ratio,
-            'profitable_random_ratio': self.profitable_random_ratio,
-            'losing_optimization_ratio': self.losing_optimization_ratio,
-            'losing_random_ratio': self.losing_random_ratio,
-            'meta_mutation_rate': self.meta_mutation_rate,
-            'meta_learning_rate': self.meta_learning_rate,
-            'meta_convergence_threshold': self.meta_convergence_threshold,
-            'negative_learning_enabled': self.negative_learning_enabled,
-            'negative_penalty_weight': self.negative_penalty_weight,
-            'negative_decay_rate': self.negative_decay_rate,
-            'negative_capacity': self.negative_capacity,
-            'negative_similarity_threshold': self.negative_similarity_threshold,
-            'negative_forbidden_threshold': self.negative_forbidden_threshold,
-        }
+        return {name: getattr(self._params, name) for name in _FIELDS}
 
     @classmethod
     def from_dict(cls, d: Dict[str, float]) -> "MetaParams":
@@ -180,217 +204,22 @@ class MetaParams:
             New MetaParams
         """
         params = cls()
+        c_params = params._params
         for name, value in d.items():
-            if hasattr(params, name):
-                setattr(params, name, value)
+            if name in _FIELD_SET:
+                setattr(c_params, name, value)
         return params
 
-    # Mutation rates
-    @property
-    def optimization_mutation_rate(self) -> float:
-        return self._params.optimization_mutation_rate
-
-    @optimization_mutation_rate.setter
-    def optimization_mutation_rate(self, value: float):
-        self._params.optimization_mutation_rate = value
-
-    @property
-    def variance_mutation_rate(self) -> float:
-        return self._params.variance_mutation_rate
-
-    @variance_mutation_rate.setter
-    def variance_mutation_rate(self, value: float):
-        self._params.variance_mutation_rate = value
-
-    @property
-    def experimentation_rate(self) -> float:
-        return self._params.experimentation_rate
-
-    @experimentation_rate.setter
-    def experimentation_rate(self, value: float):
-        self._params.experimentation_rate = value
-
-    # Selection pressure
-    @property
-    def elite_protection_ratio(self) -> float:
-        return self._params.elite_protection_ratio
-
-    @elite_protection_ratio.setter
-    def elite_protection_ratio(self, value: float):
-        self._params.elite_protection_ratio = value
-
-    @property
-    def culling_ratio(self) -> float:
-        return self._params.culling_ratio
-
-    @culling_ratio.setter
-    def culling_ratio(self, value: float):
-        self._params.culling_ratio = value
-
-    @property
-    def fitness_threshold_for_breeding(self) -> float:
-        return self._params.fitness_threshold_for_breeding
-
-    @fitness_threshold_for_breeding.setter
-    def fitness_threshold_for_breeding(self, value: float):
-        self._params.fitness_threshold_for_breeding = value
+    def __getattr__(self, name: str):
+        if name in _FIELD_SET:
+            return getattr(self._params, name)
+        raise AttributeError(f"'MetaParams' object has no attribute '{name}'")
 
-    # Population dynamics
-    @property
-    def target_population_size(self) -> int:
-        return self._params.target_population_size
-
-    @target_population_size.setter
-    def target_population_size(self, value: int):
-        self._params.target_population_size = value
-
-    @property
-    def min_population_size(self) -> int:
-        return self._params.min_population_size
-
-    @min_population_size.setter
-    def min_population_size(self, value: int):
-        self._params.min_population_size = value
-
-    @property
-    def max_population_size(self) -> int:
-        return self._params.max_population_size
-
-    @max_population_size.setter
-    def max_population_size(self, value: int):
-        self._params.max_population_size = value
-
-    # Learning
-    @property
-    def learning_rate(self) -> float:
-        return self._params.learning_rate
-
-    @learning_rate.setter
-    def learning_rate(self, value: float):
-        self._params.learning_rate = value
-
-    @property
-    def exploration_factor(self) -> float:
-        return self._params.exploration_factor
-
-    @exploration_factor.setter
-    def exploration_factor(self, value: float):
-        self._params.exploration_factor = value
-
-    @property
-    def confidence_threshold(self) -> float:
-        return self._params.confidence_threshold
-
-    @confidence_threshold.setter
-    def confidence_threshold(self, value: float):
-        self._params.confidence_threshold = value
-
-    # Breeding ratios
-    @property
-    def profitable_optimization_ratio(self) -> float:
-        return self._params.profitable_optimization_ratio
-
-    @profitable_optimization_ratio.setter
-    def profitable_optimization_ratio(self, value: float):
-        self._params.profitable_optimization_ratio = value
-
-    @property
-    def profitable_random_ratio(self) -> float:
-        return self._params.profitable_random_ratio
-
-    @profitable_random_ratio.setter
-    def profitable_random_ratio(self, value: float):
-        self._params.profitable_random_ratio = value
-
-    @property
-    def losing_optimization_ratio(self) -> float:
-        return self._params.losing_optimization_ratio
-
-    @losing_optimization_ratio.setter
-    def losing_optimization_ratio(self, value: float):
-        self._params.losing_optimization_ratio = value
-
-    @property
-    def losing_random_ratio(self) -> float:
-        return self._params.losing_random_ratio
-
-    @losing_random_ratio.setter
-    def losing_random_ratio(self, value: float):
-        self._params.losing_random_ratio = value
-
-    # Meta-meta parameters
-    @property
-    def meta_mutation_rate(self) -> float:
-        return self._params.meta_mutation_rate
-
-    @meta_mutation_rate.setter
-    def meta_mutation_rate(self, value: float):
-        self._params.meta_mutation_rate = value
-
-    @property
-    def meta_learning_rate(self) -> float:
-        return self._params.meta_learning_rate
-
-    @meta_learning_rate.setter
-    def meta_learning_rate(self, value: float):
-        self._params.meta_learning_rate = value
-
-    @property
-    def meta_convergence_threshold(self) -> float:
-        return self._params.meta_convergence_threshold
-
-    @meta_convergence_threshold.setter
-    def meta_convergence_threshold(self, value: float):
-        self._params.meta_convergence_threshold = value
-
-    # Negative learning
-    @property
-    def negative_learning_enabled(self) -> bool:
-        return self._params.negative_learning_enabled
-
-    @negative_learning_enabled.setter
-    def negative_learning_enabled(self, value: bool):
-        self._params.negative_learning_enabled = value
-
-    @property
-    def negative_penalty_weight(self) -> float:
-        return self._params.negative_penalty_weight
-
-    @negative_penalty_weight.setter
-    def negative_penalty_weight(self, value: float):
-        self._params.negative_penalty_weight = value
-
-    @property
-    def negative_decay_rate(self) -> float:
-        return self._params.negative_decay_rate
-
-    @negative_decay_rate.setter
-    def negative_decay_rate(self, value: float):
-        self._params.negative_decay_rate = value
-
-    @property
-    def negative_capacity(self) -> int:
-        return self._params.negative_capacity
-
-    @negative_capacity.setter
-    def negative_capacity(self, value: int):
-        self._params.negative_capacity = value
-
-    @property
-    def negative_similarity_threshold(self) -> float:
-        return self._params.negative_similarity_threshold
-
-    @negative_similarity_threshold.setter
-    def negative_similarity_threshold(self, value: float):
-        self._params.negative_similarity_threshold = value
-
-    @property
-    def negative_forbidden_threshold(self) -> float:
-        return self._params.negative_forbidden_threshold
-
-    @negative_forbidden_threshold.setter
-    def negative_forbidden_threshold(self, value: float):
-        self._params.negative_forbidden_threshold = value
+    def __setattr__(self, name: str, value) -> None:
+        if name in _FIELD_SET:
+            setattr(self._params, name, value)
+        else:
+            object.__setattr__(self, name, value)
 
     def __repr__(self) -> str:
         return (f"MetaParams(opt_mut={self.optimization_mutation_rate:.3f}, "
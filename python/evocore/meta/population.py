@@ -4,9 +4,28 @@ Meta-population for evocore Python bindings.
 Provides meta-evolution population management.
 """
 
-from typing import Optional, List, Iterator
+from typing import Optional, List, Iterator, NamedTuple, Sequence
+import threading
+import weakref
+import numpy as np
 from .params import MetaParams
-from ..utils.error import check_error, EvocoreError
+from ..utils.error import check_error, EvocoreError, EvocoreNullPointerError
+
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+    _META_POP_T = _FFI.typeof("evocore_meta_population_t *")
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = _META_POP_T = None
+
+# Per-thread out-parameters reused by meta_get_learned_params()
+_scratch = threading.local()
+
+
+class MetaIndividualSnapshot(NamedTuple):
+    """Read-only fitness summary of a meta-individual."""
+    meta_fitness: float
+    generation: int
+    avg_fitness: float
 
 
 class MetaIndividual:
@@ -22,26 +41,34 @@ class MetaIndividual:
         self._individual = individual_ptr
         self._ffi = ffi
         self._lib = lib
-        self._meta_pop = meta_pop
+        # Weak backlink: a stray wrapper must not pin the whole population
+        self._meta_pop = weakref.ref(meta_pop)
+
+    def _ptr(self):
+        """Return the C individual, raising if its population is gone."""
+        meta_pop = self._meta_pop()
+        if meta_pop is None or meta_pop._meta_pop is None:
+            raise EvocoreNullPointerError(
+                "MetaIndividual used after its MetaPopulation was freed"
+            )
+        return self._individual
 
     @property
     def params(self) -> MetaParams:
         """Get the meta-parameters."""
         params = MetaParams(_raw=True)
-        params._ffi = self._ffi
-        params._lib = self._lib
-        params._params = self._ffi.addressof(self._individual.params)
+        params._params = self._ffi.addressof(self._ptr().params)
         return params
 
     @property
     def meta_fitness(self) -> float:
         """Meta-fitness score."""
-        return self._individual.meta_fitness
+        return self._ptr().meta_fitness
 
     @property
     def generation(self) -> int:
         """Generation this individual was created."""
-        return self._individual.generation
+        return self._ptr().generation
 
     def record_fitness(self, fitness: float) -> None:
         """
@@ -50,7 +77,7 @@ class MetaIndividual:
         Args:
             fitness: Fitness value to record
         """
-        err = self._lib.evocore_meta_individual_record_fitness(self._individual, fitness)
+        err = self._lib.evocore_meta_individual_record_fitness(self._ptr(), fitness)
         check_error(err, self._lib)
 
     def average_fitness(self) -> float:
@@ -60,7 +87,7 @@ class MetaIndividual:
         Returns:
             Average fitness
         """
-        return self._lib.evocore_meta_individual_average_fitness(self._individual)
+        return self._lib.evocore_meta_individual_average_fitness(self._ptr())
 
     def improvement_trend(self) -> float:
         """
@@ -69,7 +96,7 @@ class MetaIndividual:
         Returns:
             Trend value (positive = improving)
         """
-        return self._lib.evocore_meta_individual_improvement_trend(self._individual)
+        return self._lib.evocore_meta_individual_improvement_trend(self._ptr())
 
     def __repr__(self) -> str:
         return (f"MetaIndividual(meta_fitness={self.meta_fitness:.4f}, "
@@ -89,7 +116,7 @@ class MetaPopulation:
         >>> meta_pop.evolve()
     """
 
-    __slots__ = ('_meta_pop', '_ffi', '_lib')
+    __slots__ = ('_meta_pop', '_ffi', '_lib', '_members', '__weakref__')
 
     def __init__(self, size: int = 10, seed: Optional[int] = None, *, _raw: bool = False):
         """
@@ -100,30 +127,34 @@ class MetaPopulation:
             seed: Optional random seed
             _raw: Internal flag for alternative construction
         """
+        self._members = None
+
         if _raw:
             self._meta_pop = None
             self._ffi = None
             self._lib = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
+        self._ffi = _FFI
+        self._lib = _LIB
 
-        self._meta_pop = ffi.new("evocore_meta_population_t *")
-        seed_ptr = ffi.new("unsigned int *", seed if seed is not None else 0)
+        self._meta_pop = _FFI.new(_META_POP_T)
+        seed_ptr = _FFI.new("unsigned int *", seed if seed is not None else 0)
 
-        err = lib.evocore_meta_population_init(self._meta_pop, size, seed_ptr)
-        check_error(err, lib)
+        err = _LIB.evocore_meta_population_init(self._meta_pop, size, seed_ptr)
+        check_error(err, _LIB)
 
     def __del__(self):
         """Clean up meta-population."""
-        if hasattr(self, '_meta_pop') and self._meta_pop is not None:
-            self._lib.evocore_meta_population_cleanup(self._meta_pop)
+        pop = getattr(self, '_meta_pop', None)
+        if pop is not None and self._lib is not None:
+            self._lib.evocore_meta_population_cleanup(pop)
+            self._meta_pop = None
 
     @property
     def count(self) -> int:
         """Number of individuals."""
+        # Read live: checkpoint restore rewrites the C population in place
         return self._meta_pop.count
 
     @property
@@ -140,8 +171,6 @@ class MetaPopulation:
     def best_params(self) -> MetaParams:
         """Get the best parameters found."""
         params = MetaParams(_raw=True)
-        params._ffi = self._ffi
-        params._lib = self._lib
         params._params = self._ffi.addressof(self._meta_pop.best_params)
         return params
 
@@ -150,6 +179,47 @@ class MetaPopulation:
         """Whether population is initialized."""
         return self._meta_pop.initialized
 
+    def fitnesses_array(self) -> np.ndarray:
+        """
+        Get the meta-fitness of every individual as a zero-copy array.
+
+        The array is a read-only view over the C population storage, so it
+        reflects later calls to evolve() or sort() without being re-read.
+
+        Returns:
+            float64 array of length count
+        """
+        ffi = self._ffi
+        dtype = np.dtype({
+            'names': ['meta_fitness'],
+            'formats': [np.float64],
+            'offsets': [ffi.offsetof("evocore_meta_individual_t", "meta_fitness")],
+            'itemsize': ffi.sizeof("evocore_meta_individual_t"),
+        })
+        records = np.frombuffer(
+            ffi.buffer(self._meta_pop), dtype=dtype, count=self.count,
+            offset=ffi.offsetof("evocore_meta_population_t", "individuals")
+        )
+        view = records['meta_fitness']
+        view.flags.writeable = False
+        return view
+
+    def snapshots(self) -> List[MetaIndividualSnapshot]:
+        """
+        Get fitness summaries for the whole population in one C call.
+
+        Returns:
+            List of MetaIndividualSnapshot in population order
+        """
+        n = self.count
+        out = self._ffi.new("double[]", 3 * n)
+        n = self._lib.evocore_meta_population_snapshot(self._meta_pop, out, n)
+        flat = self._ffi.unpack(out, 3 * n)
+        return [
+            MetaIndividualSnapshot(flat[i], int(flat[i + 1]), flat[i + 2])
+            for i in range(0, 3 * n, 3)
+        ]
+
     def best(self) -> Optional[MetaIndividual]:
         """
         Get the best individual.
@@ -172,24 +242,35 @@ class MetaPopulation:
         Returns:
             MetaIndividual or None
         """
-        if index < 0 or index >= self.count:
+        if index < 0 or index >= self._meta_pop.count:
             return None
         return MetaIndividual(
             self._ffi.addressof(self._meta_pop.individuals[index]),
             self._ffi, self._lib, self
         )
 
-    def evolve(self, seed: Optional[int] = None) -> None:
+    def evolve(self, seed: Optional[int] = None, threads: Optional[int] = None) -> None:
         """
         Evolve the meta-population.
 
-        Creates new generation through selection and mutation.
+        Creates new generation through selection and mutation. By default
+        children are bred serially; meta-populations are small enough that
+        starting a thread team costs more than the work.
 
         Args:
             seed: Optional random seed
+            threads: Breed children in parallel with this many threads
+                (0 = OpenMP default). Per-child RNG streams make the result
+                independent of the thread count, but different from the
+                serial result for the same seed.
         """
         seed_ptr = self._ffi.new("unsigned int *", seed if seed is not None else 0)
-        err = self._lib.evocore_meta_population_evolve(self._meta_pop, seed_ptr)
+        if threads is None:
+            err = self._lib.evocore_meta_population_evolve(self._meta_pop, seed_ptr)
+        else:
+            err = self._lib.evocore_meta_population_evolve_parallel(
+                self._meta_pop, seed_ptr, threads
+            )
         check_error(err, self._lib)
 
     def sort(self) -> None:
@@ -213,19 +294,27 @@ class MetaPopulation:
 
     def __len__(self) -> int:
         """Return population size."""
-        return self.count
+        return self._meta_pop.count
 
     def __iter__(self) -> Iterator[MetaIndividual]:
         """Iterate over individuals."""
-        for i in range(self.count):
-            ind = self.get(i)
-            if ind is not None:
-                yield ind
+        # Wrappers point at fixed slots of the individuals array, so the
+        # memo stays valid as long as the live count matches
+        count = self._meta_pop.count
+        members = self._members
+        if members is None or len(members) != count:
+            addressof = self._ffi.addressof
+            individuals = self._meta_pop.individuals
+            members = self._members = [
+                MetaIndividual(addressof(individuals[i]), self._ffi, self._lib, self)
+                for i in range(count)
+            ]
+        return iter(members)
 
     def __getitem__(self, index: int) -> MetaIndividual:
         """Get individual by index."""
         if index < 0:
-            index = self.count + index
+            index = self._meta_pop.count + index
         ind = self.get(index)
         if ind is None:
             raise IndexError(f"Index {index} out of range")
@@ -247,9 +336,8 @@ def meta_adapt(params: MetaParams, recent_fitness: List[float], improvement: boo
         recent_fitness: List of recent fitness values
         improvement: Whether improvement was observed
     """
-    from .._evocore import ffi, lib
-    fitness_arr = ffi.new("double[]", recent_fitness)
-    lib.evocore_meta_adapt(params._params, fitness_arr, len(recent_fitness), improvement)
+    fitness_arr = _FFI.new("double[]", recent_fitness)
+    _LIB.evocore_meta_adapt(params._params, fitness_arr, len(recent_fitness), improvement)
 
 
 def meta_suggest_mutation_rate(diversity: float, params: MetaParams) -> None:
@@ -260,8 +348,7 @@ def meta_suggest_mutation_rate(diversity: float, params: MetaParams) -> None:
         diversity: Current population diversity
         params: Parameters to update
     """
-    from .._evocore import lib
-    lib.evocore_meta_suggest_mutation_rate(diversity, params._params)
+    _LIB.evocore_meta_suggest_mutation_rate(diversity, params._params)
 
 
 def meta_suggest_selection_pressure(fitness_stddev: float, params: MetaParams) -> None:
@@ -272,8 +359,7 @@ def meta_suggest_selection_pressure(fitness_stddev: float, params: MetaParams) -
         fitness_stddev: Standard deviation of fitness
         params: Parameters to update
     """
-    from .._evocore import lib
-    lib.evocore_meta_suggest_selection_pressure(fitness_stddev, params._params)
+    _LIB.evocore_meta_suggest_selection_pressure(fitness_stddev, params._params)
 
 
 def meta_evaluate(params: MetaParams, best_fitness: float, avg_fitness: float,
@@ -291,12 +377,65 @@ def meta_evaluate(params: MetaParams, best_fitness: float, avg_fitness: float,
     Returns:
         Meta-fitness score
     """
-    from .._evocore import lib
-    return lib.evocore_meta_evaluate(
+    return _LIB.evocore_meta_evaluate(
         params._params, best_fitness, avg_fitness, diversity, generations
     )
 
 
+def meta_evaluate_many(params: Sequence[MetaParams], best_fitness, avg_fitness,
+                       diversity, generations) -> np.ndarray:
+    """
+    Evaluate meta-fitness of many parameter sets in a single C call.
+
+    Each metric may be a scalar or an array with one entry per
+    parameter set.
+
+    Args:
+        params: Parameter sets to evaluate
+        best_fitness: Best fitness achieved
+        avg_fitness: Average fitness
+        diversity: Population diversity
+        generations: Number of generations
+
+    Returns:
+        Array of meta-fitness scores
+
+    Raises:
+        ValueError: If a metric array does not broadcast to len(params)
+    """
+    n = len(params)
+    try:
+        best = np.broadcast_to(best_fitness, n)
+        avg = np.broadcast_to(avg_fitness, n)
+        div = np.broadcast_to(diversity, n)
+        gens = np.broadcast_to(generations, n)
+    except ValueError:
+        raise ValueError(
+            "metrics must be scalars or have one entry per parameter set"
+        ) from None
+
+    if n == 1:
+        return np.array([meta_evaluate(params[0], float(best[0]), float(avg[0]),
+                                       float(div[0]), int(gens[0]))])
+
+    best = np.ascontiguousarray(best, dtype=np.float64)
+    avg = np.ascontiguousarray(avg, dtype=np.float64)
+    div = np.ascontiguousarray(div, dtype=np.float64)
+    gens = np.ascontiguousarray(gens, dtype=np.intc)
+    out = np.empty(n, dtype=np.float64)
+
+    params_arr = _FFI.new("evocore_meta_params_t *[]", [p._params for p in params])
+    _LIB.evocore_meta_evaluate_many(
+        params_arr, n,
+        _FFI.from_buffer("double[]", best),
+        _FFI.from_buffer("double[]", avg),
+        _FFI.from_buffer("double[]", div),
+        _FFI.from_buffer("int[]", gens),
+        _FFI.from_buffer("double[]", out, require_writable=True),
+    )
+    return out
+
+
 def meta_learn_outcome(mutation_rate: float, exploration_factor: float,
                        fitness: float, learning_rate: float) -> None:
     """
@@ -308,8 +447,7 @@ def meta_learn_outcome(mutation_rate: float, exploration_factor: float,
         fitness: Resulting fitness
         learning_rate: Learning rate
     """
-    from .._evocore import lib
-    lib.evocore_meta_learn_outcome(mutation_rate, exploration_factor, fitness, learning_rate)
+    _LIB.evocore_meta_learn_outcome(mutation_rate, exploration_factor, fitness, learning_rate)
 
 
 def meta_get_learned_params(min_samples: int = 10) -> Optional[tuple]:
@@ -322,12 +460,12 @@ def meta_get_learned_params(min_samples: int = 10) -> Optional[tuple]:
     Returns:
         Tuple of (mutation_rate, exploration_factor) or None
     """
-    from .._evocore import ffi, lib
-
-    mut_rate = ffi.new("double *")
-    explore = ffi.new("double *")
+    try:
+        mut_rate, explore = _scratch.learned
+    except AttributeError:
+        mut_rate, explore = _scratch.learned = (_FFI.new("double *"), _FFI.new("double *"))
 
-    success = lib.evocore_meta_get_learned_params(mut_rate, explore, min_samples)
+    success = _LIB.evocore_meta_get_learned_params(mut_rate, explore, min_samples)
 
     if not success:
         return None
@@ -337,17 +475,18 @@ def meta_get_learned_params(min_samples: int = 10) -> Optional[tuple]:
 
 def meta_reset_learning() -> None:
     """Reset all learned parameters."""
-    from .._evocore import lib
-    lib.evocore_meta_reset_learning()
+    _LIB.evocore_meta_reset_learning()
 
 
 __all__ = [
+    'MetaIndividualSnapshot',
     'MetaIndividual',
     'MetaPopulation',
     'meta_adapt',
     'meta_suggest_mutation_rate',
     'meta_suggest_selection_pressure',
     'meta_evaluate',
+    'meta_evaluate_many',
     'meta_learn_outcome',
     'meta_get_learned_params',
     'meta_reset_learning',
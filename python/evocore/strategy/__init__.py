@@ -12,6 +12,7 @@ from .exploration import (
     Exploration,
     Bandit,
     boltzmann_select,
+    boltzmann_select_py,
     cool_temperature,
 )
 from .synthesis import (
@@ -30,6 +31,7 @@ __all__ = [
     'Exploration',
     'Bandit',
     'boltzmann_select',
+    'boltzmann_select_py',
     'cool_temperature',
     # Synthesis
     'SynthesisStrategy',
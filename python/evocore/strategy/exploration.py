@@ -6,9 +6,16 @@ Provides exploration rate scheduling and multi-armed bandit algorithms.
 
 from typing import Optional, List, Tuple
 from enum import IntEnum
+import math
+import weakref
 import numpy as np
 from ..utils.error import EvocoreError
 
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = None
+
 
 class ExploreStrategy(IntEnum):
     """Exploration strategy types."""
@@ -31,7 +38,7 @@ class Exploration:
         >>> rate = exp.update(generation=10, best_fitness=0.8)
     """
 
-    __slots__ = ('_exp', '_ffi', '_lib')
+    __slots__ = ('_exp', '_ffi', '_lib', '_seed', '_finalizer', '__weakref__')
 
     def __init__(self, strategy: ExploreStrategy, base_rate: float = 0.5,
                  *, _raw: bool = False):
@@ -47,25 +54,28 @@ class Exploration:
             self._exp = None
             self._ffi = None
             self._lib = None
+            self._seed = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
+        self._ffi = _FFI
+        self._lib = _LIB
+        self._seed = _FFI.new("unsigned int *")  # reused by should_explore*
 
-        self._exp = lib.evocore_exploration_create(int(strategy), base_rate)
-        if self._exp == ffi.NULL:
+        self._exp = _LIB.evocore_exploration_create(int(strategy), base_rate)
+        if self._exp == _FFI.NULL:
             raise EvocoreError("Failed to create exploration controller")
 
-    def __del__(self):
-        """Clean up exploration controller."""
-        if hasattr(self, '_exp') and self._exp is not None:
-            self._lib.evocore_exploration_free(self._exp)
+        self._finalizer = weakref.finalize(self, _LIB.evocore_exploration_free, self._exp)
 
     @property
     def strategy(self) -> ExploreStrategy:
         """Current exploration strategy."""
-        return ExploreStrategy(self._exp.strategy)
+        return ExploreStrategy._value2member_map_[self._exp.strategy]
+
+    @property
+    def strategy_int(self) -> int:
+        """Current exploration strategy as a raw integer."""
+        return self._exp.strategy
 
     @property
     def current_rate(self) -> float:
@@ -138,8 +148,53 @@ class Exploration:
         Returns:
             True if should explore
         """
-        seed_ptr = self._ffi.new("unsigned int *", seed if seed is not None else 0)
-        return self._lib.evocore_exploration_should_explore(self._exp, seed_ptr)
+        self._seed[0] = seed if seed is not None else 0
+        return self._lib.evocore_exploration_should_explore(self._exp, self._seed)
+
+    def should_explore_batch(self, n: int, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Make n explore decisions in a single call.
+
+        Equivalent to n calls of should_explore() sharing one RNG stream.
+
+        Args:
+            n: Number of decisions
+            seed: Optional random seed
+
+        Returns:
+            Boolean array of length n (True = explore)
+        """
+        out = np.empty(n, dtype=np.uint8)
+        if n > 0:
+            self._seed[0] = seed if seed is not None else 0
+            self._lib.evocore_exploration_should_explore_batch(
+                self._exp, self._ffi.cast("uint8_t *", out.ctypes.data), n, self._seed
+            )
+        return out.view(np.bool_)
+
+    def should_explore_packed(self, n: int, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Make n explore decisions packed 64 per word.
+
+        Decision i is bit i % 64 of word i // 64; unpack with
+        np.unpackbits(words.view(np.uint8), count=n, bitorder='little')
+        on little-endian hosts. Uses a different RNG stream than
+        should_explore_batch().
+
+        Args:
+            n: Number of decisions
+            seed: Optional random seed
+
+        Returns:
+            Array of (n + 63) // 64 uint64 words
+        """
+        out = np.empty((n + 63) // 64, dtype=np.uint64)
+        if n > 0:
+            self._seed[0] = seed if seed is not None else 0
+            self._lib.evocore_exploration_should_explore_packed(
+                self._exp, self._ffi.cast("uint64_t *", out.ctypes.data), n, self._seed
+            )
+        return out
 
     def is_stagnant(self, threshold: int = 10) -> bool:
         """
@@ -192,7 +247,8 @@ class Bandit:
         >>> bandit.update(arm, reward=0.8)
     """
 
-    __slots__ = ('_bandit', '_ffi', '_lib')
+    __slots__ = ('_bandit', '_ffi', '_lib', '_count_buf', '_mean_buf',
+                 '_finalizer', '__weakref__')
 
     def __init__(self, arm_count: int, ucb_c: float = 2.0, *, _raw: bool = False):
         """
@@ -207,20 +263,21 @@ class Bandit:
             self._bandit = None
             self._ffi = None
             self._lib = None
+            self._count_buf = None
+            self._mean_buf = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
+        self._ffi = _FFI
+        self._lib = _LIB
+        # Out-parameters reused by every get_stats()
+        self._count_buf = _FFI.new("size_t *")
+        self._mean_buf = _FFI.new("double *")
 
-        self._bandit = lib.evocore_bandit_create(arm_count, ucb_c)
-        if self._bandit == ffi.NULL:
+        self._bandit = _LIB.evocore_bandit_create(arm_count, ucb_c)
+        if self._bandit == _FFI.NULL:
             raise EvocoreError("Failed to create bandit")
 
-    def __del__(self):
-        """Clean up bandit."""
-        if hasattr(self, '_bandit') and self._bandit is not None:
-            self._lib.evocore_bandit_free(self._bandit)
+        self._finalizer = weakref.finalize(self, _LIB.evocore_bandit_free, self._bandit)
 
     @property
     def arm_count(self) -> int:
@@ -239,7 +296,7 @@ class Bandit:
         Returns:
             Selected arm index
         """
-        return self._lib.evocore_bandit_select_ucb(self._bandit)
+        return self._lib.evocore_bandit_select_ucb_cached(self._bandit)
 
     def update(self, arm: int, reward: float) -> None:
         """
@@ -251,6 +308,53 @@ class Bandit:
         """
         self._lib.evocore_bandit_update(self._bandit, arm, reward)
 
+    def select_batch(self, n: int) -> np.ndarray:
+        """
+        Select n arms using UCB1 in a single call.
+
+        Each selection counts as a pending pull for the rest of the batch,
+        so the arms are spread rather than repeated. Statistics are not
+        modified; report rewards with update_batch().
+
+        Args:
+            n: Number of arms to select
+
+        Returns:
+            Array of n selected arm indices
+        """
+        out = np.empty(n, dtype=np.uintp)
+        if n > 0:
+            self._lib.evocore_bandit_select_ucb_batch(
+                self._bandit, self._ffi.cast("size_t *", out.ctypes.data), n
+            )
+        return out
+
+    def update_batch(self, arms: np.ndarray, rewards: np.ndarray) -> None:
+        """
+        Update several arms in a single call.
+
+        Args:
+            arms: Arm indices
+            rewards: Observed rewards, one per arm index
+
+        Raises:
+            EvocoreError: If arms and rewards are not 1-D with equal length
+        """
+        # asarray first: ascontiguousarray would promote scalars to 1-D
+        arms = np.asarray(arms, dtype=np.uintp)
+        rewards = np.asarray(rewards, dtype=np.float64)
+        if arms.shape != rewards.shape or arms.ndim != 1:
+            raise EvocoreError("arms and rewards must be 1-D arrays of equal length")
+        arms = np.ascontiguousarray(arms)
+        rewards = np.ascontiguousarray(rewards)
+
+        self._lib.evocore_bandit_update_batch(
+            self._bandit,
+            self._ffi.cast("size_t *", arms.ctypes.data),
+            self._ffi.cast("double *", rewards.ctypes.data),
+            arms.size,
+        )
+
     def get_stats(self, arm: int) -> Tuple[int, float]:
         """
         Get statistics for an arm.
@@ -261,8 +365,8 @@ class Bandit:
         Returns:
             Tuple of (pull_count, mean_reward)
         """
-        count = self._ffi.new("size_t *")
-        mean = self._ffi.new("double *")
+        count = self._count_buf
+        mean = self._mean_buf
 
         success = self._lib.evocore_bandit_get_stats(self._bandit, arm, count, mean)
 
@@ -279,26 +383,109 @@ class Bandit:
         return f"Bandit(arms={self.arm_count}, pulls={self.total_pulls})"
 
 
+def boltzmann_select_py(values: np.ndarray, temperature: float, u: float) -> int:
+    """
+    Boltzmann selection kernel by inverse-CDF sampling.
+
+    Plain Python; boltzmann_select() compiles it with Numba on first use
+    when Numba is installed. Wrap it with numba.njit to call it from
+    jitted code. values must be a non-empty float64 array and temperature
+    positive.
+
+    Args:
+        values: Array of values to select from
+        temperature: Temperature parameter
+        u: Uniform random number in [0, 1)
+
+    Returns:
+        Selected index
+    """
+    m = values.max()
+    total = 0.0
+    for v in values:
+        total += math.exp((v - m) / temperature)
+
+    target = u * total
+    acc = 0.0
+    for i in range(values.size):
+        acc += math.exp((values[i] - m) / temperature)
+        if acc > target:
+            return i
+    return values.size - 1
+
+
+# Jitted kernel: None until first use, False when Numba is not installed
+_boltzmann_jit = None
+
+
+def _get_boltzmann_jit():
+    """Import Numba and compile the kernel on first use only."""
+    global _boltzmann_jit
+    if _boltzmann_jit is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional
+            _boltzmann_jit = False
+        else:
+            _boltzmann_jit = njit(fastmath=True)(boltzmann_select_py)
+    return _boltzmann_jit
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _seed_uniform(seed: int) -> float:
+    """Map a seed to a uniform draw in [0, 1) with one SplitMix64 step."""
+    z = (seed + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    z ^= z >> 31
+    return (z >> 11) * (1.0 / 9007199254740992.0)
+
+
 def boltzmann_select(values: np.ndarray, temperature: float,
-                     seed: Optional[int] = None) -> int:
+                     seed: Optional[int] = None, *, use_native: bool = True) -> int:
     """
     Select index using Boltzmann distribution.
 
+    By default the C implementation samples directly from the array
+    memory (no copy). With use_native=False the Python kernel is used
+    instead (JIT-compiled when Numba is installed); its draw depends only
+    on the seed, not on whether Numba is available. Temperatures below
+    0.001 select the maximum on both paths.
+
     Args:
         values: Array of values to select from
         temperature: Temperature parameter
-        seed: Optional random seed
+        seed: Optional random seed (None behaves as seed 0)
+        use_native: Sample with the C implementation
 
     Returns:
         Selected index
     """
-    from .._evocore import ffi, lib
-
     values = np.asarray(values, dtype=np.float64)
-    values_arr = ffi.new("double[]", values.tolist())
-    seed_ptr = ffi.new("unsigned int *", seed if seed is not None else 0)
+    if seed is None:
+        seed = 0
+
+    if use_native:
+        values = np.ascontiguousarray(values)
+        values_arr = _FFI.cast("double *", values.ctypes.data)
+        seed_ptr = _FFI.new("unsigned int *", seed)
+        return _LIB.evocore_boltzmann_select(values_arr, values.size, temperature, seed_ptr)
+
+    if values.size == 0:
+        return 0
+    if temperature < 0.001:
+        return int(np.argmax(values))
+
+    u = _seed_uniform(seed)
+    kernel = _get_boltzmann_jit()
+    if kernel:
+        return int(kernel(values, temperature, u))
 
-    return lib.evocore_boltzmann_select(values_arr, len(values), temperature, seed_ptr)
+    weights = np.cumsum(np.exp((values - values.max()) / temperature))
+    index = int(np.searchsorted(weights, u * weights[-1], side='right'))
+    return min(index, values.size - 1)
 
 
 def cool_temperature(temperature: float, cooling_rate: float) -> float:
@@ -312,8 +499,7 @@ def cool_temperature(temperature: float, cooling_rate: float) -> float:
     Returns:
         New temperature
     """
-    from .._evocore import lib
-    return lib.evocore_cool_temperature(temperature, cooling_rate)
+    return _LIB.evocore_cool_temperature(temperature, cooling_rate)
 
 
 __all__ = [
@@ -321,5 +507,6 @@ __all__ = [
     'Exploration',
     'Bandit',
     'boltzmann_select',
+    'boltzmann_select_py',
     'cool_temperature',
 ]
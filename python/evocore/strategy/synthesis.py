@@ -6,8 +6,21 @@ Provides parameter synthesis from multiple sources.
 
 from typing import Optional, List, Tuple
 from enum import IntEnum
+import weakref
 import numpy as np
-from ..utils.error import check_error, EvocoreError
+from ..utils.error import check_error, EvocoreError, EvocoreInvalidArgumentError
+
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+    # Unrolled distance kernels for common parameter counts
+    _SPECIALIZED = {
+        4: _LIB.evocore_param_distance_4,
+        8: _LIB.evocore_param_distance_8,
+        16: _LIB.evocore_param_distance_16,
+    }
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = None
+    _SPECIALIZED = {}
 
 
 class SynthesisStrategy(IntEnum):
@@ -34,7 +47,8 @@ class SynthesisRequest:
         >>> result, confidence = req.execute()
     """
 
-    __slots__ = ('_request', '_ffi', '_lib')
+    __slots__ = ('_request', '_ffi', '_lib', '_out_confidence', '_seed',
+                 '_finalizer', '__weakref__')
 
     def __init__(self, strategy: SynthesisStrategy, param_count: int,
                  source_count: int, *, _raw: bool = False):
@@ -51,27 +65,33 @@ class SynthesisRequest:
             self._request = None
             self._ffi = None
             self._lib = None
+            self._out_confidence = None
+            self._seed = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
+        self._ffi = _FFI
+        self._lib = _LIB
+        # Out-parameters reused by every execute()
+        self._out_confidence = _FFI.new("double *")
+        self._seed = _FFI.new("unsigned int *")
 
-        self._request = lib.evocore_synthesis_request_create(
+        self._request = _LIB.evocore_synthesis_request_create(
             int(strategy), param_count, source_count
         )
-        if self._request == ffi.NULL:
+        if self._request == _FFI.NULL:
             raise EvocoreError("Failed to create synthesis request")
 
-    def __del__(self):
-        """Clean up synthesis request."""
-        if hasattr(self, '_request') and self._request is not None:
-            self._lib.evocore_synthesis_request_free(self._request)
+        self._finalizer = weakref.finalize(self, _LIB.evocore_synthesis_request_free, self._request)
 
     @property
     def strategy(self) -> SynthesisStrategy:
         """Synthesis strategy."""
-        return SynthesisStrategy(self._request.strategy)
+        return SynthesisStrategy._value2member_map_[self._request.strategy]
+
+    @property
+    def strategy_int(self) -> int:
+        """Synthesis strategy as a raw integer."""
+        return self._request.strategy
 
     @property
     def param_count(self) -> int:
@@ -117,8 +137,8 @@ class SynthesisRequest:
         Returns:
             True if successful
         """
-        params = np.asarray(parameters, dtype=np.float64)
-        params_arr = self._ffi.new("double[]", params.tolist())
+        params = np.ascontiguousarray(parameters, dtype=np.float64)
+        params_arr = self._ffi.cast("double *", params.ctypes.data)
 
         ctx_id = context_id.encode() if context_id else self._ffi.NULL
 
@@ -136,19 +156,18 @@ class SynthesisRequest:
         Returns:
             Tuple of (synthesized_parameters, confidence)
         """
-        out_params = self._ffi.new("double[]", self.param_count)
-        out_confidence = self._ffi.new("double *")
-        seed_ptr = self._ffi.new("unsigned int *", seed if seed is not None else 0)
+        params = np.empty(self.param_count, dtype=np.float64)
+        out_params = self._ffi.cast("double *", params.ctypes.data)
+        self._seed[0] = seed if seed is not None else 0
 
         success = self._lib.evocore_synthesis_execute(
-            self._request, out_params, out_confidence, seed_ptr
+            self._request, out_params, self._out_confidence, self._seed
         )
 
         if not success:
             raise EvocoreError("Synthesis execution failed")
 
-        params = np.array([out_params[i] for i in range(self.param_count)])
-        return params, out_confidence[0]
+        return params, self._out_confidence[0]
 
     def validate(self) -> bool:
         """
@@ -171,7 +190,8 @@ class SimilarityMatrix:
     Tracks pairwise similarity between contexts for transfer learning.
     """
 
-    __slots__ = ('_matrix', '_ffi', '_lib', '_context_ids')
+    __slots__ = ('_matrix', '_ffi', '_lib', '_context_ids', '_ctx_bufs', '_index',
+                 '_view', '_finalizer', '__weakref__')
 
     def __init__(self, context_ids: List[str], *, _raw: bool = False):
         """
@@ -186,31 +206,40 @@ class SimilarityMatrix:
             self._ffi = None
             self._lib = None
             self._context_ids = []
+            self._ctx_bufs = None
+            self._index = {}
+            self._view = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
+        self._ffi = _FFI
+        self._lib = _LIB
         self._context_ids = context_ids.copy()
+        # Resolve IDs to matrix indices once instead of per call
+        self._index = {ctx_id: i for i, ctx_id in enumerate(context_ids)}
 
         # Build context ID array
-        ctx_array = ffi.new("char*[]", len(context_ids))
+        ctx_array = _FFI.new("char*[]", len(context_ids))
         ctx_bufs = []
         for i, ctx_id in enumerate(context_ids):
-            buf = ffi.new("char[]", ctx_id.encode())
+            buf = _FFI.new("char[]", ctx_id.encode())
             ctx_bufs.append(buf)
             ctx_array[i] = buf
 
-        self._ctx_bufs = ctx_bufs  # Keep reference
-        self._matrix = lib.evocore_similarity_matrix_create(len(context_ids), ctx_array)
+        # The C matrix borrows both the array and the strings
+        self._ctx_bufs = (ctx_array, ctx_bufs)
+        self._matrix = _LIB.evocore_similarity_matrix_create(len(context_ids), ctx_array)
 
-        if self._matrix == ffi.NULL:
+        if self._matrix == _FFI.NULL:
             raise EvocoreError("Failed to create similarity matrix")
 
-    def __del__(self):
-        """Clean up similarity matrix."""
-        if hasattr(self, '_matrix') and self._matrix is not None:
-            self._lib.evocore_similarity_matrix_free(self._matrix)
+        self._finalizer = weakref.finalize(self, _LIB.evocore_similarity_matrix_free, self._matrix)
+
+        # Zero-copy K x K view of the C matrix for reads
+        count = len(context_ids)
+        data = _LIB.evocore_similarity_matrix_data(self._matrix)
+        self._view = np.frombuffer(
+            _FFI.buffer(data, count * count * _FFI.sizeof("double")), dtype=np.float64
+        ).reshape(count, count)
 
     @property
     def context_count(self) -> int:
@@ -229,6 +258,11 @@ class SimilarityMatrix:
         Returns:
             True if successful
         """
+        index = self._index
+        if context_a in index and context_b in index:
+            return self._lib.evocore_similarity_update_idx(
+                self._matrix, index[context_a], index[context_b], similarity
+            )
         return self._lib.evocore_similarity_update(
             self._matrix, context_a.encode(), context_b.encode(), similarity
         )
@@ -244,6 +278,9 @@ class SimilarityMatrix:
         Returns:
             Similarity value
         """
+        index = self._index
+        if context_a in index and context_b in index:
+            return float(self._view[index[context_a], index[context_b]])
         return self._lib.evocore_similarity_get(
             self._matrix, context_a.encode(), context_b.encode()
         )
@@ -258,12 +295,12 @@ class SimilarityMatrix:
         Returns:
             Most similar context ID or None
         """
-        result = self._lib.evocore_similarity_find_nearest(
-            self._matrix, target_context.encode()
-        )
-        if result == self._ffi.NULL:
+        target = self._index.get(target_context)
+        if target is None or len(self._context_ids) < 2:
             return None
-        return self._ffi.string(result).decode()
+        row = self._view[target].copy()
+        row[target] = -np.inf  # a context is not its own neighbour
+        return self._context_ids[int(row.argmax())]
 
     def __repr__(self) -> str:
         return f"SimilarityMatrix(contexts={self.context_count})"
@@ -279,19 +316,30 @@ def param_distance(params1: np.ndarray, params2: np.ndarray) -> float:
 
     Returns:
         Distance value
-    """
-    from .._evocore import ffi, lib
 
+    Raises:
+        EvocoreInvalidArgumentError: If either array is not 1-D
+        ValueError: If the arrays differ in length
+    """
+    # asarray first: ascontiguousarray would promote a 0-d input to 1-D
     p1 = np.asarray(params1, dtype=np.float64)
     p2 = np.asarray(params2, dtype=np.float64)
 
+    if p1.ndim != 1 or p2.ndim != 1:
+        raise EvocoreInvalidArgumentError("Parameter arrays must be 1-D")
     if len(p1) != len(p2):
         raise ValueError("Parameter arrays must have same length")
 
-    arr1 = ffi.new("double[]", p1.tolist())
-    arr2 = ffi.new("double[]", p2.tolist())
+    p1 = np.ascontiguousarray(p1)
+    p2 = np.ascontiguousarray(p2)
+
+    arr1 = _FFI.cast("double *", p1.ctypes.data)
+    arr2 = _FFI.cast("double *", p2.ctypes.data)
 
-    return lib.evocore_param_distance(arr1, arr2, len(p1))
+    fixed = _SPECIALIZED.get(len(p1))
+    if fixed is not None:
+        return fixed(arr1, arr2)
+    return _LIB.evocore_param_distance(arr1, arr2, len(p1))
 
 
 def param_similarity(params1: np.ndarray, params2: np.ndarray,
@@ -306,19 +354,27 @@ def param_similarity(params1: np.ndarray, params2: np.ndarray,
 
     Returns:
         Similarity value (0.0 to 1.0)
-    """
-    from .._evocore import ffi, lib
 
+    Raises:
+        EvocoreInvalidArgumentError: If either array is not 1-D
+        ValueError: If the arrays differ in length
+    """
+    # asarray first: ascontiguousarray would promote a 0-d input to 1-D
     p1 = np.asarray(params1, dtype=np.float64)
     p2 = np.asarray(params2, dtype=np.float64)
 
+    if p1.ndim != 1 or p2.ndim != 1:
+        raise EvocoreInvalidArgumentError("Parameter arrays must be 1-D")
     if len(p1) != len(p2):
         raise ValueError("Parameter arrays must have same length")
 
-    arr1 = ffi.new("double[]", p1.tolist())
-    arr2 = ffi.new("double[]", p2.tolist())
+    p1 = np.ascontiguousarray(p1)
+    p2 = np.ascontiguousarray(p2)
 
-    return lib.evocore_param_similarity(arr1, arr2, len(p1), max_distance)
+    arr1 = _FFI.cast("double *", p1.ctypes.data)
+    arr2 = _FFI.cast("double *", p2.ctypes.data)
+
+    return _LIB.evocore_param_similarity(arr1, arr2, len(p1), max_distance)
 
 
 def transfer_params(source_params: np.ndarray, source_context: str,
@@ -337,21 +393,27 @@ def transfer_params(source_params: np.ndarray, source_context: str,
     Returns:
         Transferred parameters or None if failed
     """
-    from .._evocore import ffi, lib
-
-    params = np.asarray(source_params, dtype=np.float64)
-    params_arr = ffi.new("double[]", params.tolist())
-    out_params = ffi.new("double[]", len(params))
-
-    success = lib.evocore_transfer_params(
-        params_arr, source_context.encode(), target_context.encode(),
-        similarity_matrix._matrix, len(params), out_params, adjustment_factor
-    )
+    params = np.ascontiguousarray(source_params, dtype=np.float64)
+    params_arr = _FFI.cast("double *", params.ctypes.data)
+    result = np.empty(len(params), dtype=np.float64)
+    out_params = _FFI.cast("double *", result.ctypes.data)
+
+    index = similarity_matrix._index
+    if source_context in index and target_context in index:
+        success = _LIB.evocore_transfer_params_idx(
+            params_arr, index[source_context], index[target_context],
+            similarity_matrix._matrix, len(params), out_params, adjustment_factor
+        )
+    else:
+        success = _LIB.evocore_transfer_params(
+            params_arr, source_context.encode(), target_context.encode(),
+            similarity_matrix._matrix, len(params), out_params, adjustment_factor
+        )
 
     if not success:
         return None
 
-    return np.array([out_params[i] for i in range(len(params))])
+    return result
 
 
 def synthesis_strategy_name(strategy: SynthesisStrategy) -> str:
@@ -364,11 +426,10 @@ def synthesis_strategy_name(strategy: SynthesisStrategy) -> str:
     Returns:
         Strategy name
     """
-    from .._evocore import ffi, lib
-    ptr = lib.evocore_synthesis_strategy_name(int(strategy))
-    if ptr == ffi.NULL:
+    ptr = _LIB.evocore_synthesis_strategy_name(int(strategy))
+    if ptr == _FFI.NULL:
         return "unknown"
-    return ffi.string(ptr).decode()
+    return _FFI.string(ptr).decode()
 
 
 __all__ = [
@@ -6,8 +6,12 @@ Provides configuration file loading and access.
 
 from typing import Optional, Dict, Any, List
 from enum import IntEnum
+import weakref
 from .error import check_error, EvocoreError
 
+# Strings accepted as true by ConfigEntry.as_bool()
+_TRUE = frozenset(('true', '1', 'yes', 'on'))
+
 
 class ConfigType(IntEnum):
     """Configuration value types."""
@@ -45,7 +49,7 @@ class ConfigEntry:
 
     def as_bool(self) -> bool:
         """Get value as boolean."""
-        return self.value.lower() in ('true', '1', 'yes', 'on')
+        return self.value.lower() in _TRUE
 
     def __repr__(self) -> str:
         return f"ConfigEntry(key='{self.key}', value='{self.value}', type={self.type.name})"
@@ -63,7 +67,7 @@ class Config:
         >>> rate = config.get_double("evolution", "mutation_rate", 0.01)
     """
 
-    __slots__ = ('_config', '_ffi', '_lib')
+    __slots__ = ('_config', '_ffi', '_lib', '_cache', '_enc', '_finalizer', '__weakref__')
 
     def __init__(self, *, _raw: bool = False):
         """
@@ -72,6 +76,10 @@ class Config:
         Args:
             _raw: Internal flag for alternative construction
         """
+        # A loaded config is read-only, so lookups can be memoized
+        self._cache: Dict[tuple, Any] = {}
+        self._enc: Dict[str, bytes] = {}
+
         if _raw:
             self._config = None
             self._ffi = None
@@ -82,11 +90,6 @@ class Config:
         self._ffi = None
         self._lib = None
 
-    def __del__(self):
-        """Clean up configuration."""
-        if hasattr(self, '_config') and self._config is not None:
-            self._lib.evocore_config_free(self._config)
-
     @classmethod
     def load(cls, path: str) -> "Config":
         """
@@ -108,9 +111,17 @@ class Config:
         obj._config = config_ptr[0]
         obj._ffi = ffi
         obj._lib = lib
+        obj._finalizer = weakref.finalize(obj, lib.evocore_config_free, obj._config)
 
         return obj
 
+    def _encode(self, name: str) -> bytes:
+        """Encode a section or key name, reusing earlier encodings."""
+        encoded = self._enc.get(name)
+        if encoded is None:
+            encoded = self._enc[name] = name.encode()
+        return encoded
+
     def get_string(self, section: str, key: str, default: str = "") -> str:
         """
         Get string value.
@@ -123,12 +134,18 @@ class Config:
         Returns:
             String value
         """
+        cache_key = (section, key, str, default)
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+
         result = self._lib.evocore_config_get_string(
-            self._config, section.encode(), key.encode(), default.encode()
+            self._config, self._encode(section), self._encode(key), default.encode()
         )
-        if result == self._ffi.NULL:
-            return default
-        return self._ffi.string(result).decode()
+        value = default if result == self._ffi.NULL else self._ffi.string(result).decode()
+        self._cache[cache_key] = value
+        return value
 
     def get_int(self, section: str, key: str, default: int = 0) -> int:
         """
@@ -142,9 +159,16 @@ class Config:
         Returns:
             Integer value
         """
-        return self._lib.evocore_config_get_int(
-            self._config, section.encode(), key.encode(), default
+        cache_key = (section, key, int, default)
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+
+        value = self._cache[cache_key] = self._lib.evocore_config_get_int(
+            self._config, self._encode(section), self._encode(key), default
         )
+        return value
 
     def get_double(self, section: str, key: str, default: float = 0.0) -> float:
         """
@@ -158,9 +182,16 @@ class Config:
         Returns:
             Float value
         """
-        return self._lib.evocore_config_get_double(
-            self._config, section.encode(), key.encode(), default
+        cache_key = (section, key, float, default)
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+
+        value = self._cache[cache_key] = self._lib.evocore_config_get_double(
+            self._config, self._encode(section), self._encode(key), default
         )
+        return value
 
     def get_bool(self, section: str, key: str, default: bool = False) -> bool:
         """
@@ -174,9 +205,16 @@ class Config:
         Returns:
             Boolean value
         """
-        return self._lib.evocore_config_get_bool(
-            self._config, section.encode(), key.encode(), default
+        cache_key = (section, key, bool, default)
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+
+        value = self._cache[cache_key] = self._lib.evocore_config_get_bool(
+            self._config, self._encode(section), self._encode(key), default
         )
+        return value
 
     def has_key(self, section: str, key: str) -> bool:
         """
@@ -190,7 +228,7 @@ class Config:
             True if key exists
         """
         return self._lib.evocore_config_has_key(
-            self._config, section.encode(), key.encode()
+            self._config, self._encode(section), self._encode(key)
         )
 
     def section_size(self, section: str) -> int:
@@ -203,7 +241,7 @@ class Config:
         Returns:
             Number of entries
         """
-        return self._lib.evocore_config_section_size(self._config, section.encode())
+        return self._lib.evocore_config_section_size(self._config, self._encode(section))
 
     def get_entry(self, section: str, index: int) -> Optional[ConfigEntry]:
         """
@@ -217,7 +255,7 @@ class Config:
             ConfigEntry or None
         """
         entry_ptr = self._lib.evocore_config_get_entry(
-            self._config, section.encode(), index
+            self._config, self._encode(section), index
         )
         if entry_ptr == self._ffi.NULL:
             return None
@@ -238,13 +276,19 @@ class Config:
         Returns:
             Dictionary of key-value pairs
         """
-        result = {}
         size = self.section_size(section)
-        for i in range(size):
-            entry = self.get_entry(section, i)
-            if entry:
-                result[entry.key] = entry.value
-        return result
+        if size == 0:
+            return {}
+
+        ffi = self._ffi
+        keys = ffi.new("const char *[]", size)
+        values = ffi.new("const char *[]", size)
+        n = self._lib.evocore_config_get_section_bulk(
+            self._config, self._encode(section), keys, values, ffi.NULL, size
+        )
+
+        string = ffi.string
+        return {string(keys[i]).decode(): string(values[i]).decode() for i in range(n)}
 
     def __repr__(self) -> str:
         return f"Config(loaded={self._config is not None})"
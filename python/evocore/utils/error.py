@@ -6,6 +6,11 @@ Provides exception classes and error checking utilities.
 
 from typing import Optional
 
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = None
+
 
 class EvocoreError(Exception):
     """Base exception for evocore errors."""
@@ -70,11 +75,44 @@ _ERROR_MAP = {
     -42: (EvocoreFileError, "File write error"),
 }
 
-
-def check_error(code: int, lib=None) -> None:
+# Flat table indexed by -code, None where no mapping exists
+_ERROR_TABLE = [None] * (1 - min(_ERROR_MAP))
+for _code, _entry in _ERROR_MAP.items():
+    _ERROR_TABLE[-_code] = _entry
+_ERROR_TABLE = tuple(_ERROR_TABLE)
+del _code, _entry
+
+
+def _c_error_string(code: int, lib) -> Optional[str]:
+    """Fetch the C library's message for an error code."""
+    try:
+        msg_ptr = lib.evocore_error_string(code)
+        if msg_ptr != _FFI.NULL:
+            return _FFI.string(msg_ptr).decode('utf-8')
+    except Exception:
+        pass
+    return None
+
+
+# C messages for every tabled code, decoded once so the error path does
+# not cross the FFI boundary
+if _LIB is not None:
+    _MESSAGE_TABLE = tuple(
+        _c_error_string(-idx, _LIB) if idx else None
+        for idx in range(len(_ERROR_TABLE))
+    )
+else:
+    _MESSAGE_TABLE = (None,) * len(_ERROR_TABLE)
+
+
+def check_error(code: int, lib=None, _table=_ERROR_TABLE,
+                _messages=_MESSAGE_TABLE) -> None:
     """
     Check error code and raise appropriate exception if error.
 
+    Hot call sites may test ``code < 0`` themselves and only call this
+    on failure.
+
     Args:
         code: Error code from C function
         lib: Optional cffi lib object for error string lookup
@@ -86,20 +124,17 @@ def check_error(code: int, lib=None) -> None:
     if code >= 0:
         return
 
-    # Try to get error string from library
-    message = None
-    if lib is not None:
-        try:
-            from .._evocore import ffi
-            msg_ptr = lib.evocore_error_string(code)
-            if msg_ptr != ffi.NULL:
-                message = ffi.string(msg_ptr).decode('utf-8')
-        except Exception:
-            pass
-
-    # Look up in our error map
-    if code in _ERROR_MAP:
-        exc_class, default_msg = _ERROR_MAP[code]
+    idx = -code
+    if idx < len(_table):
+        entry = _table[idx]
+        # Error string from the library, pre-decoded at import
+        message = _messages[idx] if lib is not None else None
+    else:
+        entry = None
+        message = _c_error_string(code, lib) if lib is not None and _FFI is not None else None
+
+    if entry is not None:
+        exc_class, default_msg = entry
         raise exc_class(message or default_msg, code)
 
     # Unknown error
@@ -4,8 +4,14 @@ Logging utilities for evocore Python bindings.
 Controls the evocore C library logging.
 """
 
+import os
 from enum import IntEnum
 
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = None
+
 
 class LogLevel(IntEnum):
     """Logging levels."""
@@ -17,15 +23,19 @@ class LogLevel(IntEnum):
     FATAL = 5
 
 
-def set_level(level: LogLevel) -> None:
+# Members indexed by value, for get_level() without an Enum call
+_LEVELS = tuple(LogLevel)
+
+
+def set_level(level: int) -> None:
     """
     Set logging level.
 
     Args:
-        level: Minimum level to log
+        level: Minimum level to log; a LogLevel or its plain int value
     """
-    from .._evocore import lib
-    lib.evocore_log_set_level(int(level))
+    # LogLevel is an int subclass, so cffi takes it as-is
+    _LIB.evocore_log_set_level(level)
 
 
 def get_level() -> LogLevel:
@@ -35,8 +45,7 @@ def get_level() -> LogLevel:
     Returns:
         Current log level
     """
-    from .._evocore import lib
-    return LogLevel(lib.evocore_log_get_level())
+    return _LEVELS[_LIB.evocore_log_get_level()]
 
 
 def set_file(path: str, enabled: bool = True) -> bool:
@@ -50,8 +59,7 @@ def set_file(path: str, enabled: bool = True) -> bool:
     Returns:
         True if successful
     """
-    from .._evocore import lib
-    return lib.evocore_log_set_file(enabled, path.encode())
+    return _LIB.evocore_log_set_file(enabled, os.fsencode(path))
 
 
 def set_color(enabled: bool) -> None:
@@ -61,14 +69,12 @@ def set_color(enabled: bool) -> None:
     Args:
         enabled: Enable colors
     """
-    from .._evocore import lib
-    lib.evocore_log_set_color(enabled)
+    _LIB.evocore_log_set_color(enabled)
 
 
 def close() -> None:
     """Close log file if open."""
-    from .._evocore import lib
-    lib.evocore_log_close()
+    _LIB.evocore_log_close()
 
 
 __all__ = ['LogLevel', 'set_level', 'get_level', 'set_file', 'set_color', 'close']
@@ -4,11 +4,20 @@ Persistence utilities for evocore Python bindings.
 Provides checkpointing and serialization.
 """
 
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+import os
+import struct
+import weakref
+from typing import Optional, List, Dict, Any, Union, TYPE_CHECKING
 from enum import IntEnum
 from datetime import datetime
+from functools import lru_cache
 from .error import check_error, EvocoreError
 
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = None
+
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
     from ..core.genome import Genome
@@ -17,6 +26,73 @@ if TYPE_CHECKING:
     from ..meta.population import MetaPopulation
 
 
+PathType = Union[str, bytes, "os.PathLike[str]"]
+
+
+@lru_cache(maxsize=64)
+def _encode_str_path(path: Union[str, bytes]) -> bytes:
+    """Encode a str/bytes path once; cffi passes bytes as char* directly."""
+    return os.fsencode(path)
+
+
+def _encode_path(path: PathType) -> bytes:
+    """Encode a filesystem path, caching only str and bytes inputs."""
+    if isinstance(path, (str, bytes)):
+        return _encode_str_path(path)
+    # Other PathLike objects may be unhashable or change their __fspath__()
+    return os.fsencode(path)
+
+
+# Leading fields of evocore_checkpoint_t: version[16], timestamp,
+# population_size, population_capacity, generation, best_fitness, avg_fitness
+_CHECKPOINT_HEAD = struct.Struct('@16sd3N2d')
+
+
+# Freelists of per-call scratch cdata. list.pop() is atomic, so a popped
+# entry is owned by one caller until it is returned; an empty pool raises
+# IndexError (never test-then-pop, another thread may empty it in between).
+_SCRATCH_POOL_MAX = 8
+_LIST_OUT_POOL: List[Any] = []
+_PEEK_POOL: List[Any] = []
+
+
+def _get_list_out():
+    """Take an (out_len, out_count) pair for evocore_checkpoint_list_packed."""
+    try:
+        return _LIST_OUT_POOL.pop()
+    except IndexError:
+        return _FFI.new("size_t *"), _FFI.new("int *")
+
+
+def _get_peek_out():
+    """Take a checkpoint struct for evocore_checkpoint_peek."""
+    try:
+        return _PEEK_POOL.pop()
+    except IndexError:
+        return _FFI.new("evocore_checkpoint_t *")
+
+
+def _release(pool: List[Any], item: Any) -> None:
+    """Return scratch cdata to its freelist."""
+    if len(pool) < _SCRATCH_POOL_MAX:
+        pool.append(item)
+
+
+def _checkpoint_head_info(checkpoint_ptr) -> Dict[str, Any]:
+    """Build checkpoint_info() output from a single read of the struct prefix."""
+    (version, timestamp, population_size, _capacity, generation,
+     best_fitness, avg_fitness) = _CHECKPOINT_HEAD.unpack_from(
+        _FFI.buffer(checkpoint_ptr, _CHECKPOINT_HEAD.size))
+    return {
+        'version': version.split(b'\0', 1)[0].decode(),
+        'timestamp': datetime.fromtimestamp(int(timestamp)),
+        'generation': generation,
+        'population_size': population_size,
+        'best_fitness': best_fitness,
+        'avg_fitness': avg_fitness,
+    }
+
+
 class SerialFormat(IntEnum):
     """Serialization formats."""
     JSON = 0      # EVOCORE_SERIAL_FORMAT_JSON
@@ -24,6 +100,10 @@ class SerialFormat(IntEnum):
     MSGPACK = 2   # EVOCORE_SERIAL_FORMAT_MSGPACK
 
 
+# Members indexed by value, avoiding an Enum call per lookup
+_SERIAL_FORMATS = tuple(SerialFormat)
+
+
 class SerialOptions:
     """
     Serialization options.
@@ -32,7 +112,7 @@ class SerialOptions:
         >>> opts = SerialOptions(format=SerialFormat.JSON, pretty_print=True)
     """
 
-    __slots__ = ('format', 'include_metadata', 'pretty_print', 'compression_level')
+    __slots__ = ('_c',)
 
     def __init__(self, format: SerialFormat = SerialFormat.JSON,
                  include_metadata: bool = True,
@@ -47,19 +127,52 @@ class SerialOptions:
             pretty_print: Pretty print JSON output
             compression_level: Compression level (0=none)
         """
+        # Fields live directly in the C struct handed to every save call
+        self._c = _FFI.new("evocore_serial_options_t *")
         self.format = format
         self.include_metadata = include_metadata
         self.pretty_print = pretty_print
         self.compression_level = compression_level
 
-    def _to_c(self, ffi):
-        """Convert to C struct."""
-        opts = ffi.new("evocore_serial_options_t *")
-        opts.format = int(self.format)
-        opts.include_metadata = self.include_metadata
-        opts.pretty_print = self.pretty_print
-        opts.compression_level = self.compression_level
-        return opts
+    @property
+    def format(self) -> SerialFormat:
+        """Serialization format."""
+        return _SERIAL_FORMATS[self._c.format]
+
+    @format.setter
+    def format(self, value: SerialFormat) -> None:
+        self._c.format = value
+
+    @property
+    def include_metadata(self) -> bool:
+        """Include metadata in output."""
+        return self._c.include_metadata
+
+    @include_metadata.setter
+    def include_metadata(self, value: bool) -> None:
+        self._c.include_metadata = value
+
+    @property
+    def pretty_print(self) -> bool:
+        """Pretty print JSON output."""
+        return self._c.pretty_print
+
+    @pretty_print.setter
+    def pretty_print(self, value: bool) -> None:
+        self._c.pretty_print = value
+
+    @property
+    def compression_level(self) -> int:
+        """Compression level (0=none)."""
+        return self._c.compression_level
+
+    @compression_level.setter
+    def compression_level(self, value: int) -> None:
+        self._c.compression_level = value
+
+    def _to_c(self):
+        """Return the backing C struct."""
+        return self._c
 
 
 class Checkpoint:
@@ -72,23 +185,23 @@ class Checkpoint:
         >>> restored = Checkpoint.load("checkpoint.json")
     """
 
-    __slots__ = ('_checkpoint', '_ffi', '_lib')
+    __slots__ = ('_checkpoint', '_save_fn', '_restore_fn', '_timestamp',
+                 '_finalizer', '__weakref__')
+
+    _ffi = _FFI
+    _lib = _LIB
 
     def __init__(self, *, _raw: bool = False):
+        self._save_fn = _LIB.evocore_checkpoint_save
+        self._restore_fn = _LIB.evocore_checkpoint_restore
+        self._timestamp = None
+
         if _raw:
             self._checkpoint = None
-            self._ffi = None
-            self._lib = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
-        self._checkpoint = ffi.new("evocore_checkpoint_t *")
-
-    def __del__(self):
-        if hasattr(self, '_checkpoint') and self._checkpoint is not None:
-            self._lib.evocore_checkpoint_free(self._checkpoint)
+        self._checkpoint = _FFI.new("evocore_checkpoint_t *")
+        self._finalizer = weakref.finalize(self, _LIB.evocore_checkpoint_free, self._checkpoint)
 
     @property
     def version(self) -> str:
@@ -98,7 +211,11 @@ class Checkpoint:
     @property
     def timestamp(self) -> datetime:
         """Checkpoint creation time."""
-        return datetime.fromtimestamp(int(self._checkpoint.timestamp))
+        # Fixed once the checkpoint has been created or loaded
+        ts = self._timestamp
+        if ts is None:
+            ts = self._timestamp = datetime.fromtimestamp(int(self._checkpoint.timestamp))
+        return ts
 
     @property
     def population_size(self) -> int:
@@ -134,21 +251,20 @@ class Checkpoint:
         Returns:
             New Checkpoint
         """
-        from .._evocore import ffi, lib
-
         checkpoint = cls()
 
-        domain_ptr = domain._domain if domain else ffi.NULL
-        meta_ptr = meta_pop._meta_pop if meta_pop else ffi.NULL
+        domain_ptr = domain._domain if domain else _FFI.NULL
+        meta_ptr = meta_pop._meta_pop if meta_pop else _FFI.NULL
 
-        err = lib.evocore_checkpoint_create(
+        err = _LIB.evocore_checkpoint_create(
             checkpoint._checkpoint, population._pop, domain_ptr, meta_ptr
         )
-        check_error(err, lib)
+        if err < 0:
+            check_error(err, _LIB)
 
         return checkpoint
 
-    def save(self, filepath: str, options: Optional[SerialOptions] = None) -> None:
+    def save(self, filepath: PathType, options: Optional[SerialOptions] = None) -> None:
         """
         Save checkpoint to file.
 
@@ -156,14 +272,15 @@ class Checkpoint:
             filepath: Path to save to
             options: Serialization options
         """
-        opts = options._to_c(self._ffi) if options else self._ffi.NULL
-        err = self._lib.evocore_checkpoint_save(
-            self._checkpoint, filepath.encode(), opts
+        opts = options._to_c() if options else _FFI.NULL
+        err = self._save_fn(
+            self._checkpoint, _encode_path(filepath), opts
         )
-        check_error(err, self._lib)
+        if err < 0:
+            check_error(err, _LIB)
 
     @classmethod
-    def load(cls, filepath: str) -> "Checkpoint":
+    def load(cls, filepath: PathType) -> "Checkpoint":
         """
         Load checkpoint from file.
 
@@ -173,11 +290,10 @@ class Checkpoint:
         Returns:
             Loaded Checkpoint
         """
-        from .._evocore import ffi, lib
-
         checkpoint = cls()
-        err = lib.evocore_checkpoint_load(filepath.encode(), checkpoint._checkpoint)
-        check_error(err, lib)
+        err = _LIB.evocore_checkpoint_load(_encode_path(filepath), checkpoint._checkpoint)
+        if err < 0:
+            check_error(err, _LIB)
 
         return checkpoint
 
@@ -195,10 +311,11 @@ class Checkpoint:
         domain_ptr = domain._domain if domain else self._ffi.NULL
         meta_ptr = meta_pop._meta_pop if meta_pop else self._ffi.NULL
 
-        err = self._lib.evocore_checkpoint_restore(
+        err = self._restore_fn(
             self._checkpoint, population._pop, domain_ptr, meta_ptr
         )
-        check_error(err, self._lib)
+        if err < 0:
+            check_error(err, _LIB)
 
     def __repr__(self) -> str:
         return (f"Checkpoint(generation={self.generation}, "
@@ -216,9 +333,12 @@ class CheckpointManager:
         >>> manager.update(population, generation=15)
     """
 
-    __slots__ = ('_manager', '_ffi', '_lib', '_config')
+    __slots__ = ('_manager', '_config', '_update_fn', '_finalizer', '__weakref__')
+
+    _ffi = _FFI
+    _lib = _LIB
 
-    def __init__(self, directory: str = "checkpoints",
+    def __init__(self, directory: PathType = "checkpoints",
                  every_n: int = 10,
                  max_checkpoints: int = 5,
                  compress: bool = False,
@@ -233,29 +353,25 @@ class CheckpointManager:
             compress: Enable compression
             enabled: Enable automatic checkpointing
         """
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
-
-        config = ffi.new("evocore_auto_checkpoint_config_t *")
+        config = _FFI.new("evocore_auto_checkpoint_config_t *")
         config.enabled = enabled
         config.every_n_generations = every_n
         # directory is a fixed-size char[256] array
-        dir_bytes = directory.encode()[:255]  # truncate to fit
-        ffi.memmove(config.directory, dir_bytes, len(dir_bytes))
-        config.directory[len(dir_bytes)] = 0  # null-terminate
+        dir_bytes = _encode_path(directory)[:255]  # truncate to fit
+        _FFI.memmove(config.directory, dir_bytes, len(dir_bytes))
+        config.directory[len(dir_bytes)] = b'\0'  # null-terminate
         config.max_checkpoints = max_checkpoints
         config.compress = compress
 
         self._config = config
-        self._manager = lib.evocore_checkpoint_manager_create(config)
+        self._manager = _LIB.evocore_checkpoint_manager_create(config)
+        self._update_fn = _LIB.evocore_checkpoint_manager_update
 
-        if self._manager == ffi.NULL:
+        if self._manager == _FFI.NULL:
             raise EvocoreError("Failed to create checkpoint manager")
-
-    def __del__(self):
-        if hasattr(self, '_manager') and self._manager is not None:
-            self._lib.evocore_checkpoint_manager_destroy(self._manager)
+        self._finalizer = weakref.finalize(
+            self, _LIB.evocore_checkpoint_manager_destroy, self._manager
+        )
 
     def update(self, population: "Population",
                meta_pop: Optional["MetaPopulation"] = None,
@@ -271,13 +387,14 @@ class CheckpointManager:
         domain_ptr = domain._domain if domain else self._ffi.NULL
         meta_ptr = meta_pop._meta_pop if meta_pop else self._ffi.NULL
 
-        err = self._lib.evocore_checkpoint_manager_update(
+        err = self._update_fn(
             self._manager, population._pop, domain_ptr, meta_ptr
         )
-        check_error(err, self._lib)
+        if err < 0:
+            check_error(err, _LIB)
 
 
-def list_checkpoints(directory: str) -> List[str]:
+def list_checkpoints(directory: PathType) -> List[str]:
     """
     List checkpoint files in directory.
 
@@ -287,24 +404,28 @@ def list_checkpoints(directory: str) -> List[str]:
     Returns:
         List of checkpoint file paths
     """
-    from .._evocore import ffi, lib
-
-    count = ffi.new("int *")
-    result = lib.evocore_checkpoint_list(directory.encode(), count)
+    outs = _get_list_out()
+    out_len, out_count = outs
+    try:
+        packed = _LIB.evocore_checkpoint_list_packed(
+            _encode_path(directory), out_len, out_count
+        )
 
-    if result == ffi.NULL:
-        return []
+        if packed == _FFI.NULL:
+            return []
 
-    checkpoints = []
-    for i in range(count[0]):
-        if result[i] != ffi.NULL:
-            checkpoints.append(ffi.string(result[i]).decode())
+        try:
+            # Entries are '\0'-terminated; drop the final terminator before splitting
+            data = _FFI.buffer(packed, out_len[0])[:-1]
+        finally:
+            _LIB.evocore_checkpoint_list_packed_free(packed)
+    finally:
+        _release(_LIST_OUT_POOL, outs)
 
-    lib.evocore_checkpoint_list_free(result, count[0])
-    return checkpoints
+    return data.decode().split('\0')
 
 
-def checkpoint_info(filepath: str) -> Dict[str, Any]:
+def checkpoint_info(filepath: PathType) -> Dict[str, Any]:
     """
     Get information about a checkpoint file.
 
@@ -314,44 +435,45 @@ def checkpoint_info(filepath: str) -> Dict[str, Any]:
     Returns:
         Dictionary with checkpoint info
     """
-    checkpoint = Checkpoint.load(filepath)
-    return {
-        'version': checkpoint.version,
-        'timestamp': checkpoint.timestamp,
-        'generation': checkpoint.generation,
-        'population_size': checkpoint.population_size,
-        'best_fitness': checkpoint.best_fitness,
-        'avg_fitness': checkpoint.avg_fitness,
-    }
-
-
-def checksum(data: bytes) -> int:
+    # Header only: population and meta-population data are never read
+    checkpoint = _get_peek_out()
+    try:
+        err = _LIB.evocore_checkpoint_peek(_encode_path(filepath), checkpoint)
+        if err < 0:
+            check_error(err, _LIB)
+        return _checkpoint_head_info(checkpoint)
+    finally:
+        _release(_PEEK_POOL, checkpoint)
+
+
+def checksum(data: Any) -> int:
     """
     Compute checksum of data.
 
     Args:
-        data: Data to checksum
+        data: Data to checksum (bytes or any contiguous buffer, e.g.
+            bytearray, memoryview or numpy array; read without copying)
 
     Returns:
         Checksum value
     """
-    from .._evocore import lib
-    return lib.evocore_checksum(data, len(data))
+    buf = _FFI.from_buffer(data)
+    return _LIB.evocore_checksum(buf, len(buf))
 
 
-def checksum_validate(data: bytes, expected: int) -> bool:
+def checksum_validate(data: Any, expected: int) -> bool:
     """
     Validate checksum of data.
 
     Args:
-        data: Data to validate
+        data: Data to validate (bytes or any contiguous buffer)
         expected: Expected checksum
 
     Returns:
         True if checksum matches
     """
-    from .._evocore import lib
-    return lib.evocore_checksum_validate(data, len(data), expected)
+    buf = _FFI.from_buffer(data)
+    return _LIB.evocore_checksum_validate(buf, len(buf), expected)
 
 
 __all__ = [
@@ -4,15 +4,50 @@ Statistics and monitoring for evocore Python bindings.
 Provides evolution statistics tracking and progress reporting.
 """
 
-from typing import Optional, Callable, Any, Dict, TYPE_CHECKING
+import math
+import struct
+import sys
+import weakref
+from typing import Optional, Callable, Any, Dict, Sequence, TYPE_CHECKING
 from dataclasses import dataclass
 from .error import check_error, EvocoreError
 
+try:
+    from .._evocore import ffi as _FFI, lib as _LIB
+except ImportError:  # extension not built (e.g. documentation builds)
+    _FFI = _LIB = None
+
 if TYPE_CHECKING:
     from ..core.population import Population
 
 
-@dataclass
+# Native layout of evocore_stats_t, in declaration order
+_STATS_FIELDS = (
+    'current_generation', 'total_generations',
+    'best_fitness_ever', 'worst_fitness_ever',
+    'best_fitness_current', 'avg_fitness_current', 'worst_fitness_current',
+    'fitness_improvement_rate', 'fitness_variance',
+    'stagnant_generations', 'convergence_streak',
+    'total_time_ms', 'generation_time_ms', 'eval_time_ms',
+    'total_evaluations', 'mutations_performed', 'crossovers_performed',
+    'memory_usage_bytes',
+    'track_memory', 'track_timing', 'converged', 'stagnant', 'diverse',
+)
+_STATS_STRUCT = struct.Struct('@2N7d2i3d3qN5?')
+
+
+# Freelist of scratch structs for fitness_distribution(). list.pop() is
+# atomic, so a popped struct is owned by one caller until returned; an empty
+# pool raises IndexError (never test-then-pop)
+_DIST_POOL_MAX = 8
+_DIST_POOL: list = []
+
+
+# dataclass(slots=True) needs Python 3.10; 3.9 keeps a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class StatsConfig:
     """Configuration for statistics tracking."""
     improvement_threshold: float = 0.001
@@ -35,7 +70,11 @@ class Stats:
         >>> print(f"Best: {stats.best_fitness}, Converged: {stats.is_converged}")
     """
 
-    __slots__ = ('_stats', '_ffi', '_lib')
+    __slots__ = ('_stats', '_update_fn', '_record_ops_fn', '_converged', '_stagnant',
+                 '_finalizer', '__weakref__')
+
+    _ffi = _FFI
+    _lib = _LIB
 
     def __init__(self, config: Optional[StatsConfig] = None, *, _raw: bool = False):
         """
@@ -45,18 +84,18 @@ class Stats:
             config: Statistics configuration
             _raw: Internal flag for alternative construction
         """
+        self._update_fn = _LIB.evocore_stats_update
+        self._record_ops_fn = _LIB.evocore_stats_record_operations
+        # Cached flag queries; only update()/update_batch() can change them
+        self._converged = None
+        self._stagnant = None
+
         if _raw:
             self._stats = None
-            self._ffi = None
-            self._lib = None
             return
 
-        from .._evocore import ffi, lib
-        self._ffi = ffi
-        self._lib = lib
-
         if config:
-            c_config = ffi.new("evocore_stats_config_t *")
+            c_config = _FFI.new("evocore_stats_config_t *")
             c_config.improvement_threshold = config.improvement_threshold
             c_config.stagnation_generations = config.stagnation_generations
             c_config.diversity_threshold = config.diversity_threshold
@@ -64,15 +103,12 @@ class Stats:
             c_config.track_memory = config.track_memory
             c_config.track_diversity = config.track_diversity
         else:
-            c_config = ffi.NULL
+            c_config = _FFI.NULL
 
-        self._stats = lib.evocore_stats_create(c_config)
-        if self._stats == ffi.NULL:
+        self._stats = _LIB.evocore_stats_create(c_config)
+        if self._stats == _FFI.NULL:
             raise EvocoreError("Failed to create stats tracker")
-
-    def __del__(self):
-        if hasattr(self, '_stats') and self._stats is not None:
-            self._lib.evocore_stats_free(self._stats)
+        self._finalizer = weakref.finalize(self, _LIB.evocore_stats_free, self._stats)
 
     def update(self, population: "Population") -> None:
         """
@@ -81,8 +117,26 @@ class Stats:
         Args:
             population: "Population" to gather stats from
         """
-        err = self._lib.evocore_stats_update(self._stats, population._pop)
-        check_error(err, self._lib)
+        self._converged = self._stagnant = None
+        err = self._update_fn(self._stats, population._pop)
+        if err < 0:
+            check_error(err, _LIB)
+
+    def update_batch(self, populations: Sequence["Population"]) -> None:
+        """
+        Update statistics from several populations in one C call.
+
+        Equivalent to calling update() for each population in order,
+        e.g. once per island.
+
+        Args:
+            populations: Populations to gather stats from
+        """
+        pops = _FFI.new("evocore_population_t *[]", [p._pop for p in populations])
+        self._converged = self._stagnant = None
+        err = _LIB.evocore_stats_update_batch(self._stats, pops, len(pops))
+        if err < 0:
+            check_error(err, _LIB)
 
     def record_operations(self, evaluations: int, mutations: int,
                           crossovers: int) -> None:
@@ -94,60 +148,67 @@ class Stats:
             mutations: Number of mutations
             crossovers: Number of crossovers
         """
-        err = self._lib.evocore_stats_record_operations(
+        err = self._record_ops_fn(
             self._stats, evaluations, mutations, crossovers
         )
-        check_error(err, self._lib)
+        if err < 0:
+            check_error(err, _LIB)
 
     @property
     def generation(self) -> int:
         """Current generation."""
-        return self._stats.generation
+        return self._stats.current_generation
 
     @property
     def best_fitness(self) -> float:
         """Best fitness."""
-        return self._stats.best_fitness
+        return self._stats.best_fitness_current
 
     @property
     def avg_fitness(self) -> float:
         """Average fitness."""
-        return self._stats.avg_fitness
+        return self._stats.avg_fitness_current
 
     @property
     def worst_fitness(self) -> float:
         """Worst fitness."""
-        return self._stats.worst_fitness
+        return self._stats.worst_fitness_current
 
     @property
     def fitness_stddev(self) -> float:
         """Fitness standard deviation."""
-        return self._stats.fitness_stddev
+        return math.sqrt(self._stats.fitness_variance)
 
     @property
     def fitness_improvement(self) -> float:
-        """Fitness improvement from last generation."""
-        return self._stats.fitness_improvement
+        """Fitness improvement rate per generation."""
+        return self._stats.fitness_improvement_rate
 
     @property
     def is_converged(self) -> bool:
         """Whether evolution has converged."""
-        return self._lib.evocore_stats_is_converged(self._stats)
+        converged = self._converged
+        if converged is None:
+            converged = self._converged = self._lib.evocore_stats_is_converged(self._stats)
+        return converged
 
     @property
     def is_stagnant(self) -> bool:
         """Whether evolution is stagnant."""
-        return self._lib.evocore_stats_is_stagnant(self._stats)
+        stagnant = self._stagnant
+        if stagnant is None:
+            stagnant = self._stagnant = self._lib.evocore_stats_is_stagnant(self._stats)
+        return stagnant
 
     @property
     def stagnant_generations(self) -> int:
         """Number of generations without improvement."""
-        return self._stats.stagnant_generations
+        return self._stats.convergence_streak
 
     @property
     def diversity(self) -> float:
-        """Population diversity."""
-        return self._stats.diversity
+        """Population diversity (fitness variance)."""
+        return self._stats.fitness_variance
 
     @property
     def generation_time_ms(self) -> float:
@@ -162,22 +223,27 @@ class Stats:
     @property
     def evaluation_count(self) -> int:
         """Total number of evaluations."""
-        return self._stats.evaluation_count
+        return self._stats.total_evaluations
 
     @property
     def mutation_count(self) -> int:
         """Total number of mutations."""
-        return self._stats.mutation_count
+        return self._stats.mutations_performed
 
     @property
     def crossover_count(self) -> int:
         """Total number of crossovers."""
-        return self._stats.crossover_count
+        return self._stats.crossovers_performed
 
     @property
     def memory_used(self) -> int:
         """Current memory usage in bytes."""
-        return self._stats.memory_used
+        return self._stats.memory_usage_bytes
+
+    def _raw_fields(self) -> Dict[str, Any]:
+        """Read every evocore_stats_t field with a single buffer unpack."""
+        return dict(zip(_STATS_FIELDS,
+                        _STATS_STRUCT.unpack_from(self._ffi.buffer(self._stats))))
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -186,23 +252,24 @@ class Stats:
         Returns:
             Dictionary of statistics
         """
+        raw = self._raw_fields()
         return {
-            'generation': self.generation,
-            'best_fitness': self.best_fitness,
-            'avg_fitness': self.avg_fitness,
-            'worst_fitness': self.worst_fitness,
-            'fitness_stddev': self.fitness_stddev,
-            'fitness_improvement': self.fitness_improvement,
+            'generation': raw['current_generation'],
+            'best_fitness': raw['best_fitness_current'],
+            'avg_fitness': raw['avg_fitness_current'],
+            'worst_fitness': raw['worst_fitness_current'],
+            'fitness_stddev': math.sqrt(raw['fitness_variance']),
+            'fitness_improvement': raw['fitness_improvement_rate'],
             'is_converged': self.is_converged,
             'is_stagnant': self.is_stagnant,
-            'stagnant_generations': self.stagnant_generations,
-            'diversity': self.diversity,
-            'generation_time_ms': self.generation_time_ms,
-            'total_time_ms': self.total_time_ms,
-            'evaluation_count': self.evaluation_count,
-            'mutation_count': self.mutation_count,
-            'crossover_count': self.crossover_count,
-            'memory_used': self.memory_used,
+            'stagnant_generations': raw['convergence_streak'],
+            'diversity': raw['fitness_variance'],
+            'generation_time_ms': raw['generation_time_ms'],
+            'total_time_ms': raw['total_time_ms'],
+            'evaluation_count': raw['total_evaluations'],
+            'mutation_count': raw['mutations_performed'],
+            'crossover_count': raw['crossovers_performed'],
+            'memory_used': raw['memory_usage_bytes'],
         }
 
     def __repr__(self) -> str:
@@ -217,6 +284,8 @@ class ProgressReporter:
     Calls a callback function periodically during evolution.
     """
 
+    __slots__ = ('_callback', '_every_n', '_verbose', '_last_reported')
+
     def __init__(self, callback: Callable[[Stats], None],
                  every_n: int = 1, verbose: bool = False):
         """
@@ -244,6 +313,21 @@ class ProgressReporter:
             self._callback(stats)
             self._last_reported = gen
 
+    def report_gen(self, gen: int, stats_factory: Callable[[], Stats]) -> None:
+        """
+        Report progress if due, given the generation number directly.
+
+        Unlike report(), nothing is read from the stats tracker when no
+        report is due; stats_factory is only called when the callback fires.
+
+        Args:
+            gen: Current generation
+            stats_factory: Returns the Stats to pass to the callback
+        """
+        if gen - self._last_reported >= self._every_n:
+            self._callback(stats_factory())
+            self._last_reported = gen
+
     def force_report(self, stats: Stats) -> None:
         """
         Force a progress report.
@@ -276,8 +360,7 @@ def compute_diversity(population: "Population") -> float:
     Returns:
         Diversity measure
     """
-    from .._evocore import lib
-    return lib.evocore_stats_diversity(population._pop)
+    return _LIB.evocore_stats_diversity(population._pop)
 
 
 def fitness_distribution(population: "Population") -> Dict[str, float]:
@@ -290,24 +373,24 @@ def fitness_distribution(population: "Population") -> Dict[str, float]:
     Returns:
         Dictionary with min, max, mean, stddev
     """
-    from .._evocore import ffi, lib
-
-    out_min = ffi.new("double *")
-    out_max = ffi.new("double *")
-    out_mean = ffi.new("double *")
-    out_stddev = ffi.new("double *")
-
-    err = lib.evocore_stats_fitness_distribution(
-        population._pop, out_min, out_max, out_mean, out_stddev
-    )
-    check_error(err, lib)
-
-    return {
-        'min': out_min[0],
-        'max': out_max[0],
-        'mean': out_mean[0],
-        'stddev': out_stddev[0],
-    }
+    try:
+        out = _DIST_POOL.pop()
+    except IndexError:
+        out = _FFI.new("evocore_fitness_dist_t *")
+    try:
+        err = _LIB.evocore_stats_fitness_dist(population._pop, out)
+        if err < 0:
+            check_error(err, _LIB)
+
+        return {
+            'min': out.min,
+            'max': out.max,
+            'mean': out.mean,
+            'stddev': out.stddev,
+        }
+    finally:
+        if len(_DIST_POOL) < _DIST_POOL_MAX:
+            _DIST_POOL.append(out)
 
 
 __all__ = [
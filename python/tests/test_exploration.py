@@ -0,0 +1,252 @@
+"""Tests for evocore.strategy.exploration."""
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("evocore._evocore")
+
+from evocore.strategy.exploration import (
+    Bandit,
+    Exploration,
+    ExploreStrategy,
+    _FFI,
+    _LIB,
+)
+from evocore.utils.error import EvocoreError
+
+
+def _arm(bandit, arm):
+    """Read one arm through evocore_bandit_get_arm()."""
+    out = _FFI.new("evocore_bandit_arm_t *")
+    assert _LIB.evocore_bandit_get_arm(bandit._bandit, arm, out)
+    return out.count, out.total_reward, out.mean_reward
+
+
+class TestBandit:
+    # Odd arm count: exercises the per-arm array offsets in the SoA block
+    ARMS = 5
+    PULLS = [(0, 1.0), (1, 0.5), (2, 0.25), (0, 0.0), (3, 2.0),
+             (4, -1.0), (1, 1.5), (0, 0.5), (2, 0.75), (4, 3.0)]
+
+    def _pulled(self, ucb_c=2.0):
+        bandit = Bandit(self.ARMS, ucb_c=ucb_c)
+        for arm, reward in self.PULLS:
+            bandit.update(arm, reward)
+        return bandit
+
+    def _expected(self):
+        counts = [0] * self.ARMS
+        totals = [0.0] * self.ARMS
+        for arm, reward in self.PULLS:
+            counts[arm] += 1
+            totals[arm] += reward
+        return counts, totals
+
+    def test_stats_after_updates(self):
+        bandit = self._pulled()
+        counts, totals = self._expected()
+
+        assert bandit.total_pulls == len(self.PULLS)
+        for arm in range(self.ARMS):
+            count, mean = bandit.get_stats(arm)
+            assert count == counts[arm]
+            assert mean == pytest.approx(totals[arm] / counts[arm])
+
+            count, total, mean = _arm(bandit, arm)
+            assert count == counts[arm]
+            assert total == pytest.approx(totals[arm])
+            assert mean == pytest.approx(totals[arm] / counts[arm])
+
+    def test_get_arm_out_of_range(self):
+        bandit = Bandit(self.ARMS)
+        out = _FFI.new("evocore_bandit_arm_t *")
+        assert not _LIB.evocore_bandit_get_arm(bandit._bandit, self.ARMS, out)
+        assert bandit.get_stats(self.ARMS) == (0, 0.0)
+
+    def test_cached_ucb_matches_plain_ucb1(self):
+        ucb_c = 1.5
+        bandit = self._pulled(ucb_c)
+        counts, totals = self._expected()
+        n = len(self.PULLS)
+
+        raw = bandit._bandit
+        assert raw.ucb_scale == pytest.approx(ucb_c * math.sqrt(math.log(n)))
+
+        ucb = []
+        for arm in range(self.ARMS):
+            bonus = ucb_c * math.sqrt(math.log(n) / counts[arm])
+            assert raw.arm_radius[arm] == pytest.approx(1.0 / math.sqrt(counts[arm]))
+            assert raw.ucb_scale * raw.arm_radius[arm] == pytest.approx(bonus)
+            ucb.append(totals[arm] / counts[arm] + bonus)
+
+        assert bandit.select() == int(np.argmax(ucb))
+        assert bandit.select() == _LIB.evocore_bandit_select_ucb(raw)
+
+    def test_reset_clears_every_array(self):
+        bandit = self._pulled()
+        bandit.reset()
+
+        assert bandit.total_pulls == 0
+        for arm in range(self.ARMS):
+            assert _arm(bandit, arm) == (0, 0.0, 0.0)
+            assert bandit._bandit.arm_radius[arm] == 0.0
+        assert bandit.select() == 0
+
+
+class TestBanditBatch:
+    def test_select_batch_spreads_over_unpulled_arms(self):
+        bandit = Bandit(6)
+        picks = bandit.select_batch(6)
+        assert picks.dtype == np.uintp
+        assert sorted(picks.tolist()) == list(range(6))
+        # Selecting is read-only
+        assert bandit.total_pulls == 0
+
+    def test_select_batch_does_not_repeat_argmax(self):
+        bandit = Bandit(3, ucb_c=1.0)
+        bandit.update_batch([0, 1, 2], [1.0, 0.0, 0.0])
+        picks = bandit.select_batch(12)
+        assert bandit.select() == 0
+        assert len(set(picks.tolist())) > 1
+
+    def test_select_batch_empty(self):
+        assert Bandit(3).select_batch(0).size == 0
+
+    def test_update_batch_matches_updates(self):
+        arms = np.array([0, 2, 1, 2, 2, 0])
+        rewards = np.array([0.5, 1.0, -0.25, 0.0, 2.0, 1.5])
+
+        batched = Bandit(3)
+        batched.update_batch(arms, rewards)
+        single = Bandit(3)
+        for arm, reward in zip(arms, rewards):
+            single.update(int(arm), float(reward))
+
+        assert batched.total_pulls == single.total_pulls == len(arms)
+        for arm in range(3):
+            assert batched.get_stats(arm) == single.get_stats(arm)
+        assert batched._bandit.ucb_scale == single._bandit.ucb_scale
+
+    def test_update_batch_accepts_lists(self):
+        bandit = Bandit(2)
+        bandit.update_batch([1, 1], [0.5, 1.5])
+        assert bandit.get_stats(1) == (2, 1.0)
+
+    @pytest.mark.parametrize("arms,rewards", [
+        ([0, 1, 2], [1.0, 0.5]),
+        ([0, 1], [1.0, 0.5, 0.25]),
+        ([[0, 1]], [[1.0, 0.5]]),
+        (0, 1.0),
+    ])
+    def test_update_batch_shape_mismatch(self, arms, rewards):
+        bandit = Bandit(3)
+        with pytest.raises(EvocoreError):
+            bandit.update_batch(arms, rewards)
+        assert bandit.total_pulls == 0
+
+
+class TestShouldExploreBatch:
+    def test_bool_view_over_uint8(self):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.5)
+        flags = exp.should_explore_batch(100, seed=7)
+        assert flags.dtype == np.bool_
+        assert flags.shape == (100,)
+        assert flags.base is not None and flags.base.dtype == np.uint8
+        assert set(flags.view(np.uint8).tolist()) <= {0, 1}
+        assert 0 < flags.sum() < 100
+
+    def test_matches_repeated_should_explore(self):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.3)
+        flags = exp.should_explore_batch(200, seed=42)
+
+        seed = _FFI.new("unsigned int *", 42)
+        expected = [_LIB.evocore_exploration_should_explore(exp._exp, seed)
+                    for _ in range(200)]
+        assert flags.tolist() == expected
+        # The shared seed ends where n single calls leave it
+        assert exp._seed[0] == seed[0]
+
+    def test_deterministic(self):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.5)
+        assert np.array_equal(exp.should_explore_batch(64, seed=3),
+                              exp.should_explore_batch(64, seed=3))
+
+    @pytest.mark.parametrize("rate,value", [(0.0, False), (1.0, True)])
+    def test_saturated_rate_leaves_seed(self, rate, value):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=rate)
+        flags = exp.should_explore_batch(50, seed=1234)
+        assert flags.tolist() == [value] * 50
+        assert exp._seed[0] == 1234
+
+        seed = _FFI.new("unsigned int *", 1234)
+        assert _LIB.evocore_exploration_should_explore(exp._exp, seed) == value
+        assert seed[0] == 1234
+
+    def test_empty(self):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.5)
+        assert exp.should_explore_batch(0).shape == (0,)
+
+
+def _packed_reference(n, rate, seed):
+    """SplitMix64 decisions as evocore_exploration_should_explore_packed() makes them."""
+    mask = (1 << 64) - 1
+    threshold = int(rate * 2.0 ** 64)
+    state = seed
+    decisions = []
+    for _ in range(n):
+        state = (state + 0x9E3779B97F4A7C15) & mask
+        z = state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        z ^= z >> 31
+        decisions.append(z < threshold)
+    return decisions
+
+
+def _unpack(words, n):
+    return [bool((int(words[i // 64]) >> (i % 64)) & 1) for i in range(n)]
+
+
+class TestShouldExplorePacked:
+    @pytest.mark.parametrize("n", [1, 63, 64, 65, 100, 128, 200])
+    def test_matches_reference(self, n):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.3)
+        words = exp.should_explore_packed(n, seed=99)
+        assert words.dtype == np.uint64
+        assert words.shape == ((n + 63) // 64,)
+        assert _unpack(words, n) == _packed_reference(n, 0.3, 99)
+
+    @pytest.mark.parametrize("n", [1, 63, 65, 130])
+    def test_bits_past_n_cleared(self, n):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=1.0)
+        words = exp.should_explore_packed(n, seed=5)
+        assert sum(bin(int(w)).count("1") for w in words) == n
+        assert int(words[-1]) >> (n % 64 or 64) == 0
+
+    def test_explore_count(self):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.5)
+        out = np.empty(3, dtype=np.uint64)
+        seed = _FFI.new("unsigned int *", 11)
+        explored = _LIB.evocore_exploration_should_explore_packed(
+            exp._exp, _FFI.cast("uint64_t *", out.ctypes.data), 150, seed)
+        assert explored == sum(_packed_reference(150, 0.5, 11))
+
+    def test_unpackbits_layout(self):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.4)
+        words = exp.should_explore_packed(70, seed=8)
+        if np.little_endian:
+            bits = np.unpackbits(words.view(np.uint8), count=70, bitorder="little")
+            assert bits.astype(bool).tolist() == _unpack(words, 70)
+
+    @pytest.mark.parametrize("rate,word", [(0.0, 0), (1.0, (1 << 64) - 1)])
+    def test_saturated_rate_leaves_seed(self, rate, word):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=rate)
+        words = exp.should_explore_packed(128, seed=77)
+        assert [int(w) for w in words] == [word, word]
+        assert exp._seed[0] == 77
+
+    def test_empty(self):
+        exp = Exploration(ExploreStrategy.FIXED, base_rate=0.5)
+        assert exp.should_explore_packed(0).shape == (0,)
@@ -0,0 +1,149 @@
+"""Tests for evocore.meta."""
+
+import platform
+
+import numpy as np
+import pytest
+
+pytest.importorskip("evocore._evocore")
+
+from evocore.meta.params import MetaParams
+from evocore.meta.population import MetaPopulation, meta_evaluate, meta_evaluate_many
+
+
+class TestMetaEvaluateMany:
+    def _params(self, n):
+        return [MetaParams() for _ in range(n)]
+
+    def _expected(self, params, best, avg, div, gens):
+        n = len(params)
+        rows = zip(params, *(np.broadcast_to(m, n) for m in (best, avg, div, gens)))
+        return [meta_evaluate(p, float(b), float(a), float(d), int(g))
+                for p, b, a, d, g in rows]
+
+    def test_arrays(self):
+        params = self._params(4)
+        best = np.array([0.9, 0.5, 0.1, 0.7])
+        avg = np.array([0.4, 0.3, 0.05, 0.6])
+        div = np.array([0.35, 0.1, 0.6, 0.45])
+        gens = np.array([10, 50, 0, 200])
+
+        out = meta_evaluate_many(params, best, avg, div, gens)
+        assert out.dtype == np.float64
+        np.testing.assert_allclose(out, self._expected(params, best, avg, div, gens))
+
+    def test_scalars_broadcast(self):
+        params = self._params(3)
+        out = meta_evaluate_many(params, 0.8, 0.4, 0.35, 25)
+        np.testing.assert_allclose(out, [meta_evaluate(params[0], 0.8, 0.4, 0.35, 25)] * 3)
+
+    def test_mixed_scalars_and_arrays(self):
+        params = self._params(3)
+        best = [0.2, 0.6, 1.0]
+        gens = np.array([5, 10, 20])
+        out = meta_evaluate_many(params, best, 0.5, 0.4, gens)
+        np.testing.assert_allclose(out, self._expected(params, best, 0.5, 0.4, gens))
+
+    def test_length_one_array_broadcasts(self):
+        params = self._params(3)
+        out = meta_evaluate_many(params, [0.5], 0.1, [0.2], 10)
+        np.testing.assert_allclose(out, self._expected(params, 0.5, 0.1, 0.2, 10))
+
+    def test_single_params(self):
+        params = self._params(1)
+        out = meta_evaluate_many(params, 0.7, [0.3], 0.4, 12)
+        assert out.shape == (1,)
+        assert out[0] == pytest.approx(meta_evaluate(params[0], 0.7, 0.3, 0.4, 12))
+
+    @pytest.mark.parametrize("n", [1, 3])
+    def test_mismatched_length(self, n):
+        params = self._params(n)
+        with pytest.raises(ValueError, match="one entry per parameter set"):
+            meta_evaluate_many(params, [0.1, 0.2], 0.5, 0.4, 10)
+        with pytest.raises(ValueError):
+            meta_evaluate_many(params, 0.5, 0.5, 0.4, np.arange(n + 2))
+
+
+# (field, min, max) clamps applied by evocore_meta_params_mutate()
+_MUTATION_BOUNDS = [
+    ('optimization_mutation_rate', 0.01, 0.50),
+    ('variance_mutation_rate', 0.05, 0.50),
+    ('experimentation_rate', 0.01, 0.30),
+    ('elite_protection_ratio', 0.05, 0.30),
+    ('culling_ratio', 0.10, 0.50),
+    ('learning_rate', 0.01, 1.0),
+    ('exploration_factor', 0.0, 1.0),
+    ('confidence_threshold', 0.0, 1.0),
+    ('meta_learning_rate', 0.01, 0.50),
+    ('target_population_size', 50, 10000),
+]
+
+
+def _run(generations=3, threads=None, size=10):
+    """Evolve a fixed-seed population with distinct fitnesses each generation."""
+    pop = MetaPopulation(size=size, seed=123)
+    for gen in range(generations):
+        for i, ind in enumerate(pop):
+            ind.params.meta_mutation_rate = 1.0  # mutate every field
+            ind.record_fitness(((i * 7 + gen * 3) % 10) / 10 + gen * 0.01)
+        pop.evolve(seed=2024 + gen, threads=threads)
+    return pop
+
+
+def _fingerprint(pop):
+    return [(ind.params.optimization_mutation_rate, ind.params.learning_rate,
+             ind.params.target_population_size) for ind in pop]
+
+
+class TestMetaPopulationEvolve:
+    # Produced by the serial evolve before the parallel variant was added;
+    # the values depend on glibc's rand_r()
+    SERIAL_REFERENCE = [
+        (0.054689999999999996, 0.10432, 506),
+        (0.049909956, 0.10208940000000001, 558),
+        (0.053410000000000006, 0.09672000000000001, 470),
+        (0.049890000000000004, 0.10900000000000001, 533),
+        (0.049143698000000006, 0.08886792, 467),
+        (0.054102392304000005, 0.09843459948000001, 545),
+        (0.053573346770399995, 0.09510648504000001, 570),
+        (0.049385069999999996, 0.10192063999999999, 516),
+        (0.0502892716656, 0.09671949756, 568),
+        (0.060071495999999995, 0.11256127999999999, 497),
+    ]
+
+    @pytest.mark.skipif(platform.libc_ver()[0] != 'glibc',
+                        reason="reference values use glibc rand_r()")
+    def test_serial_matches_reference(self):
+        pop = _run()
+        assert pop.count == 10
+        assert pop.current_generation == 3
+        for got, want in zip(_fingerprint(pop), self.SERIAL_REFERENCE):
+            assert got[:2] == pytest.approx(want[:2], rel=1e-12)
+            assert got[2] == want[2]
+
+    def test_serial_is_deterministic(self):
+        assert _fingerprint(_run()) == _fingerprint(_run())
+
+    @pytest.mark.parametrize("threads", [0, 1, 4])
+    def test_threaded_keeps_count_and_bounds(self, threads):
+        pop = MetaPopulation(size=10, seed=123)
+        for i, ind in enumerate(pop):
+            ind.params.meta_mutation_rate = 1.0
+            ind.record_fitness(i / 10)
+        pop.sort()
+        elites = [(ind.meta_fitness, ind.params.learning_rate) for ind in pop][:5]
+
+        pop.evolve(seed=99, threads=threads)
+
+        assert pop.count == len(pop) == 10
+        assert pop.current_generation == 1
+        # The top half survives unchanged; only the bottom half is bred
+        assert [(ind.meta_fitness, ind.params.learning_rate) for ind in pop][:5] == elites
+        for ind in pop:
+            params = ind.params
+            for field, low, high in _MUTATION_BOUNDS:
+                assert low <= getattr(params, field) <= high, field
+
+    def test_threaded_independent_of_thread_count(self):
+        results = [_fingerprint(_run(threads=t)) for t in (1, 2, 4)]
+        assert results[0] == results[1] == results[2]
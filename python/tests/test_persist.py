@@ -0,0 +1,178 @@
+"""Tests for evocore.utils.persist."""
+
+import os
+import zlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("evocore._evocore")
+
+from evocore.utils.error import EvocoreError
+from evocore.utils.persist import (
+    _FFI,
+    _LIB,
+    _encode_path,
+    Checkpoint,
+    checkpoint_info,
+    checksum,
+    checksum_validate,
+)
+
+
+def _data(size, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, size, dtype=np.uint8).tobytes()
+
+
+class TestChecksum:
+    # Below 64 bytes only the table-driven loop runs; from 64 up the
+    # carry-less multiply fold (where available) handles whole 16-byte
+    # blocks and the table loop finishes the tail.
+    @pytest.mark.parametrize("size", range(257))
+    def test_matches_zlib(self, size):
+        data = _data(size, seed=size)
+        assert checksum(data) == zlib.crc32(data)
+
+    @pytest.mark.parametrize("size", [1000, 4096, 65536 + 15, 1 << 20])
+    def test_large_buffers(self, size):
+        data = _data(size, seed=size)
+        assert checksum(data) == zlib.crc32(data)
+
+    @pytest.mark.parametrize("offset", range(1, 8))
+    def test_unaligned_views(self, offset):
+        data = _data(4096 + 64, seed=offset)
+        view = memoryview(data)[offset:offset + 4096 + 7]
+        assert checksum(view) == zlib.crc32(view)
+
+    def test_buffer_types(self):
+        data = _data(300)
+        expected = zlib.crc32(data)
+        assert checksum(bytearray(data)) == expected
+        assert checksum(np.frombuffer(data, dtype=np.uint8)) == expected
+
+    def test_constant_patterns(self):
+        for byte in (0x00, 0xFF, 0x5A):
+            data = bytes([byte]) * 192
+            assert checksum(data) == zlib.crc32(data)
+
+    def test_validate(self):
+        data = _data(129)
+        crc = zlib.crc32(data)
+        assert checksum_validate(data, crc)
+        assert not checksum_validate(data, crc ^ 1)
+
+
+@pytest.fixture
+def c_population():
+    """A small C population and domain for building real checkpoints."""
+    pop = _FFI.new("evocore_population_t *")
+    assert _LIB.evocore_population_init(pop, 8) == 0
+    pop.generation = 42
+    pop.best_fitness = 0.875
+    pop.avg_fitness = 0.5
+
+    name = _FFI.new("char[]", b"test_domain")
+    domain = _FFI.new("evocore_domain_t *")
+    domain.name = name
+    yield pop, domain, name
+    _LIB.evocore_population_cleanup(pop)
+
+
+def _write_checkpoint(path, pop, domain):
+    checkpoint = Checkpoint()
+    assert _LIB.evocore_checkpoint_create(checkpoint._checkpoint, pop, domain, _FFI.NULL) == 0
+    checkpoint.save(path)
+    return checkpoint
+
+
+class TestCheckpointHeader:
+    def test_save_info_load_round_trip(self, tmp_path, c_population):
+        pop, domain, _ = c_population
+        path = tmp_path / "checkpoint.json"
+        saved = _write_checkpoint(path, pop, domain)
+
+        info = checkpoint_info(path)
+        assert info['version'] == saved.version
+        assert info['timestamp'] == saved.timestamp
+        assert info['generation'] == 42
+        assert info['best_fitness'] == 0.875
+
+        loaded = Checkpoint.load(path)
+        assert loaded.version == saved.version
+        assert loaded.timestamp == saved.timestamp
+        assert loaded.generation == 42
+        assert loaded.best_fitness == 0.875
+        assert _FFI.string(loaded._checkpoint.domain_name) == b"test_domain"
+
+    def test_info_stops_at_population(self, tmp_path):
+        # A "generation" inside population data must not leak into the header
+        path = tmp_path / "checkpoint.json"
+        path.write_text('{"version": "1.0", "timestamp": 1700000000, '
+                        '"domain": "d", "best_fitness": 0.25, '
+                        '"population": {"generation": 99}}')
+        info = checkpoint_info(path)
+        assert info['generation'] == 0
+        assert info['best_fitness'] == 0.25
+        assert Checkpoint.load(path).generation == 99  # full parse finds it
+
+    def test_header_longer_than_peek_prefix(self, tmp_path):
+        path = tmp_path / "checkpoint.json"
+        padding = "x" * 2000
+        path.write_text('{"version": "1.0", "timestamp": 1700000000, '
+                        f'"domain": "d", "note": "{padding}", '
+                        '"generation": 7, "best_fitness": 0.5, '
+                        '"population": {}, "meta_data": null}')
+        assert path.stat().st_size > 1024
+
+        info = checkpoint_info(path)
+        loaded = Checkpoint.load(path)
+        for result in (info, {'version': loaded.version, 'generation': loaded.generation,
+                              'best_fitness': loaded.best_fitness,
+                              'timestamp': loaded.timestamp}):
+            assert result['version'] == "1.0"
+            assert result['generation'] == 7
+            assert result['best_fitness'] == 0.5
+            assert int(result['timestamp'].timestamp()) == 1700000000
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(EvocoreError):
+            checkpoint_info(tmp_path / "missing.json")
+        with pytest.raises(EvocoreError):
+            Checkpoint.load(tmp_path / "missing.json")
+
+
+class _UnhashablePath:
+    """os.PathLike that, like many mutable path objects, cannot be hashed."""
+
+    __hash__ = None
+
+    def __init__(self, path):
+        self.path = path
+
+    def __fspath__(self):
+        return self.path
+
+
+class TestEncodePath:
+    def test_str_and_bytes(self):
+        assert _encode_path("dir/file.json") == b"dir/file.json"
+        assert _encode_path(b"dir/file.json") == b"dir/file.json"
+        assert _encode_path("caf\u00e9") == os.fsencode("caf\u00e9")
+
+    def test_pathlike(self, tmp_path):
+        assert _encode_path(tmp_path) == os.fsencode(tmp_path)
+
+    def test_unhashable_pathlike(self, tmp_path):
+        path = _UnhashablePath(str(tmp_path / "a.json"))
+        assert _encode_path(path) == os.fsencode(path.path)
+
+        # Not cached: a changed __fspath__() is seen on the next call
+        path.path = str(tmp_path / "b.json")
+        assert _encode_path(path) == os.fsencode(path.path)
+
+    def test_unhashable_pathlike_round_trip(self, tmp_path, c_population):
+        pop, domain, _ = c_population
+        path = _UnhashablePath(str(tmp_path / "checkpoint.json"))
+        _write_checkpoint(path, pop, domain)
+        assert checkpoint_info(path)['generation'] == 42
+        assert Checkpoint.load(path).generation == 42
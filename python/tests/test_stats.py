@@ -0,0 +1,107 @@
+"""Tests for evocore.utils.stats."""
+
+import weakref
+
+import pytest
+
+pytest.importorskip("evocore._evocore")
+
+from evocore.utils.stats import _FFI, _LIB, _STATS_FIELDS, _STATS_STRUCT, Stats
+
+
+class _CPopulation:
+    """Owns a C population; exposes it as ``_pop`` like core.Population."""
+
+    def __init__(self, generation, fitnesses):
+        pop = _FFI.new("evocore_population_t *")
+        assert _LIB.evocore_population_init(pop, len(fitnesses)) == 0
+        weakref.finalize(self, _LIB.evocore_population_cleanup, pop)
+
+        genome = _FFI.new("evocore_genome_t *")
+        assert _LIB.evocore_genome_init(genome, 8) == 0
+        genome.size = 8
+        for fitness in fitnesses:
+            assert _LIB.evocore_population_add(pop, genome, fitness) == 0
+        _LIB.evocore_genome_cleanup(genome)
+        _LIB.evocore_population_update_stats(pop)
+        pop.generation = generation
+        self._pop = pop
+
+
+def _populations():
+    """Improve for ten generations, then plateau long enough to converge."""
+    pops = []
+    for gen in range(1, 71):
+        best = min(gen, 10) / 10
+        spread = 0.5 if gen < 30 else 0.01
+        pops.append(_CPopulation(gen, [best, best - spread, best - spread / 2]))
+    return pops
+
+
+def _snapshot(stats):
+    return _STATS_STRUCT.unpack_from(_FFI.buffer(stats._stats))
+
+
+class TestStatsUpdateBatch:
+    def test_struct_layout(self):
+        stats = Stats()
+        stats.update_batch(_populations())
+        stats.record_operations(10, 20, 30)
+        # Only tail padding may follow the last packed field
+        assert 0 <= _FFI.sizeof("evocore_stats_t") - _STATS_STRUCT.size < 8
+        for name, value in zip(_STATS_FIELDS, _snapshot(stats)):
+            assert getattr(stats._stats, name) == value, name
+
+    def test_matches_sequential_updates(self):
+        pops = _populations()
+
+        sequential = Stats()
+        for pop in pops:
+            sequential.update(pop)
+        batched = Stats()
+        batched.update_batch(pops)
+
+        assert _snapshot(batched) == _snapshot(sequential)
+        assert batched.to_dict() == sequential.to_dict()
+
+    @pytest.mark.parametrize("split", [1, 15, 40, 69])
+    def test_split_batches(self, split):
+        pops = _populations()
+
+        sequential = Stats()
+        for pop in pops:
+            sequential.update(pop)
+        batched = Stats()
+        batched.update_batch(pops[:split])
+        batched.update_batch(pops[split:])
+
+        assert _snapshot(batched) == _snapshot(sequential)
+
+    def test_empty_batch(self):
+        stats = Stats()
+        before = _snapshot(stats)
+        stats.update_batch([])
+        assert _snapshot(stats) == before
+
+    def test_batch_invalidates_flag_cache(self):
+        pops = _populations()
+        stats = Stats()
+        stats.update_batch(pops[:10])
+        assert not stats.is_stagnant
+        assert not stats.is_converged
+
+        # Cached answers must not survive the next batch
+        stats.update_batch(pops[10:])
+        assert stats.is_stagnant
+        assert stats.is_converged
+        assert stats.is_stagnant == _LIB.evocore_stats_is_stagnant(stats._stats)
+        assert stats.is_converged == _LIB.evocore_stats_is_converged(stats._stats)
+
+    def test_update_invalidates_flag_cache(self):
+        pops = _populations()
+        stats = Stats()
+        stats.update_batch(pops[:20])
+        assert not stats.is_stagnant
+        for pop in pops[20:]:
+            stats.update(pop)
+        assert stats.is_stagnant
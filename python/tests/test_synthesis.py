@@ -0,0 +1,213 @@
+"""Tests for evocore.strategy.synthesis."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("evocore._evocore")
+
+from evocore.strategy.synthesis import (
+    _FFI,
+    _LIB,
+    _SPECIALIZED,
+    SimilarityMatrix,
+    param_distance,
+    param_similarity,
+    transfer_params,
+)
+from evocore.utils.error import EvocoreInvalidArgumentError
+
+
+def _pair(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n), rng.normal(size=n)
+
+
+def _ptr(arr):
+    return _FFI.cast("double *", arr.ctypes.data)
+
+
+class TestParamDistance:
+    # 1..3 take the scalar path; from 4 up the vector kernels run with
+    # every possible remainder for 4-, 8- and 16-wide loops
+    @pytest.mark.parametrize("n", list(range(1, 34)) + [64, 100, 1000])
+    def test_matches_numpy(self, n):
+        a, b = _pair(n, seed=n)
+        expected = np.linalg.norm(a - b)
+        assert _LIB.evocore_param_distance(_ptr(a), _ptr(b), n) == pytest.approx(expected)
+        assert param_distance(a, b) == pytest.approx(expected)
+
+    def test_empty(self):
+        assert param_distance(np.empty(0), np.empty(0)) == 0.0
+
+    def test_identical(self):
+        a, _ = _pair(17)
+        assert param_distance(a, a) == 0.0
+
+    def test_non_contiguous_input(self):
+        a, b = _pair(40)
+        expected = np.linalg.norm(a[::2] - b[::2])
+        assert param_distance(a[::2], b[::2]) == pytest.approx(expected)
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            param_distance(np.zeros(3), np.zeros(4))
+
+    @pytest.mark.parametrize("shape", [(2, 4), (4, 1), ()])
+    def test_rejects_non_1d(self, shape):
+        a = np.ones(shape)
+        with pytest.raises(EvocoreInvalidArgumentError):
+            param_distance(a, a)
+        with pytest.raises(EvocoreInvalidArgumentError):
+            param_similarity(a, a)
+
+    def test_similarity(self):
+        a, b = _pair(9)
+        expected = np.exp(-np.linalg.norm(a - b) / 2.0)
+        assert param_similarity(a, b, max_distance=2.0) == pytest.approx(expected)
+
+
+class TestFixedDistance:
+    KERNELS = {
+        4: "evocore_param_distance_4",
+        8: "evocore_param_distance_8",
+        16: "evocore_param_distance_16",
+    }
+
+    @pytest.mark.parametrize("n", [4, 8, 16])
+    def test_kernel_matches_numpy(self, n):
+        kernel = getattr(_LIB, self.KERNELS[n])
+        for seed in range(5):
+            a, b = _pair(n, seed=seed)
+            expected = np.linalg.norm(a - b)
+            assert kernel(_ptr(a), _ptr(b)) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("n", [4, 8, 16])
+    def test_kernel_matches_generic(self, n):
+        kernel = getattr(_LIB, self.KERNELS[n])
+        a, b = _pair(n, seed=n)
+        generic = _LIB.evocore_param_distance(_ptr(a), _ptr(b), n)
+        assert kernel(_ptr(a), _ptr(b)) == pytest.approx(generic)
+
+    def test_dispatch_table(self):
+        assert sorted(_SPECIALIZED) == [4, 8, 16]
+        for n, name in self.KERNELS.items():
+            assert _SPECIALIZED[n] is getattr(_LIB, name)
+
+    @pytest.mark.parametrize("n", [4, 8, 16])
+    def test_dispatched_distance(self, n):
+        a, b = _pair(n, seed=100 + n)
+        assert param_distance(a, b) == pytest.approx(np.linalg.norm(a - b))
+        assert param_distance(list(a), list(b)) == pytest.approx(np.linalg.norm(a - b))
+
+
+class TestSimilarityMatrix:
+    IDS = ["bull", "bear", "sideways", "volatile"]
+
+    def _matrix(self):
+        matrix = SimilarityMatrix(self.IDS)
+        matrix.update("bull", "bear", 0.2)
+        matrix.update("bull", "sideways", 0.6)
+        matrix.update("bear", "volatile", 0.9)
+        return matrix
+
+    def test_update_get_round_trip(self):
+        matrix = self._matrix()
+        assert matrix.context_count == 4
+        assert matrix.get("bull", "bear") == pytest.approx(0.2)
+        assert matrix.get("bull", "sideways") == pytest.approx(0.6)
+        assert matrix.get("sideways", "volatile") == 0.0
+        for ctx in self.IDS:
+            assert matrix.get(ctx, ctx) == 1.0
+
+    def test_symmetric(self):
+        matrix = self._matrix()
+        for a in self.IDS:
+            for b in self.IDS:
+                assert matrix.get(a, b) == matrix.get(b, a)
+        assert np.array_equal(matrix._view, matrix._view.T)
+
+    def test_string_variant_agrees(self):
+        matrix = self._matrix()
+        raw = matrix._matrix
+        for a in self.IDS:
+            for b in self.IDS:
+                assert _LIB.evocore_similarity_get(raw, a.encode(), b.encode()) == matrix.get(a, b)
+        assert _LIB.evocore_similarity_update(raw, b"sideways", b"volatile", 0.4)
+        assert matrix.get("volatile", "sideways") == pytest.approx(0.4)
+
+    def test_unknown_ids_fall_back(self):
+        matrix = self._matrix()
+        before = matrix._view.copy()
+
+        assert matrix.update("bull", "crash", 0.5) is False
+        assert matrix.update("crash", "crab", 0.5) is False
+        assert np.array_equal(matrix._view, before)
+
+        assert matrix.get("bull", "crash") == 0.0
+        assert matrix.get("crash", "crash") == 0.0
+        assert matrix.find_nearest("crash") is None
+
+    def test_find_nearest(self):
+        matrix = self._matrix()
+        assert matrix.find_nearest("bull") == "sideways"
+        assert matrix.find_nearest("bear") == "volatile"
+        assert matrix.find_nearest("volatile") == "bear"
+
+    def test_find_nearest_skips_self(self):
+        # Self-similarity (1.0) beats every other entry; it must be masked
+        matrix = SimilarityMatrix(self.IDS)
+        raw = matrix._matrix
+        for i, ctx in enumerate(self.IDS):
+            nearest = matrix.find_nearest(ctx)
+            assert nearest is not None and nearest != ctx
+            assert _LIB.evocore_similarity_find_nearest_idx(raw, i) != i
+            c_nearest = _LIB.evocore_similarity_find_nearest(raw, ctx.encode())
+            assert _FFI.string(c_nearest).decode() != ctx
+
+    def test_find_nearest_single_context(self):
+        matrix = SimilarityMatrix(["only"])
+        assert matrix.find_nearest("only") is None
+        assert _LIB.evocore_similarity_find_nearest(matrix._matrix, b"only") == _FFI.NULL
+
+
+class TestTransferParams:
+    PARAMS = np.array([1.0, -2.0, 0.5, 4.0])
+
+    def _matrix(self, similarity):
+        matrix = SimilarityMatrix(["src", "dst", "other"])
+        matrix.update("src", "dst", similarity)
+        return matrix
+
+    @pytest.mark.parametrize("similarity,adjustment", [(0.8, 0.5), (0.25, 0.3), (1.0, 0.9)])
+    def test_known_contexts_scale_by_similarity(self, similarity, adjustment):
+        matrix = self._matrix(similarity)
+        result = transfer_params(self.PARAMS, "src", "dst", matrix, adjustment)
+        scale = 1.0 - adjustment * (1.0 - similarity)
+        np.testing.assert_allclose(result, self.PARAMS * scale)
+
+    def test_pinned_value(self):
+        # similarity 0.8, adjustment 0.5: scale = 1 - 0.5 * 0.2 = 0.9
+        result = transfer_params(self.PARAMS, "src", "dst", self._matrix(0.8), 0.5)
+        np.testing.assert_allclose(result, [0.9, -1.8, 0.45, 3.6])
+
+    @pytest.mark.parametrize("source,target", [("src", "nowhere"), ("nowhere", "dst"),
+                                               ("a", "b")])
+    def test_unknown_contexts_keep_previous_result(self, source, target):
+        # Before similarity-aware transfer every call returned
+        # params * (1 - adjustment); unknown contexts still do
+        adjustment = 0.3
+        result = transfer_params(self.PARAMS, source, target, self._matrix(0.8), adjustment)
+        np.testing.assert_allclose(result, self.PARAMS * (1.0 - adjustment))
+
+    def test_string_and_index_variants_agree(self):
+        matrix = self._matrix(0.6)
+        out = np.empty(len(self.PARAMS))
+        assert _LIB.evocore_transfer_params(
+            _ptr(self.PARAMS), b"src", b"dst", matrix._matrix,
+            len(self.PARAMS), _ptr(out), 0.4,
+        )
+        np.testing.assert_allclose(
+            out, transfer_params(self.PARAMS, "src", "dst", matrix, 0.4))
+
+    def test_empty_params(self):
+        assert transfer_params(np.empty(0), "src", "dst", self._matrix(0.5)) is None
@@ -349,3 +349,28 @@ const evocore_config_entry_t* evocore_config_get_entry(const evocore_config_t *c
 
     return &static_entry;
 }
+
+size_t evocore_config_get_section_bulk(const evocore_config_t *config,
+                                       const char *section,
+                                       const char **out_keys,
+                                       const char **out_values,
+                                       int *out_types,
+                                       size_t capacity) {
+    if (!config || !out_keys || !out_values) return 0;
+
+    /* NULL section means global section (empty string name) */
+    const char *sec_name = section ? section : "";
+    config_section_t *sec = find_section(config, sec_name);
+    if (!sec) return 0;
+
+    /* Single walk of the entry list, in evocore_config_get_entry() order */
+    size_t n = 0;
+    for (config_entry_t *entry = sec->entries; entry && n < capacity; entry = entry->next) {
+        out_keys[n] = entry->key;
+        out_values[n] = entry->value;
+        if (out_types) out_types[n] = EVOCORE_CONFIG_TYPE_STRING;
+        n++;
+    }
+
+    return n;
+}
@@ -204,32 +204,119 @@ bool evocore_exploration_should_explore(
     return r < exp->current_rate;
 }
 
+size_t evocore_exploration_should_explore_batch(
+    const evocore_exploration_t *exp,
+    uint8_t *out_flags,
+    size_t n,
+    unsigned int *seed
+) {
+    if (!out_flags || n == 0) return 0;
+
+    double rate = exp ? exp->current_rate : 0.0;
+    /* Saturated rate: no draws, seed untouched (as in should_explore) */
+    if (rate <= 0.0 || rate >= 1.0) {
+        memset(out_flags, rate >= 1.0 ? 1 : 0, n);
+        return rate >= 1.0 ? n : 0;
+    }
+
+    /* Compare raw draws against a scaled threshold: no division per draw */
+    double threshold = rate * (double)RAND_MAX;
+    size_t explored = 0;
+    for (size_t i = 0; i < n; i++) {
+        uint8_t flag = (double)rand_r(seed) < threshold;
+        out_flags[i] = flag;
+        explored += flag;
+    }
+
+    return explored;
+}
+
+static inline uint64_t splitmix64_next(uint64_t *state) {
+    uint64_t z = (*state += 0x9E3779B97F4A7C15ULL);
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+size_t evocore_exploration_should_explore_packed(
+    const evocore_exploration_t *exp,
+    uint64_t *out_words,
+    size_t n,
+    unsigned int *seed
+) {
+    if (!out_words || n == 0) return 0;
+
+    size_t words = (n + 63) / 64;
+    double rate = exp ? exp->current_rate : 0.0;
+
+    if (rate <= 0.0 || rate >= 1.0) {
+        memset(out_words, rate >= 1.0 ? 0xFF : 0x00, words * sizeof(uint64_t));
+    } else {
+        /* u < rate * 2^64, compared on raw 64-bit draws: no branch per decision */
+        uint64_t threshold = (uint64_t)(rate * 18446744073709551616.0);
+        uint64_t state = seed ? *seed : 0;
+
+        for (size_t w = 0; w < words; w++) {
+            uint64_t mask = 0;
+            for (unsigned int bit = 0; bit < 64; bit++) {
+                mask |= (uint64_t)(splitmix64_next(&state) < threshold) << bit;
+            }
+            out_words[w] = mask;
+        }
+
+        if (seed) *seed = (unsigned int)(state ^ (state >> 32));
+    }
+
+    /* Clear bits past n so popcounts and scans stay exact */
+    if (n % 64) {
+        out_words[words - 1] &= (UINT64_C(1) << (n % 64)) - 1;
+    }
+
+    size_t explored = 0;
+    for (size_t w = 0; w < words; w++) {
+        explored += (size_t)__builtin_popcountll(out_words[w]);
+    }
+    return explored;
+}
+
 /*========================================================================
  * Bandit Selection (UCB1)
  *========================================================================*/
 
+/* Per-arm bytes across the SoA arrays (totals + means + radius + counts) */
+#define BANDIT_ARM_BYTES (sizeof(size_t) + 3 * sizeof(double))
+
 evocore_bandit_t* evocore_bandit_create(size_t arm_count, double ucb_c) {
     if (arm_count == 0) return NULL;
 
     evocore_bandit_t *bandit = calloc(1, sizeof(evocore_bandit_t));
     if (!bandit) return NULL;
 
-    bandit->arms = calloc(arm_count, sizeof(evocore_bandit_arm_t));
-    if (!bandit->arms) {
+    /*
+     * One block holds every per-arm array. The double arrays come first
+     * and counts last, so each array stays aligned even when size_t is
+     * narrower than double and arm_count is odd.
+     */
+    bandit->total_rewards = calloc(arm_count, BANDIT_ARM_BYTES);
+    if (!bandit->total_rewards) {
         free(bandit);
         return NULL;
     }
+    bandit->mean_rewards = bandit->total_rewards + arm_count;
+    bandit->arm_radius = bandit->mean_rewards + arm_count;
+    bandit->counts = (size_t*)(bandit->arm_radius + arm_count);
 
     bandit->count = arm_count;
     bandit->ucb_c = ucb_c;
     bandit->total_pulls = 0;
+    bandit->ucb_scale = 0.0;
 
     return bandit;
 }
 
 void evocore_bandit_free(evocore_bandit_t *bandit) {
     if (!bandit) return;
-    free(bandit->arms);
+    free(bandit->total_rewards);
     free(bandit);
 }
 
@@ -240,19 +327,43 @@ size_t evocore_bandit_select_ucb(const evocore_bandit_t *bandit) {
     double best_ucb = -INFINITY;
 
     for (size_t i = 0; i < bandit->count; i++) {
-        const evocore_bandit_arm_t *arm = &bandit->arms[i];
-
         double ucb;
-        if (arm->count == 0) {
+        if (bandit->counts[i] == 0) {
             /* Never pulled, select it */
             ucb = INFINITY;
         } else {
             /* UCB1 formula: mean + c * sqrt(ln(n) / n_i) */
             double exploration = bandit->ucb_c *
-                               sqrt(log((double)bandit->total_pulls) / (double)arm->count);
-            ucb = arm->mean_reward + exploration;
+                               sqrt(log((double)bandit->total_pulls) / (double)bandit->counts[i]);
+            ucb = bandit->mean_rewards[i] + exploration;
+        }
+
+        if (ucb > best_ucb) {
+            best_ucb = ucb;
+            best_arm = i;
         }
+    }
+
+    return best_arm;
+}
+
+size_t evocore_bandit_select_ucb_cached(const evocore_bandit_t *bandit) {
+    if (!bandit || bandit->count == 0) return 0;
+
+    const size_t *counts = bandit->counts;
+    const double *means = bandit->mean_rewards;
+    const double *radius = bandit->arm_radius;
+    double scale = bandit->ucb_scale;
+
+    /* Never-pulled arms are selected first (dense scan of counts only) */
+    for (size_t i = 0; i < bandit->count; i++) {
+        if (counts[i] == 0) return i;
+    }
 
+    size_t best_arm = 0;
+    double best_ucb = -INFINITY;
+    for (size_t i = 0; i < bandit->count; i++) {
+        double ucb = means[i] + scale * radius[i];
         if (ucb > best_ucb) {
             best_ucb = ucb;
             best_arm = i;
@@ -265,13 +376,74 @@ size_t evocore_bandit_select_ucb(const evocore_bandit_t *bandit) {
 void evocore_bandit_update(evocore_bandit_t *bandit, size_t arm_idx, double reward) {
     if (!bandit || arm_idx >= bandit->count) return;
 
-    evocore_bandit_arm_t *arm = &bandit->arms[arm_idx];
-
-    arm->count++;
-    arm->total_reward += reward;
-    arm->mean_reward = arm->total_reward / (double)arm->count;
+    size_t count = ++bandit->counts[arm_idx];
+    bandit->total_rewards[arm_idx] += reward;
+    bandit->mean_rewards[arm_idx] = bandit->total_rewards[arm_idx] / (double)count;
 
     bandit->total_pulls++;
+
+    /* Only the pulled arm's radius and the shared scale change */
+    bandit->arm_radius[arm_idx] = 1.0 / sqrt((double)count);
+    bandit->ucb_scale = bandit->ucb_c * sqrt(log((double)bandit->total_pulls));
+}
+
+size_t evocore_bandit_select_ucb_batch(
+    const evocore_bandit_t *bandit,
+    size_t *out_arms,
+    size_t n
+) {
+    if (!bandit || bandit->count == 0 || !out_arms) return 0;
+
+    /*
+     * Treat each selection as a pending pull with unchanged mean, so the
+     * batch spreads over arms instead of repeating the current argmax.
+     */
+    size_t *counts = malloc(bandit->count * sizeof(size_t));
+    if (!counts) return 0;
+    for (size_t i = 0; i < bandit->count; i++) {
+        counts[i] = bandit->counts[i];
+    }
+    size_t total = bandit->total_pulls;
+
+    for (size_t k = 0; k < n; k++) {
+        size_t best_arm = 0;
+        double best_ucb = -INFINITY;
+        double log_total = log((double)total);
+
+        for (size_t i = 0; i < bandit->count; i++) {
+            double ucb;
+            if (counts[i] == 0) {
+                ucb = INFINITY;
+            } else {
+                ucb = bandit->mean_rewards[i] +
+                      bandit->ucb_c * sqrt(log_total / (double)counts[i]);
+            }
+            if (ucb > best_ucb) {
+                best_ucb = ucb;
+                best_arm = i;
+            }
+        }
+
+        out_arms[k] = best_arm;
+        counts[best_arm]++;
+        total++;
+    }
+
+    free(counts);
+    return n;
+}
+
+void evocore_bandit_update_batch(
+    evocore_bandit_t *bandit,
+    const size_t *arms,
+    const double *rewards,
+    size_t n
+) {
+    if (!bandit || !arms || !rewards) return;
+
+    for (size_t k = 0; k < n; k++) {
+        evocore_bandit_update(bandit, arms[k], rewards[k]);
+    }
 }
 
 size_t evocore_bandit_arm_count(const evocore_bandit_t *bandit) {
@@ -286,10 +458,22 @@ bool evocore_bandit_get_stats(
 ) {
     if (!bandit || arm_idx >= bandit->count) return false;
 
-    const evocore_bandit_arm_t *arm = &bandit->arms[arm_idx];
+    if (out_count) *out_count = bandit->counts[arm_idx];
+    if (out_mean) *out_mean = bandit->mean_rewards[arm_idx];
+
+    return true;
+}
+
+bool evocore_bandit_get_arm(
+    const evocore_bandit_t *bandit,
+    size_t arm_idx,
+    evocore_bandit_arm_t *out
+) {
+    if (!bandit || !out || arm_idx >= bandit->count) return false;
 
-    if (out_count) *out_count = arm->count;
-    if (out_mean) *out_mean = arm->mean_reward;
+    out->count = bandit->counts[arm_idx];
+    out->total_reward = bandit->total_rewards[arm_idx];
+    out->mean_reward = bandit->mean_rewards[arm_idx];
 
     return true;
 }
@@ -297,8 +481,9 @@ bool evocore_bandit_get_stats(
 void evocore_bandit_reset(evocore_bandit_t *bandit) {
     if (!bandit) return;
 
-    memset(bandit->arms, 0, bandit->count * sizeof(evocore_bandit_arm_t));
+    memset(bandit->total_rewards, 0, bandit->count * BANDIT_ARM_BYTES);
     bandit->total_pulls = 0;
+    bandit->ucb_scale = 0.0;
 }
 
 /*========================================================================
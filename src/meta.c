@@ -7,6 +7,11 @@
 #include <string.h>
 #include <time.h>
 #include <math.h>
+#include <pthread.h>
+
+#ifdef OMP_SUPPORT
+#include <omp.h>
+#endif
 
 /*========================================================================
  * Default Meta-Parameters
@@ -202,6 +207,45 @@ void evocore_meta_params_clone(const evocore_meta_params_t *src,
     memcpy(dst, src, sizeof(evocore_meta_params_t));
 }
 
+/*
+ * Freelist of parameter-sized blocks for language bindings that allocate
+ * evocore_meta_params_t one at a time. Every block handed out is at least
+ * sizeof(evocore_meta_params_t), so any freed block may be recycled.
+ */
+#define META_PARAMS_POOL_MAX 64
+
+static void *g_params_pool[META_PARAMS_POOL_MAX];
+static size_t g_params_pool_count = 0;
+static pthread_mutex_t g_params_pool_lock = PTHREAD_MUTEX_INITIALIZER;
+
+void* evocore_meta_params_alloc(size_t size) {
+    if (size > sizeof(evocore_meta_params_t)) {
+        return evocore_malloc(size);
+    }
+
+    void *block = NULL;
+    pthread_mutex_lock(&g_params_pool_lock);
+    if (g_params_pool_count > 0) {
+        block = g_params_pool[--g_params_pool_count];
+    }
+    pthread_mutex_unlock(&g_params_pool_lock);
+
+    return block ? block : evocore_malloc(sizeof(evocore_meta_params_t));
+}
+
+void evocore_meta_params_free(void *ptr) {
+    if (ptr == NULL) return;
+
+    pthread_mutex_lock(&g_params_pool_lock);
+    if (g_params_pool_count < META_PARAMS_POOL_MAX) {
+        g_params_pool[g_params_pool_count++] = ptr;
+        ptr = NULL;
+    }
+    pthread_mutex_unlock(&g_params_pool_lock);
+
+    evocore_free(ptr);
+}
+
 /*========================================================================
  * Meta-Individual Management
  *========================================================================*/
@@ -313,15 +357,6 @@ double evocore_meta_individual_improvement_trend(const evocore_meta_individual_t
  * Meta-Population Management
  *========================================================================*/
 
-static int compare_meta_individuals(const void *a, const void *b) {
-    const evocore_meta_individual_t *ia = (const evocore_meta_individual_t*)a;
-    const evocore_meta_individual_t *ib = (const evocore_meta_individual_t*)b;
-
-    if (ia->meta_fitness > ib->meta_fitness) return -1;
-    if (ia->meta_fitness < ib->meta_fitness) return 1;
-    return 0;
-}
-
 evocore_error_t evocore_meta_population_init(evocore_meta_population_t *meta_pop,
                                           int size,
                                           unsigned int *seed) {
@@ -391,14 +426,9 @@ evocore_meta_individual_t* evocore_meta_population_best(evocore_meta_population_
     return best;
 }
 
-evocore_error_t evocore_meta_population_evolve(evocore_meta_population_t *meta_pop,
-                                            unsigned int *seed) {
-    if (meta_pop == NULL || !meta_pop->initialized) {
-        return EVOCORE_ERR_NULL_PTR;
-    }
-
-    unsigned int local_seed = seed ? *seed : (unsigned int)time(NULL);
-
+/* Sort, record the best and compute the elite / replacement bounds */
+static void meta_evolve_prepare(evocore_meta_population_t *meta_pop,
+                                int *elite_count, int *replace_start) {
     /* Sort by fitness */
     evocore_meta_population_sort(meta_pop);
 
@@ -410,28 +440,79 @@ evocore_error_t evocore_meta_population_evolve(evocore_meta_population_t *meta_p
     }
 
     /* Elitism: keep top 30% */
-    int elite_count = (int)(meta_pop->count * 0.3);
-    if (elite_count < 1) elite_count = 1;
+    *elite_count = (int)(meta_pop->count * 0.3);
+    if (*elite_count < 1) *elite_count = 1;
 
     /* Replace bottom 50% with children of elite */
-    int replace_start = meta_pop->count - (int)(meta_pop->count * 0.5);
+    *replace_start = meta_pop->count - (int)(meta_pop->count * 0.5);
+}
+
+/* Replace individual i with a mutated clone of an elite parent */
+static void meta_breed_child(evocore_meta_population_t *meta_pop, int i,
+                             int elite_count, unsigned int *rng) {
+    /* Select two parents from elite (never overlaps the replaced range) */
+    int p1 = rand_r(rng) % elite_count;
+    int p2 = rand_r(rng) % elite_count;
+
+    /* Clone better parent */
+    int better = (meta_pop->individuals[p1].meta_fitness >
+                  meta_pop->individuals[p2].meta_fitness) ? p1 : p2;
+
+    evocore_meta_individual_cleanup(&meta_pop->individuals[i]);
+    evocore_meta_individual_init(&meta_pop->individuals[i],
+                                &meta_pop->individuals[better].params,
+                                50);
+
+    /* Mutate */
+    evocore_meta_params_mutate(&meta_pop->individuals[i].params, rng);
+}
 
+evocore_error_t evocore_meta_population_evolve(evocore_meta_population_t *meta_pop,
+                                            unsigned int *seed) {
+    if (meta_pop == NULL || !meta_pop->initialized) {
+        return EVOCORE_ERR_NULL_PTR;
+    }
+
+    unsigned int local_seed = seed ? *seed : (unsigned int)time(NULL);
+
+    int elite_count, replace_start;
+    meta_evolve_prepare(meta_pop, &elite_count, &replace_start);
+
+    /* One RNG stream shared by all children */
     for (int i = replace_start; i < meta_pop->count; i++) {
-        /* Select two parents from elite */
-        int p1 = rand_r(&local_seed) % elite_count;
-        int p2 = rand_r(&local_seed) % elite_count;
+        meta_breed_child(meta_pop, i, elite_count, &local_seed);
+    }
 
-        /* Clone better parent */
-        int better = (meta_pop->individuals[p1].meta_fitness >
-                      meta_pop->individuals[p2].meta_fitness) ? p1 : p2;
+    meta_pop->current_generation++;
 
-        evocore_meta_individual_cleanup(&meta_pop->individuals[i]);
-        evocore_meta_individual_init(&meta_pop->individuals[i],
-                                    &meta_pop->individuals[better].params,
-                                    50);
+    evocore_log_trace("Meta-population evolved to generation %d",
+                    meta_pop->current_generation);
+
+    return EVOCORE_OK;
+}
+
+evocore_error_t evocore_meta_population_evolve_parallel(evocore_meta_population_t *meta_pop,
+                                                     unsigned int *seed,
+                                                     int num_threads) {
+    if (meta_pop == NULL || !meta_pop->initialized) {
+        return EVOCORE_ERR_NULL_PTR;
+    }
+
+    unsigned int local_seed = seed ? *seed : (unsigned int)time(NULL);
 
-        /* Mutate */
-        evocore_meta_params_mutate(&meta_pop->individuals[i].params, &local_seed);
+    int elite_count, replace_start;
+    meta_evolve_prepare(meta_pop, &elite_count, &replace_start);
+
+#ifdef OMP_SUPPORT
+    int threads = num_threads > 0 ? num_threads : omp_get_max_threads();
+    #pragma omp parallel for schedule(static) num_threads(threads) if(threads > 1)
+#else
+    (void)num_threads;
+#endif
+    for (int i = replace_start; i < meta_pop->count; i++) {
+        /* Per-child RNG stream so results don't depend on thread count */
+        unsigned int child_seed = local_seed ^ ((unsigned int)i * 2654435761u);
+        meta_breed_child(meta_pop, i, elite_count, &child_seed);
     }
 
     meta_pop->current_generation++;
@@ -447,8 +528,42 @@ void evocore_meta_population_sort(evocore_meta_population_t *meta_pop) {
         return;
     }
 
-    qsort(meta_pop->individuals, meta_pop->count,
-          sizeof(evocore_meta_individual_t), compare_meta_individuals);
+    /*
+     * Sort on a contiguous copy of the fitness keys and permute the
+     * (large) individuals once, instead of swapping whole structs
+     * inside qsort. Insertion sort is ideal for <= 20 elements.
+     */
+    int n = meta_pop->count;
+    double keys[EVOCORE_MAX_META_INDIVIDUALS];
+    int order[EVOCORE_MAX_META_INDIVIDUALS];
+
+    for (int i = 0; i < n; i++) {
+        keys[i] = meta_pop->individuals[i].meta_fitness;
+    }
+
+    bool sorted = true;
+    for (int i = 0; i < n; i++) {
+        double key = keys[i];
+        int j = i;
+        while (j > 0 && keys[j - 1] < key) {
+            keys[j] = keys[j - 1];
+            order[j] = order[j - 1];
+            j--;
+        }
+        keys[j] = key;
+        order[j] = i;
+        if (j != i) sorted = false;
+    }
+
+    if (sorted) {
+        return;
+    }
+
+    evocore_meta_individual_t tmp[EVOCORE_MAX_META_INDIVIDUALS];
+    memcpy(tmp, meta_pop->individuals, (size_t)n * sizeof(evocore_meta_individual_t));
+    for (int i = 0; i < n; i++) {
+        meta_pop->individuals[i] = tmp[order[i]];
+    }
 }
 
 bool evocore_meta_population_converged(const evocore_meta_population_t *meta_pop,
@@ -471,6 +586,26 @@ bool evocore_meta_population_converged(const evocore_meta_population_t *meta_pop
     return fabs(trend) < threshold;
 }
 
+size_t evocore_meta_population_snapshot(const evocore_meta_population_t *meta_pop,
+                                        double *out,
+                                        size_t max_individuals) {
+    if (meta_pop == NULL || out == NULL || !meta_pop->initialized) {
+        return 0;
+    }
+
+    size_t n = (size_t)meta_pop->count;
+    if (n > max_individuals) n = max_individuals;
+
+    for (size_t i = 0; i < n; i++) {
+        const evocore_meta_individual_t *ind = &meta_pop->individuals[i];
+        out[3 * i] = ind->meta_fitness;
+        out[3 * i + 1] = (double)ind->generation;
+        out[3 * i + 2] = evocore_meta_individual_average_fitness(ind);
+    }
+
+    return n;
+}
+
 /*========================================================================
  * Meta-Evaluation
  *========================================================================*/
@@ -510,6 +645,25 @@ double evocore_meta_evaluate(const evocore_meta_params_t *params,
     return score;
 }
 
+void evocore_meta_evaluate_many(const evocore_meta_params_t *const *params,
+                               size_t count,
+                               const double *best_fitness,
+                               const double *avg_fitness,
+                               const double *diversity,
+                               const int *generations,
+                               double *out_meta_fitness) {
+    if (params == NULL || best_fitness == NULL || avg_fitness == NULL ||
+        diversity == NULL || generations == NULL || out_meta_fitness == NULL) {
+        return;
+    }
+
+    for (size_t i = 0; i < count; i++) {
+        out_meta_fitness[i] = evocore_meta_evaluate(params[i], best_fitness[i],
+                                                    avg_fitness[i], diversity[i],
+                                                    generations[i]);
+    }
+}
+
 /*========================================================================
  * Utility Functions
  *========================================================================*/
@@ -18,6 +18,12 @@
 #include <sys/types.h>
 #include <dirent.h>
 #include <fcntl.h>
+#include <pthread.h>
+
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define EVOCORE_CRC_PCLMUL 1
+#include <immintrin.h>
+#endif
 
 /*========================================================================
  * Binary Format Definitions
@@ -1331,6 +1337,55 @@ evocore_error_t evocore_checkpoint_save(const evocore_checkpoint_t *checkpoint,
     return EVOCORE_OK;
 }
 
+/*
+ * Parse the checkpoint header fields (everything written before the
+ * "population" key) from a NUL-terminated JSON buffer.
+ */
+static void parse_checkpoint_header(const char *buffer,
+                                    evocore_checkpoint_t *checkpoint) {
+    memset(checkpoint, 0, sizeof(*checkpoint));
+
+    const char *version_ptr = strstr(buffer, "\"version\"");
+    if (version_ptr) {
+        if (sscanf(version_ptr, "\"version\": \"%15[^\"]\"",
+                  checkpoint->version) == 1) {
+            /* OK */
+        }
+    }
+
+    const char *timestamp_ptr = strstr(buffer, "\"timestamp\"");
+    if (timestamp_ptr) {
+        if (sscanf(timestamp_ptr, "\"timestamp\": %lf",
+                  &checkpoint->timestamp) == 1) {
+            /* OK */
+        }
+    }
+
+    const char *domain_ptr = strstr(buffer, "\"domain\"");
+    if (domain_ptr) {
+        if (sscanf(domain_ptr, "\"domain\": \"%63[^\"]\"",
+                  checkpoint->domain_name) == 1) {
+            /* OK */
+        }
+    }
+
+    const char *generation_ptr = strstr(buffer, "\"generation\"");
+    if (generation_ptr) {
+        unsigned long gen;
+        if (sscanf(generation_ptr, "\"generation\": %lu", &gen) == 1) {
+            checkpoint->generation = gen;
+        }
+    }
+
+    const char *best_fitness_ptr = strstr(buffer, "\"best_fitness\"");
+    if (best_fitness_ptr) {
+        if (sscanf(best_fitness_ptr, "\"best_fitness\": %lf",
+                  &checkpoint->best_fitness) == 1) {
+            /* OK */
+        }
+    }
+}
+
 evocore_error_t evocore_checkpoint_load(const char *filepath,
                                     evocore_checkpoint_t *checkpoint) {
     if (!filepath || !checkpoint) {
@@ -1356,7 +1411,7 @@ evocore_error_t evocore_checkpoint_load(const char *filepath,
         return EVOCORE_ERR_FILE_READ;
     }
 
-    char *buffer = (char*)evocore_malloc(file_size);
+    char *buffer = (char*)evocore_malloc((size_t)file_size + 1);
     if (!buffer) {
         fclose(f);
         return EVOCORE_ERR_OUT_OF_MEMORY;
@@ -1369,51 +1424,53 @@ evocore_error_t evocore_checkpoint_load(const char *filepath,
         evocore_free(buffer);
         return EVOCORE_ERR_FILE_READ;
     }
+    buffer[read_size] = '\0';
 
     /* Parse checkpoint JSON - simplified */
-    memset(checkpoint, 0, sizeof(*checkpoint));
+    parse_checkpoint_header(buffer, checkpoint);
 
-    char *version_ptr = strstr(buffer, "\"version\"");
-    if (version_ptr) {
-        if (sscanf(version_ptr, "\"version\": \"%15[^\"]\"",
-                  checkpoint->version) == 1) {
-            /* OK */
-        }
-    }
+    evocore_free(buffer);
 
-    char *timestamp_ptr = strstr(buffer, "\"timestamp\"");
-    if (timestamp_ptr) {
-        if (sscanf(timestamp_ptr, "\"timestamp\": %lf",
-                  &checkpoint->timestamp) == 1) {
-            /* OK */
-        }
+    return EVOCORE_OK;
+}
+
+/*
+ * Header fields are written first; this covers them for files written by
+ * evocore_checkpoint_save(). Longer headers fall back to a full load.
+ */
+#define CHECKPOINT_PEEK_BYTES 1024
+
+evocore_error_t evocore_checkpoint_peek(const char *filepath,
+                                    evocore_checkpoint_t *checkpoint) {
+    if (!filepath || !checkpoint) {
+        return EVOCORE_ERR_NULL_PTR;
     }
 
-    char *domain_ptr = strstr(buffer, "\"domain\"");
-    if (domain_ptr) {
-        if (sscanf(domain_ptr, "\"domain\": \"%63[^\"]\"",
-                  checkpoint->domain_name) == 1) {
-            /* OK */
-        }
+    FILE *f = fopen(filepath, "rb");
+    if (!f) {
+        return EVOCORE_ERR_FILE_NOT_FOUND;
     }
 
-    char *generation_ptr = strstr(buffer, "\"generation\"");
-    if (generation_ptr) {
-        unsigned long gen;
-        if (sscanf(generation_ptr, "\"generation\": %lu", &gen) == 1) {
-            checkpoint->generation = gen;
-        }
+    char buffer[CHECKPOINT_PEEK_BYTES + 1];
+    size_t read_size = fread(buffer, 1, CHECKPOINT_PEEK_BYTES, f);
+    int read_error = ferror(f);
+    fclose(f);
+
+    if (read_error || read_size == 0) {
+        return EVOCORE_ERR_FILE_READ;
     }
+    buffer[read_size] = '\0';
 
-    char *best_fitness_ptr = strstr(buffer, "\"best_fitness\"");
-    if (best_fitness_ptr) {
-        if (sscanf(best_fitness_ptr, "\"best_fitness\": %lf",
-                  &checkpoint->best_fitness) == 1) {
-            /* OK */
-        }
+    /* Never look past the header into population data */
+    char *population_ptr = strstr(buffer, "\"population\"");
+    if (population_ptr) {
+        *population_ptr = '\0';
+    } else if (read_size == CHECKPOINT_PEEK_BYTES) {
+        /* Header longer than the prefix: parse the whole file instead */
+        return evocore_checkpoint_load(filepath, checkpoint);
     }
 
-    evocore_free(buffer);
+    parse_checkpoint_header(buffer, checkpoint);
 
     return EVOCORE_OK;
 }
@@ -1644,15 +1701,233 @@ void evocore_checkpoint_list_free(char **list, int count) {
     evocore_free(list);
 }
 
+char* evocore_checkpoint_list_packed(const char *directory, size_t *out_len,
+                                     int *out_count) {
+    if (!directory || !out_len || !out_count) {
+        return NULL;
+    }
+
+    *out_len = 0;
+    *out_count = 0;
+
+    DIR *dir = opendir(directory);
+    if (!dir) {
+        return NULL;
+    }
+
+    size_t dir_len = strlen(directory);
+    size_t capacity = 0;
+    size_t used = 0;
+    int entries = 0;
+    char *buf = NULL;
+    struct dirent *ent;
+
+    while ((ent = readdir(dir)) != NULL) {
+        if (strncmp(ent->d_name, "checkpoint_", 11) != 0) {
+            continue;
+        }
+
+        /* "<directory>/<name>\0" */
+        size_t needed = dir_len + 1 + strlen(ent->d_name) + 1;
+        if (used + needed > capacity) {
+            size_t new_capacity = capacity ? capacity * 2 : 1024;
+            while (new_capacity < used + needed) {
+                new_capacity *= 2;
+            }
+            char *grown = (char*)evocore_realloc(buf, new_capacity);
+            if (!grown) {
+                evocore_free(buf);
+                closedir(dir);
+                return NULL;
+            }
+            buf = grown;
+            capacity = new_capacity;
+        }
+
+        memcpy(buf + used, directory, dir_len);
+        buf[used + dir_len] = '/';
+        memcpy(buf + used + dir_len + 1, ent->d_name, needed - dir_len - 1);
+        used += needed;
+        entries++;
+    }
+
+    closedir(dir);
+    *out_len = used;
+    *out_count = entries;
+
+    return buf;
+}
+
+void evocore_checkpoint_list_packed_free(char *packed) {
+    evocore_free(packed);
+}
+
 evocore_error_t evocore_checkpoint_info(const char *filepath,
                                      evocore_checkpoint_t *checkpoint) {
-    return evocore_checkpoint_load(filepath, checkpoint);
+    return evocore_checkpoint_peek(filepath, checkpoint);
 }
 
 /*========================================================================
  * Utility Functions
  *========================================================================*/
 
+/*
+ * CRC-32 (IEEE 802.3, reflected polynomial 0xEDB88320). Values are stored in
+ * binary checkpoint headers, so every code path must produce the same result
+ * as the original bitwise loop.
+ */
+#define CRC32_POLY 0xEDB88320u
+
+static uint32_t g_crc32_table[8][256];
+static pthread_once_t g_crc32_once = PTHREAD_ONCE_INIT;
+
+static void crc32_init_tables(void) {
+    for (uint32_t i = 0; i < 256; i++) {
+        uint32_t crc = i;
+        for (int j = 0; j < 8; j++) {
+            crc = (crc & 1) ? (crc >> 1) ^ CRC32_POLY : crc >> 1;
+        }
+        g_crc32_table[0][i] = crc;
+    }
+    for (uint32_t i = 0; i < 256; i++) {
+        uint32_t crc = g_crc32_table[0][i];
+        for (int k = 1; k < 8; k++) {
+            crc = (crc >> 8) ^ g_crc32_table[0][crc & 0xFF];
+            g_crc32_table[k][i] = crc;
+        }
+    }
+}
+
+/* Slicing-by-8 on the raw (pre-inverted) CRC state */
+static uint32_t crc32_slice8(uint32_t crc, const unsigned char *bytes, size_t size) {
+    while (size >= 8) {
+        uint32_t lo;
+        uint32_t hi;
+        memcpy(&lo, bytes, 4);
+        memcpy(&hi, bytes + 4, 4);
+        lo ^= crc;
+        crc = g_crc32_table[7][lo & 0xFF] ^
+              g_crc32_table[6][(lo >> 8) & 0xFF] ^
+              g_crc32_table[5][(lo >> 16) & 0xFF] ^
+              g_crc32_table[4][lo >> 24] ^
+              g_crc32_table[3][hi & 0xFF] ^
+              g_crc32_table[2][(hi >> 8) & 0xFF] ^
+              g_crc32_table[1][(hi >> 16) & 0xFF] ^
+              g_crc32_table[0][hi >> 24];
+        bytes += 8;
+        size -= 8;
+    }
+    while (size--) {
+        crc = (crc >> 8) ^ g_crc32_table[0][(crc ^ *bytes++) & 0xFF];
+    }
+    return crc;
+}
+
+#ifdef EVOCORE_CRC_PCLMUL
+/*
+ * Carry-less multiply folding ("Fast CRC Computation for Generic Polynomials
+ * Using PCLMULQDQ", Intel 2009). Requires size >= 64 and size % 16 == 0;
+ * operates on the raw CRC state like crc32_slice8().
+ */
+__attribute__((target("sse4.1,pclmul")))
+static uint32_t crc32_pclmul(uint32_t crc, const unsigned char *buf, size_t size) {
+    const __m128i k1k2 = _mm_set_epi64x(0x01c6e41596LL, 0x0154442bd4LL);
+    const __m128i k3k4 = _mm_set_epi64x(0x00ccaa009eLL, 0x01751997d0LL);
+    const __m128i k5k0 = _mm_set_epi64x(0, 0x0163cd6124LL);
+    const __m128i poly = _mm_set_epi64x(0x01f7011641LL, 0x01db710641LL);
+    const __m128i mask32 = _mm_setr_epi32(~0, 0, ~0, 0);
+
+    __m128i x1 = _mm_loadu_si128((const __m128i *)(buf + 0x00));
+    __m128i x2 = _mm_loadu_si128((const __m128i *)(buf + 0x10));
+    __m128i x3 = _mm_loadu_si128((const __m128i *)(buf + 0x20));
+    __m128i x4 = _mm_loadu_si128((const __m128i *)(buf + 0x30));
+    __m128i x0, x5, x6, x7, x8;
+
+    x1 = _mm_xor_si128(x1, _mm_cvtsi32_si128((int)crc));
+    buf += 64;
+    size -= 64;
+
+    /* Fold four 128-bit lanes in parallel */
+    while (size >= 64) {
+        x5 = _mm_clmulepi64_si128(x1, k1k2, 0x00);
+        x6 = _mm_clmulepi64_si128(x2, k1k2, 0x00);
+        x7 = _mm_clmulepi64_si128(x3, k1k2, 0x00);
+        x8 = _mm_clmulepi64_si128(x4, k1k2, 0x00);
+
+        x1 = _mm_clmulepi64_si128(x1, k1k2, 0x11);
+        x2 = _mm_clmulepi64_si128(x2, k1k2, 0x11);
+        x3 = _mm_clmulepi64_si128(x3, k1k2, 0x11);
+        x4 = _mm_clmulepi64_si128(x4, k1k2, 0x11);
+
+        x1 = _mm_xor_si128(_mm_xor_si128(x1, x5),
+                           _mm_loadu_si128((const __m128i *)(buf + 0x00)));
+        x2 = _mm_xor_si128(_mm_xor_si128(x2, x6),
+                           _mm_loadu_si128((const __m128i *)(buf + 0x10)));
+        x3 = _mm_xor_si128(_mm_xor_si128(x3, x7),
+                           _mm_loadu_si128((const __m128i *)(buf + 0x20)));
+        x4 = _mm_xor_si128(_mm_xor_si128(x4, x8),
+                           _mm_loadu_si128((const __m128i *)(buf + 0x30)));
+
+        buf += 64;
+        size -= 64;
+    }
+
+    /* Fold the four lanes into one */
+    x5 = _mm_clmulepi64_si128(x1, k3k4, 0x00);
+    x1 = _mm_clmulepi64_si128(x1, k3k4, 0x11);
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x2), x5);
+
+    x5 = _mm_clmulepi64_si128(x1, k3k4, 0x00);
+    x1 = _mm_clmulepi64_si128(x1, k3k4, 0x11);
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x3), x5);
+
+    x5 = _mm_clmulepi64_si128(x1, k3k4, 0x00);
+    x1 = _mm_clmulepi64_si128(x1, k3k4, 0x11);
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x4), x5);
+
+    /* Remaining 16-byte blocks */
+    while (size >= 16) {
+        x2 = _mm_loadu_si128((const __m128i *)buf);
+        x5 = _mm_clmulepi64_si128(x1, k3k4, 0x00);
+        x1 = _mm_clmulepi64_si128(x1, k3k4, 0x11);
+        x1 = _mm_xor_si128(_mm_xor_si128(x1, x2), x5);
+        buf += 16;
+        size -= 16;
+    }
+
+    /* Fold 128 bits to 64 */
+    x2 = _mm_clmulepi64_si128(x1, k3k4, 0x10);
+    x1 = _mm_xor_si128(_mm_srli_si128(x1, 8), x2);
+
+    x2 = _mm_srli_si128(x1, 4);
+    x1 = _mm_and_si128(x1, mask32);
+    x1 = _mm_clmulepi64_si128(x1, k5k0, 0x00);
+    x1 = _mm_xor_si128(x1, x2);
+
+    /* Barrett reduction to 32 bits */
+    x0 = _mm_and_si128(x1, mask32);
+    x0 = _mm_clmulepi64_si128(x0, poly, 0x10);
+    x0 = _mm_and_si128(x0, mask32);
+    x0 = _mm_clmulepi64_si128(x0, poly, 0x00);
+    x1 = _mm_xor_si128(x1, x0);
+
+    return (uint32_t)_mm_extract_epi32(x1, 1);
+}
+
+/* -1 until probed, then 0 or 1 */
+static int g_crc32_pclmul = -1;
+
+static inline int crc32_pclmul_available(void) {
+    int avail = g_crc32_pclmul;
+    if (avail < 0) {
+        __builtin_cpu_init();
+        avail = __builtin_cpu_supports("pclmul") && __builtin_cpu_supports("sse4.1");
+        g_crc32_pclmul = avail;
+    }
+    return avail;
+}
+#endif
+
 uint32_t evocore_checksum(const void *data, size_t size) {
     if (!data || size == 0) {
         return 0;
@@ -1661,18 +1936,18 @@ uint32_t evocore_checksum(const void *data, size_t size) {
     const unsigned char *bytes = (const unsigned char*)data;
     uint32_t crc = 0xFFFFFFFF;
 
-    for (size_t i = 0; i < size; i++) {
-        crc ^= bytes[i];
-        for (int j = 0; j < 8; j++) {
-            if (crc & 1) {
-                crc = (crc >> 1) ^ 0xEDB88320;
-            } else {
-                crc >>= 1;
-            }
-        }
+    pthread_once(&g_crc32_once, crc32_init_tables);
+
+#ifdef EVOCORE_CRC_PCLMUL
+    if (size >= 64 && crc32_pclmul_available()) {
+        size_t bulk = size & ~(size_t)15;
+        crc = crc32_pclmul(crc, bytes, bulk);
+        bytes += bulk;
+        size -= bulk;
     }
+#endif
 
-    return ~crc;
+    return ~crc32_slice8(crc, bytes, size);
 }
 
 bool evocore_checksum_validate(const void *data, size_t size, uint32_t expected) {
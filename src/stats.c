@@ -117,6 +117,23 @@ evocore_error_t evocore_stats_update(evocore_stats_t *stats,
     return EVOCORE_OK;
 }
 
+evocore_error_t evocore_stats_update_batch(evocore_stats_t *stats,
+                                      const evocore_population_t *const *pops,
+                                      size_t count) {
+    if (!stats || (!pops && count > 0)) {
+        return EVOCORE_ERR_NULL_PTR;
+    }
+
+    for (size_t i = 0; i < count; i++) {
+        evocore_error_t err = evocore_stats_update(stats, pops[i]);
+        if (err != EVOCORE_OK) {
+            return err;
+        }
+    }
+
+    return EVOCORE_OK;
+}
+
 evocore_error_t evocore_stats_record_operations(evocore_stats_t *stats,
                                           long long eval_count,
                                           long long mutations,
@@ -237,6 +254,16 @@ evocore_error_t evocore_stats_fitness_distribution(const evocore_population_t *p
     return EVOCORE_OK;
 }
 
+evocore_error_t evocore_stats_fitness_dist(const evocore_population_t *pop,
+                                           evocore_fitness_dist_t *out) {
+    if (!out) {
+        return EVOCORE_ERR_NULL_PTR;
+    }
+
+    return evocore_stats_fitness_distribution(pop, &out->min, &out->max,
+                                              &out->mean, &out->stddev);
+}
+
 /*========================================================================
  * Progress Reporting
  *======================================================================== */
@@ -11,6 +11,12 @@
 #include <string.h>
 #include <stdio.h>
 #include <math.h>
+#include <stdint.h>
+
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define EVOCORE_DISTANCE_SIMD 1
+#include <immintrin.h>
+#endif
 
 /*========================================================================
  * Constants
@@ -398,22 +404,18 @@ evocore_similarity_matrix_t* evocore_similarity_matrix_create(
     matrix->context_ids = context_ids;
     matrix->last_update = time(NULL);
 
+    /* Rows point into one contiguous row-major block */
     matrix->similarity_matrix = calloc(context_count, sizeof(double*));
-    if (!matrix->similarity_matrix) {
+    double *data = calloc(context_count * context_count, sizeof(double));
+    if (!matrix->similarity_matrix || !data) {
+        free(matrix->similarity_matrix);
+        free(data);
         free(matrix);
         return NULL;
     }
 
     for (size_t i = 0; i < context_count; i++) {
-        matrix->similarity_matrix[i] = calloc(context_count, sizeof(double));
-        if (!matrix->similarity_matrix[i]) {
-            for (size_t j = 0; j < i; j++) {
-                free(matrix->similarity_matrix[j]);
-            }
-            free(matrix->similarity_matrix);
-            free(matrix);
-            return NULL;
-        }
+        matrix->similarity_matrix[i] = data + i * context_count;
     }
 
     /* Initialize diagonal to 1.0 (self-similarity) */
@@ -428,27 +430,93 @@ void evocore_similarity_matrix_free(evocore_similarity_matrix_t *matrix) {
     if (!matrix) return;
 
     if (matrix->similarity_matrix) {
-        for (size_t i = 0; i < matrix->context_count; i++) {
-            free(matrix->similarity_matrix[i]);
-        }
+        free(matrix->similarity_matrix[0]);
         free(matrix->similarity_matrix);
     }
 
     free(matrix);
 }
 
+double* evocore_similarity_matrix_data(evocore_similarity_matrix_t *matrix) {
+    if (!matrix || !matrix->similarity_matrix) return NULL;
+    return matrix->similarity_matrix[0];
+}
+
+static size_t similarity_index(
+    const evocore_similarity_matrix_t *matrix,
+    const char *context_id
+) {
+    if (!matrix || !context_id || !matrix->context_ids) return SIZE_MAX;
+
+    for (size_t i = 0; i < matrix->context_count; i++) {
+        if (matrix->context_ids[i] && strcmp(matrix->context_ids[i], context_id) == 0) {
+            return i;
+        }
+    }
+    return SIZE_MAX;
+}
+
+bool evocore_similarity_update_idx(
+    evocore_similarity_matrix_t *matrix,
+    size_t index_a,
+    size_t index_b,
+    double similarity
+) {
+    if (!matrix || index_a >= matrix->context_count ||
+        index_b >= matrix->context_count) {
+        return false;
+    }
+
+    matrix->similarity_matrix[index_a][index_b] = similarity;
+    matrix->similarity_matrix[index_b][index_a] = similarity;
+    matrix->last_update = time(NULL);
+    return true;
+}
+
+double evocore_similarity_get_idx(
+    const evocore_similarity_matrix_t *matrix,
+    size_t index_a,
+    size_t index_b
+) {
+    if (!matrix || index_a >= matrix->context_count ||
+        index_b >= matrix->context_count) {
+        return 0.0;
+    }
+
+    return matrix->similarity_matrix[index_a][index_b];
+}
+
+size_t evocore_similarity_find_nearest_idx(
+    const evocore_similarity_matrix_t *matrix,
+    size_t target_index
+) {
+    if (!matrix || target_index >= matrix->context_count) return SIZE_MAX;
+
+    const double *row = matrix->similarity_matrix[target_index];
+    size_t best = SIZE_MAX;
+    double best_similarity = -INFINITY;
+
+    for (size_t i = 0; i < matrix->context_count; i++) {
+        if (i == target_index) continue;
+        if (row[i] > best_similarity) {
+            best_similarity = row[i];
+            best = i;
+        }
+    }
+
+    return best;
+}
+
 bool evocore_similarity_update(
     evocore_similarity_matrix_t *matrix,
     const char *context_a,
     const char *context_b,
     double similarity
 ) {
-    (void)matrix;
-    (void)context_a;
-    (void)context_b;
-    (void)similarity;
-    /* TODO: implement context ID lookup */
-    return false;
+    return evocore_similarity_update_idx(matrix,
+                                         similarity_index(matrix, context_a),
+                                         similarity_index(matrix, context_b),
+                                         similarity);
 }
 
 double evocore_similarity_get(
@@ -456,23 +524,100 @@ double evocore_similarity_get(
     const char *context_a,
     const char *context_b
 ) {
-    (void)matrix;
-    (void)context_a;
-    (void)context_b;
-    /* TODO: implement */
-    return 0.5;
+    return evocore_similarity_get_idx(matrix,
+                                      similarity_index(matrix, context_a),
+                                      similarity_index(matrix, context_b));
 }
 
 const char* evocore_similarity_find_nearest(
     const evocore_similarity_matrix_t *matrix,
     const char *target_context
 ) {
-    (void)matrix;
-    (void)target_context;
-    /* TODO: implement */
-    return NULL;
+    size_t nearest = evocore_similarity_find_nearest_idx(
+        matrix, similarity_index(matrix, target_context));
+    if (nearest == SIZE_MAX) return NULL;
+    return matrix->context_ids[nearest];
 }
 
+/*
+ * Squared-distance kernels. The library is built without -mavx2, so the
+ * wide variants are compiled per-function and chosen at runtime.
+ */
+typedef double (*distance_sq_fn)(const double *, const double *, size_t);
+
+static double distance_sq_scalar(const double *a, const double *b, size_t count) {
+    double sum_sq = 0.0;
+    for (size_t i = 0; i < count; i++) {
+        double diff = a[i] - b[i];
+        sum_sq += diff * diff;
+    }
+    return sum_sq;
+}
+
+#ifdef EVOCORE_DISTANCE_SIMD
+__attribute__((target("avx2,fma")))
+static double distance_sq_avx2(const double *a, const double *b, size_t count) {
+    __m256d acc0 = _mm256_setzero_pd();
+    __m256d acc1 = _mm256_setzero_pd();
+    size_t i = 0;
+
+    for (; i + 8 <= count; i += 8) {
+        __m256d d0 = _mm256_sub_pd(_mm256_loadu_pd(a + i), _mm256_loadu_pd(b + i));
+        __m256d d1 = _mm256_sub_pd(_mm256_loadu_pd(a + i + 4), _mm256_loadu_pd(b + i + 4));
+        acc0 = _mm256_fmadd_pd(d0, d0, acc0);
+        acc1 = _mm256_fmadd_pd(d1, d1, acc1);
+    }
+    if (i + 4 <= count) {
+        __m256d d0 = _mm256_sub_pd(_mm256_loadu_pd(a + i), _mm256_loadu_pd(b + i));
+        acc0 = _mm256_fmadd_pd(d0, d0, acc0);
+        i += 4;
+    }
+
+    acc0 = _mm256_add_pd(acc0, acc1);
+    __m128d sum2 = _mm_add_pd(_mm256_castpd256_pd128(acc0),
+                              _mm256_extractf128_pd(acc0, 1));
+    double sum_sq = _mm_cvtsd_f64(_mm_add_sd(sum2, _mm_unpackhi_pd(sum2, sum2)));
+
+    return sum_sq + distance_sq_scalar(a + i, b + i, count - i);
+}
+
+__attribute__((target("avx512f")))
+static double distance_sq_avx512(const double *a, const double *b, size_t count) {
+    __m512d acc0 = _mm512_setzero_pd();
+    __m512d acc1 = _mm512_setzero_pd();
+    size_t i = 0;
+
+    for (; i + 16 <= count; i += 16) {
+        __m512d d0 = _mm512_sub_pd(_mm512_loadu_pd(a + i), _mm512_loadu_pd(b + i));
+        __m512d d1 = _mm512_sub_pd(_mm512_loadu_pd(a + i + 8), _mm512_loadu_pd(b + i + 8));
+        acc0 = _mm512_fmadd_pd(d0, d0, acc0);
+        acc1 = _mm512_fmadd_pd(d1, d1, acc1);
+    }
+    if (i + 8 <= count) {
+        __m512d d0 = _mm512_sub_pd(_mm512_loadu_pd(a + i), _mm512_loadu_pd(b + i));
+        acc0 = _mm512_fmadd_pd(d0, d0, acc0);
+        i += 8;
+    }
+
+    double sum_sq = _mm512_reduce_add_pd(_mm512_add_pd(acc0, acc1));
+    return sum_sq + distance_sq_scalar(a + i, b + i, count - i);
+}
+#endif
+
+static distance_sq_fn resolve_distance_sq(void) {
+#ifdef EVOCORE_DISTANCE_SIMD
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx512f")) return distance_sq_avx512;
+    if (__builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma")) {
+        return distance_sq_avx2;
+    }
+#endif
+    return distance_sq_scalar;
+}
+
+/* Resolved on first use; concurrent first calls store the same value */
+static distance_sq_fn g_distance_sq = NULL;
+
 double evocore_param_distance(
     const double *params1,
     const double *params2,
@@ -480,13 +625,93 @@ double evocore_param_distance(
 ) {
     if (!params1 || !params2 || count == 0) return 0.0;
 
-    double sum_sq = 0.0;
-    for (size_t i = 0; i < count; i++) {
-        double diff = params1[i] - params2[i];
-        sum_sq += diff * diff;
+    /* Too short to fill a vector register */
+    if (count < 4) {
+        return sqrt(distance_sq_scalar(params1, params2, count));
+    }
+
+    distance_sq_fn fn = g_distance_sq;
+    if (!fn) {
+        fn = resolve_distance_sq();
+        g_distance_sq = fn;
     }
 
-    return sqrt(sum_sq);
+    return sqrt(fn(params1, params2, count));
+}
+
+/*
+ * Fixed-length distances for common parameter counts. Fully unrolled,
+ * with no loop or trip-count branch.
+ */
+#ifdef EVOCORE_DISTANCE_SIMD
+__attribute__((target("avx2,fma")))
+static inline double hsum256_pd(__m256d v) {
+    __m128d sum2 = _mm_add_pd(_mm256_castpd256_pd128(v), _mm256_extractf128_pd(v, 1));
+    return _mm_cvtsd_f64(_mm_add_sd(sum2, _mm_unpackhi_pd(sum2, sum2)));
+}
+
+__attribute__((target("avx2,fma")))
+static double distance_sq_avx2_4(const double *a, const double *b) {
+    __m256d d0 = _mm256_sub_pd(_mm256_loadu_pd(a), _mm256_loadu_pd(b));
+    return hsum256_pd(_mm256_mul_pd(d0, d0));
+}
+
+__attribute__((target("avx2,fma")))
+static double distance_sq_avx2_8(const double *a, const double *b) {
+    __m256d d0 = _mm256_sub_pd(_mm256_loadu_pd(a), _mm256_loadu_pd(b));
+    __m256d d1 = _mm256_sub_pd(_mm256_loadu_pd(a + 4), _mm256_loadu_pd(b + 4));
+    return hsum256_pd(_mm256_fmadd_pd(d1, d1, _mm256_mul_pd(d0, d0)));
+}
+
+__attribute__((target("avx2,fma")))
+static double distance_sq_avx2_16(const double *a, const double *b) {
+    __m256d d0 = _mm256_sub_pd(_mm256_loadu_pd(a), _mm256_loadu_pd(b));
+    __m256d d1 = _mm256_sub_pd(_mm256_loadu_pd(a + 4), _mm256_loadu_pd(b + 4));
+    __m256d d2 = _mm256_sub_pd(_mm256_loadu_pd(a + 8), _mm256_loadu_pd(b + 8));
+    __m256d d3 = _mm256_sub_pd(_mm256_loadu_pd(a + 12), _mm256_loadu_pd(b + 12));
+    __m256d acc0 = _mm256_fmadd_pd(d2, d2, _mm256_mul_pd(d0, d0));
+    __m256d acc1 = _mm256_fmadd_pd(d3, d3, _mm256_mul_pd(d1, d1));
+    return hsum256_pd(_mm256_add_pd(acc0, acc1));
+}
+#endif
+
+/* -1 until probed, then 0 or 1 */
+static int g_fixed_avx2 = -1;
+
+static inline int fixed_avx2_available(void) {
+    int avail = g_fixed_avx2;
+    if (avail < 0) {
+#ifdef EVOCORE_DISTANCE_SIMD
+        __builtin_cpu_init();
+        avail = __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma");
+#else
+        avail = 0;
+#endif
+        g_fixed_avx2 = avail;
+    }
+    return avail;
+}
+
+#ifdef EVOCORE_DISTANCE_SIMD
+#define FIXED_DISTANCE_SQ(n, a, b) \
+    (fixed_avx2_available() ? distance_sq_avx2_##n(a, b) : distance_sq_scalar(a, b, n))
+#else
+#define FIXED_DISTANCE_SQ(n, a, b) distance_sq_scalar(a, b, n)
+#endif
+
+double evocore_param_distance_4(const double *params1, const double *params2) {
+    if (!params1 || !params2) return 0.0;
+    return sqrt(FIXED_DISTANCE_SQ(4, params1, params2));
+}
+
+double evocore_param_distance_8(const double *params1, const double *params2) {
+    if (!params1 || !params2) return 0.0;
+    return sqrt(FIXED_DISTANCE_SQ(8, params1, params2));
+}
+
+double evocore_param_distance_16(const double *params1, const double *params2) {
+    if (!params1 || !params2) return 0.0;
+    return sqrt(FIXED_DISTANCE_SQ(16, params1, params2));
 }
 
 double evocore_param_similarity(
@@ -507,30 +732,47 @@ double evocore_param_similarity(
  * Transfer Learning
  *========================================================================*/
 
-bool evocore_transfer_params(
+bool evocore_transfer_params_idx(
     const double *source_params,
-    const char *source_context,
-    const char *target_context,
+    size_t source_index,
+    size_t target_index,
     const evocore_similarity_matrix_t *similarity_matrix,
     size_t param_count,
     double *out_params,
     double adjustment_factor
 ) {
-    (void)source_context;
-    (void)target_context;
-    (void)similarity_matrix;
-
     if (!source_params || !out_params) return false;
     if (param_count == 0) return false;
 
-    /* Simple copy with adjustment */
+    /* Unknown contexts count as dissimilar (similarity 0) */
+    double similarity = evocore_similarity_get_idx(similarity_matrix,
+                                                   source_index, target_index);
+    double scale = 1.0 - adjustment_factor * (1.0 - similarity);
+
+    /* Single streaming pass: one read and one write per parameter */
     for (size_t i = 0; i < param_count; i++) {
-        out_params[i] = source_params[i] * (1.0 - adjustment_factor);
+        out_params[i] = source_params[i] * scale;
     }
 
     return true;
 }
 
+bool evocore_transfer_params(
+    const double *source_params,
+    const char *source_context,
+    const char *target_context,
+    const evocore_similarity_matrix_t *similarity_matrix,
+    size_t param_count,
+    double *out_params,
+    double adjustment_factor
+) {
+    return evocore_transfer_params_idx(source_params,
+                                       similarity_index(similarity_matrix, source_context),
+                                       similarity_index(similarity_matrix, target_context),
+                                       similarity_matrix, param_count,
+                                       out_params, adjustment_factor);
+}
+
 size_t evocore_find_transferable_contexts(
     const char *target_context,
     const evocore_similarity_matrix_t *similarity_matrix,